@@ -0,0 +1,66 @@
+"""
+Measure the throughput of factorisation and arithmetic as the number
+of threads grows.
+
+    python -m benchmarks.thread_scaling [--count N] [--threads 1,2,4,8]
+
+from the root of the repository.
+
+Throughput only increases with the number of threads on a free-threaded
+build of Python (e.g. python3.13t). With the GIL the threads take turns
+and the throughput stays roughly flat.
+
+"""
+import argparse
+import operator
+import random
+import sys
+import time
+
+from transfinite import w
+from transfinite.enumeration import BoundedOrdinals
+from transfinite.parallel import arithmetic_many, factors_many
+
+
+def sample_ordinals(count, seed=0):
+    ordinals = BoundedOrdinals(w**(w**2 + 1), 4)
+    rng = random.Random(seed)
+    return [ordinals[rng.randrange(1, len(ordinals))] for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    tasks = [
+        ("factors", lambda ordinals, threads: factors_many(
+            [a for a in ordinals if not isinstance(a, int)], threads, chunksize=500
+        )),
+        ("mul", lambda ordinals, threads: arithmetic_many(
+            operator.mul, zip(ordinals, reversed(ordinals)), threads, chunksize=500
+        )),
+        ("pow", lambda ordinals, threads: arithmetic_many(
+            operator.pow, [(a, 3) for a in ordinals], threads, chunksize=500
+        )),
+    ]
+
+    for name, task in tasks:
+        for threads in map(int, args.threads.split(",")):
+            # Fresh ordinals for every run, so that hashes and keys
+            # cached by earlier runs do not favour later ones
+            ordinals = sample_ordinals(args.count)
+            start = time.perf_counter()
+            # Count the results rather than the samples, since factors
+            # skips the finite ones
+            processed = len(task(ordinals, threads))
+            elapsed = time.perf_counter() - start
+            print(f"{name:8} threads={threads:<3} {processed / elapsed:12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,12 @@ setup(
     classifiers=[
         "Topic :: Software Development :: Libraries :: Python Modules",
         "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
     ],
     keywords="set-theory ordinals arithmetic factorization LaTeX",
-    python_requires=">=3.6.0",
+    python_requires=">=3.7.0",
     project_urls={
         "Source": "https://github.com/ajcr/transfinite/",
         "Tracker": "https://github.com/ajcr/transfinite/issues",
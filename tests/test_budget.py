@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+from transfinite import factors, w
+from transfinite.budget import (
+    BudgetExceeded,
+    Size,
+    budget,
+    predict_add,
+    predict_factors,
+    predict_mul,
+    predict_pow,
+    size,
+)
+
+ORDINALS = [
+    0, 1, 2, 7, w, w + 1, w*2 + 3, w**2 + w + 1, w**w, w**w*3 + 2, w**(w + 1)*2 + w, w**w**w + w**5*4,
+]
+
+
+def within(actual, predicted):
+    return all(x <= y for x, y in zip(actual, predicted))
+
+
+@pytest.mark.parametrize(
+    "a,expected",
+    [
+        (0, Size(0, 0, 0)),
+        (5, Size(1, 0, 3)),
+        (w, Size(1, 1, 1)),
+        (w**w*3 + 9, Size(2, 2, 4)),
+        (w**(w**2*2 + 1) + w*17, Size(2, 2, 5)),
+    ],
+)
+def test_size(a, expected):
+    assert size(a) == expected
+
+
+@pytest.mark.parametrize("a,b", list(itertools.product(ORDINALS, repeat=2)))
+def test_predictions_are_upper_bounds(a, b):
+    assert within(size(a + b), predict_add(a, b))
+    assert within(size(a * b), predict_mul(a, b))
+
+
+@pytest.mark.parametrize("a,b", list(itertools.product(ORDINALS[:-2], ORDINALS[:-1])))
+def test_predict_pow(a, b):
+    assert within(size(a**b), predict_pow(a, b))
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [(w, 1000), (w*2 + 1, 50), (w**w*3 + w + 5, 20), (w**(w + 2)*7, 2**30), (w*2 + 1, w + 40), (w**2 + w*9, w**2*3)],
+)
+def test_predict_pow_bits_are_close(a, b):
+    # The bits of a power grow with the bit length of a finite exponent,
+    # not with the exponent itself
+    actual, predicted = size(a**b), predict_pow(a, b)
+    assert actual.bits <= predicted.bits <= actual.bits + 2 * size(a).bits + 2
+
+
+@pytest.mark.parametrize("a", ORDINALS[4:])
+def test_predict_factors(a):
+    fs = factors(a)
+    assert len(fs) <= predict_factors(a).terms
+
+
+def test_budget_rejects_large_results():
+    with budget(max_terms=5):
+        assert (w + 1)**2 == w**2 + w + 1
+        with pytest.raises(BudgetExceeded):
+            _ = (w + 1)**10
+
+    with budget(max_bits=64):
+        with pytest.raises(BudgetExceeded):
+            _ = 2**(w + 100)
+        with pytest.raises(BudgetExceeded):
+            _ = w * 2**40 * 2**40
+
+    with budget(max_terms=3):
+        with pytest.raises(BudgetExceeded):
+            factors(w**3 + w**2 + w + 1)
+
+    with budget(max_bits=64):
+        assert size(w**1000).bits == 10
+        assert size((w*2 + 1)**50).bits == 6
+
+    # No budget outside the block
+    assert size((w + 1)**10).terms == 11
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from transfinite import w
+from transfinite.containers import OrdinalSortedDict, OrdinalSortedSet
+from transfinite.enumeration import BoundedOrdinals
+
+ORDINALS = list(BoundedOrdinals(w**(w + 1) + 1, 2))
+
+
+@pytest.fixture(name="shuffled")
+def shuffled_fixture():
+    ordinals = ORDINALS[:]
+    random.Random(0).shuffle(ordinals)
+    return ordinals
+
+
+@pytest.mark.parametrize("load", [2, 5, 500])
+def test_bulk_load(shuffled, load):
+    s = OrdinalSortedSet(shuffled + shuffled[:10], load=load)
+    assert list(s) == ORDINALS
+    assert list(reversed(s)) == ORDINALS[::-1]
+    assert len(s) == len(ORDINALS)
+
+
+@pytest.mark.parametrize("load", [2, 5, 500])
+def test_add_and_discard(shuffled, load):
+    s = OrdinalSortedSet(load=load)
+    for a in shuffled:
+        s.add(a)
+        s.add(a)
+    assert list(s) == ORDINALS
+
+    removed = shuffled[::3]
+    for a in removed:
+        s.discard(a)
+    s.discard(w**w**w)
+
+    expected = [a for a in ORDINALS if a not in set(removed)]
+    assert list(s) == expected
+    assert len(s) == len(expected)
+    assert all(a in s for a in expected)
+    assert not any(a in s for a in removed)
+
+
+@pytest.mark.parametrize("load", [2, 500])
+def test_rank_and_indexing(shuffled, load):
+    s = OrdinalSortedSet(shuffled[::2], load=load)
+    expected = list(s)
+    for a in ORDINALS + [w**w**w]:
+        rank = s.rank(a)
+        assert rank == sum(1 for b in expected if b < a)
+    assert [s[i] for i in range(len(s))] == expected
+    assert s[-1] == expected[-1]
+    with pytest.raises(IndexError):
+        _ = s[len(s)]
+
+
+@pytest.mark.parametrize("load", [2, 500])
+def test_irange(shuffled, load):
+    s = OrdinalSortedSet(shuffled, load=load)
+    assert list(s.irange(w**2, w**w)) == [a for a in ORDINALS if w**2 <= a < w**w]
+    assert list(s.irange(maximum=w)) == [0, 1, 2]
+    assert list(s.irange(w**(w + 1))) == [w**(w + 1)]
+    assert list(s.irange(w**w, w**2)) == []
+
+
+def test_successor_and_predecessor(shuffled):
+    s = OrdinalSortedSet(shuffled, load=3)
+    assert s.successor(w*2 + 2) == w**2
+    assert s.successor(w*2 + 5) == w**2
+    assert s.predecessor(w**2) == w*2 + 2
+    assert s.predecessor(0) is None
+    assert s.successor(w**(w + 1)) is None
+
+
+def test_sorted_dict(shuffled):
+    d = OrdinalSortedDict([(a, i) for i, a in enumerate(shuffled)], load=4)
+    assert list(d) == ORDINALS
+    d[w**w**w] = "big"
+    d[0] = "zero"
+    del d[w]
+    assert list(d)[-1] == w**w**w
+    assert d[0] == "zero"
+    assert w not in d
+    assert d.rank(w + 1) == 3
+    assert d.key_at(3) == w + 1
+    assert d.successor(2) == w + 1
+    assert list(d.irange(w, w*2)) == [w + 1, w + 2]
+
+
+def test_lock_held_across_calls(shuffled):
+    s = OrdinalSortedSet(shuffled)
+    d = OrdinalSortedDict([(a, i) for i, a in enumerate(shuffled)])
+    with s.lock, d.lock:
+        s.add(w**w**w)
+        d[w**w**w] = "big"
+        assert s[-1] == w**w**w
+        assert d.key_at(len(d) - 1) == w**w**w
@@ -0,0 +1,35 @@
+import pytest
+
+from transfinite import w
+from transfinite.encoding import from_bytes, iter_from_bytes, to_bytes
+from transfinite.enumeration import BoundedOrdinals
+from transfinite.ordinal import Ordinal
+
+
+@pytest.mark.parametrize(
+    "a,expected",
+    [
+        (0, b"\x00\x00"),
+        (5, b"\x00\x05"),
+        (300, b"\x00\xac\x02"),
+        (w, b"\x01\x00\x01\x01\x00"),
+        (w**w + 1, b"\x01\x01\x00\x01\x01\x00\x01\x01"),
+    ],
+)
+def test_to_bytes(a, expected):
+    assert to_bytes(a) == expected
+    assert from_bytes(expected) == [a]
+
+
+def test_roundtrip():
+    ordinals = list(BoundedOrdinals(w**(w + 1) + 1, 2))[::7] + [2**100, w * 2**200 + 3**90]
+    data = to_bytes(*ordinals)
+    assert from_bytes(data) == ordinals
+    assert list(iter_from_bytes(bytearray(data))) == ordinals
+
+
+def test_unchecked_ordinal():
+    a = Ordinal.unchecked(Ordinal.unchecked(2), 3, 4)
+    assert a == w**(w**2)*3 + 4
+    assert hash(a) == hash(w**(w**2)*3 + 4)
+    assert str(a) == "w**w**2*3 + 4"
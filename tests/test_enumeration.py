@@ -0,0 +1,61 @@
+from itertools import product
+
+import pytest
+
+from transfinite import w
+from transfinite.enumeration import BoundedOrdinals
+
+
+def test_small_enumeration():
+    assert list(BoundedOrdinals(w**2 + 5, 2)) == [
+        0, 1, 2, w, w + 1, w + 2, w*2, w*2 + 1, w*2 + 2, w**2, w**2 + 1, w**2 + 2
+    ]
+
+
+@pytest.mark.parametrize("bound,k,expected", [(0, 2, 0), (1, 2, 1), (5, 2, 3), (w, 2, 3), (w**w, 2, 27), (w**w**2, 1, 16)])
+def test_count(bound, k, expected):
+    assert BoundedOrdinals(bound, k).count() == expected
+
+
+def test_matches_brute_force():
+    # Every polynomial below w**3 with coefficients at most 2
+    expected = sorted(
+        w**2*a + w*b + c if a or b else c
+        for a, b, c in product(range(3), repeat=3)
+    )
+    ordinals = BoundedOrdinals(w**3, 2)
+    assert list(ordinals) == expected
+    assert ordinals.count() == len(expected)
+    assert [ordinals[i] for i in range(len(expected))] == expected
+
+
+@pytest.mark.parametrize("bound,k", [(w**w*2 + w, 2), (w**(w + 1), 1), (w**w**2, 1)])
+def test_enumeration_is_increasing(bound, k):
+    ordinals = list(BoundedOrdinals(bound, k))
+    assert all(a < b for a, b in zip(ordinals, ordinals[1:]))
+    assert all(a < bound for a in ordinals)
+    assert len(ordinals) == BoundedOrdinals(bound, k).count()
+
+
+def test_seek():
+    ordinals = BoundedOrdinals(w**w, 2)
+    everything = list(ordinals)
+    assert list(ordinals.seek(w**2 + w*2)) == everything[everything.index(w**2 + w*2):]
+    # w**2 + w*3 is not enumerated, so resume from the next ordinal
+    assert next(ordinals.seek(w**2 + w*3)) == w**2*2
+
+
+def test_contains():
+    ordinals = BoundedOrdinals(w**w, 2)
+    assert w**2*2 + 1 in ordinals
+    assert w*3 not in ordinals
+    assert w**3 not in ordinals
+
+
+@pytest.mark.parametrize("n", [1, 3, 4, 100])
+def test_partition(n):
+    ordinals = BoundedOrdinals(w**w, 2)
+    chunks = ordinals.partition(n)
+    assert len(chunks) == n
+    assert [a for chunk in chunks for a in chunk] == list(ordinals)
+    assert sum(chunk.count() for chunk in chunks) == ordinals.count()
@@ -1,11 +1,15 @@
+import random
 from itertools import groupby
 
 import pytest
 
 from transfinite import w
+from transfinite.ordinal_factors import OrdinalFactors
 from transfinite.util import is_finite_ordinal, multiply_factors
 from transfinite.factorisation import (
+    FactorTracker,
     factors,
+    factors_of_product,
     subtract,
     factorise_term,
     factorise_term_successor,
@@ -141,3 +145,100 @@ def test_factors(a):
     assert (groups[0][0] is False), "Limit ordinals do not occur before successor ordinals"
     assert groups[0][1] == sorted(groups[0][1], reverse=True), "Successor ordinals not in descending order"
     assert not has_equal_consecutive_elements(groups[0][1]), "Limit factors contain equal consecutive ordinals"
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        (w, w),
+        (w + 1, w + 1),
+        (w + 2, w + 3),
+        (w*2, w + 1),
+        (w + 1, w*2),
+        (w + 1, w),
+        (w**2 + w*3 + 1, w**2*4 + 5),
+        (w**3 + w**2, w**w*3 + w + 2),
+        (w**w*3 + w + 2, w**3 + w**2),
+        (w**(w + 1) + w**w*2 + w**5 + 3, (w + 1)**3),
+        ((w + 1)**3, w**(w + 1) + w**w*2 + w**5 + 3),
+        (w**w**w + 7, w**(w*2) + 1),
+        (w**(w**2 + w + 3)*2 + w**3, w**2*3 + w*2),
+        (w**2*3 + w*2, w**(w**2 + w + 3)*2 + w**3),
+    ],
+)
+def test_factors_of_product(a, b):
+    fs = factors_of_product(factors(a), factors(b))
+    assert list(fs) == list(factors(a * b))
+    assert list(factors(a) * factors(b)) == list(fs)
+
+
+def test_factors_of_product_with_large_multiplicity():
+    # (w**(w*2 + 3) + 1)**n * 2 * w**w == w**(w*(2*n + 1)), computed
+    # without a step per unit of n
+    n = 10**15
+    fs = OrdinalFactors([(w**(w*2 + 3) + 1, n), (2, 1)]) * factors(w**w)
+    assert list(fs) == list(factors(w**(w*(2*n + 1))))
+
+
+def test_factors_of_repeated_products():
+    ordinals = [w + 2, w**2 + 1, w*3, w**w + w + 1, w + 1]
+    product, fs = 1, None
+    for a in ordinals:
+        product *= a
+        fs = factors(a) if fs is None else fs * factors(a)
+        assert list(fs) == list(factors(product))
+
+
+@pytest.mark.parametrize(
+    "start,terms",
+    [
+        (w, [1, 1, 5]),
+        (w**w, [w**3, w**2, w, 1, 2]),
+        (w**3*2, [w**3, w**2*4 + 1, w**2, w**w]),
+        (w**(w + 1) + w**w, [w**5 + 3, w**5*2, w + 1, w**w*3 + w**2]),
+        (w**w**w + w**w, [w**(w*2) + w, w**(w + 3), w**2 + w + 1, 4, w*2]),
+        (w**2 + w + 1, [w**2 + w*3 + 7, w**3 + w**2, w**3 + w**2]),
+    ],
+)
+def test_factor_tracker(start, terms):
+    tracker = FactorTracker(start)
+    x = start
+    assert list(tracker.factors()) == list(factors(x))
+    for t in terms:
+        tracker += t
+        x += t
+        assert tracker.ordinal == x
+        assert list(tracker.factors()) == list(factors(x))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_factor_tracker_changed_factors(seed):
+    rng = random.Random(seed)
+    tracker = FactorTracker(w**10)
+    previous = list(tracker.factors())
+    assert tracker.changed_factors() == previous
+    for _ in range(200):
+        tracker += w**rng.randrange(10) * rng.randrange(1, 4) + rng.randrange(3)
+        changed = tracker.changed_factors()
+        unchanged = len(tracker.factors()) - len(changed)
+        assert changed + previous[len(previous) - unchanged:] == list(tracker.factors())
+        previous = list(tracker.factors())
+
+
+def test_factor_tracker_many_terms():
+    tracker = FactorTracker(w**1000)
+    for k in range(999, 0, -1):
+        tracker.add(w**k)
+        assert len(tracker.changed_factors()) == 2
+    assert list(tracker.factors()) == [(w, 1), (w + 1, 999)]
+    tracker.add(w**500 + 1)
+    assert list(tracker.factors()) == list(factors(tracker.ordinal))
+
+
+def test_factor_tracker_finite():
+    tracker = FactorTracker(3)
+    with pytest.raises(ValueError):
+        tracker.factors()
+    tracker += w
+    assert tracker.ordinal == w
+    assert list(tracker.factors()) == [(w, 1)]
@@ -0,0 +1,57 @@
+from itertools import islice
+
+import pytest
+
+from transfinite import w
+from transfinite.goodstein import (
+    decrement,
+    evaluate,
+    goodstein,
+    goodstein_from,
+    goodstein_values,
+    hereditary,
+)
+
+
+@pytest.mark.parametrize(
+    "n,base,expected",
+    [
+        (0, 2, 0),
+        (1, 2, 1),
+        (3, 2, w + 1),
+        (4, 2, w**w),
+        (35, 2, w**(w**w + 1) + w + 1),
+        (100, 3, w**(w + 1) + w**2*2 + 1),
+        (100, 10, w**2),
+    ],
+)
+def test_hereditary(n, base, expected):
+    assert hereditary(n, base) == expected
+    assert evaluate(expected, base) == n
+
+
+@pytest.mark.parametrize("n", range(1, 100, 7))
+@pytest.mark.parametrize("base", [2, 3, 5])
+def test_decrement(n, base):
+    assert decrement(hereditary(n, base), base) == hereditary(n - 1, base)
+
+
+def test_goodstein_of_3():
+    assert list(goodstein(3)) == [(2, w + 1), (3, w), (4, 3), (5, 2), (6, 1), (7, 0)]
+    assert list(goodstein_values(3)) == [3, 3, 3, 2, 1, 0]
+
+
+def test_goodstein_of_4():
+    assert list(islice(goodstein_values(4), 8)) == [4, 26, 41, 60, 83, 109, 139, 173]
+
+
+def test_goodstein_resumes_from_checkpoint():
+    sequence = list(islice(goodstein(5), 20))
+    base, ordinal = sequence[10]
+    assert list(islice(goodstein_from(ordinal, base), 10)) == sequence[10:]
+
+
+@pytest.mark.parametrize("n", [4, 5, 6])
+def test_goodstein_ordinals_decrease(n):
+    ordinals = [ordinal for _, ordinal in islice(goodstein(n), 50)]
+    assert all(a > b for a, b in zip(ordinals, ordinals[1:]))
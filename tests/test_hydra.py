@@ -0,0 +1,62 @@
+from itertools import islice
+
+import pytest
+
+from transfinite import w
+from transfinite.hydra import (
+    Hydra,
+    HydraNode,
+    battle_length,
+    battle_lengths,
+    leftmost_head,
+    rightmost_head,
+)
+
+
+@pytest.mark.parametrize("a", [0, 1, 5, w, w + 3, w*2 + 1, w**2*3 + w, w**w + w**2, w**(w + 1)])
+def test_hydra_from_ordinal(a):
+    assert Hydra.from_ordinal(a).ordinal == a
+
+
+def test_hydra_ordinal_of_tree():
+    # A root with a leaf, and a child with three leaves: w**3 + 1
+    root = HydraNode([HydraNode(), HydraNode([HydraNode(), HydraNode(), HydraNode()])])
+    assert Hydra(root).ordinal == w**3 + 1
+
+
+def test_chop_regrows_copies():
+    hydra = Hydra.from_ordinal(w**2)
+    hydra.chop(rightmost_head(hydra), 3)
+    assert hydra.ordinal == w*4
+    assert len(hydra.root.children) == 4
+
+
+def test_chop_root_raises():
+    hydra = Hydra.from_ordinal(w)
+    with pytest.raises(ValueError):
+        hydra.chop(hydra.root, 1)
+
+
+@pytest.mark.parametrize("strategy", [rightmost_head, leftmost_head])
+@pytest.mark.parametrize("a", [w + 2, w**2 + w, w**w, w**(w + 1)])
+def test_battle_ordinals_decrease(a, strategy):
+    ordinals = [a] + list(islice(Hydra.from_ordinal(a).battle(strategy), 100))
+    assert all(x > y for x, y in zip(ordinals, ordinals[1:]))
+
+
+@pytest.mark.parametrize(
+    "a,expected", [(0, 0), (3, 3), (w, 3), (w + 2, 7), (w*2, 9), (w**2, 13), (w**w, 37)]
+)
+def test_battle_length(a, expected):
+    assert battle_length(a, rightmost_head) == expected
+
+
+def test_battle_length_exceeding_max_steps():
+    assert battle_length(w**2, rightmost_head, max_steps=5) is None
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_battle_lengths(processes):
+    ordinals = [3, w, w + 2, w*2]
+    expected = [battle_length(a, leftmost_head, 100) for a in ordinals]
+    assert battle_lengths(ordinals, leftmost_head, 100, processes=processes) == expected
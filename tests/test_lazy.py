@@ -0,0 +1,77 @@
+import itertools
+import operator
+
+import pytest
+
+from transfinite import factors, w
+from transfinite.lazy import Expr, lazy
+
+VALUES = [0, 1, 2, 3, w, w + 1, w*2, w**2, w**2 + 1, w**3*2, w**w]
+OPERATORS = [operator.add, operator.mul, operator.pow]
+
+
+def test_identical_expressions_are_shared():
+    a, b = lazy(w + 1), lazy(w**2 + 3)
+    x = (a*b + 5)**3 * (w**lazy(w) + 1)
+    y = (a*b + 5)**3 * (w**lazy(w) + 1)
+    assert x is y
+    assert x.args[0].args[0] is (a*b + 5)
+    assert x.value() == ((w + 1)*(w**2 + 3) + 5)**3 * (w**w + 1)
+
+
+def test_values_are_memoized():
+    a = lazy(w + 1)
+    x = a * w + a
+    assert not (a * w).is_evaluated()
+    x.value()
+    assert (a * w).is_evaluated()
+    assert (a * w).value() == w**2
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        (3 + lazy(w), "lazy(w)"),
+        (lazy(w) + 0, "lazy(w)"),
+        (lazy(w + 1) * 1, "lazy(w + 1)"),
+        (lazy(w + 1) * 0, "lazy(0)"),
+        (lazy(w + 1)**1, "lazy(w + 1)"),
+        (lazy(w + 1)**0, "lazy(1)"),
+        (1**lazy(w), "lazy(1)"),
+        ((lazy(w + 1)**2)**3, "Expr((w + 1)**6)"),
+        (lazy(w + 1) * lazy(w + 1), "Expr((w + 1)**2)"),
+        (lazy(w**2)**lazy(w), "Expr(w**(2*w))"),
+        (lazy(w**2) * w, "Expr(w**3)"),
+        (2**lazy(w) * 2**lazy(3), "Expr(2**(w+3))"),
+        (lazy(w) + 2 + w, "Expr((w+2)+w)"),
+    ],
+)
+def test_simplifications(expr, expected):
+    assert repr(expr) == expected
+
+
+@pytest.mark.parametrize("ops", list(itertools.product(OPERATORS, repeat=2)))
+def test_values_agree_with_eager_arithmetic(ops):
+    f, g = ops
+    for x, y, z in itertools.product(VALUES[:8], repeat=3):
+        if g is operator.pow and isinstance(x, int) and isinstance(y, int) and x > 1 and y > 1:
+            continue
+        assert f(g(lazy(x), y), z).value() == f(g(x, y), z)
+        assert f(lazy(x), g(y, lazy(z))).value() == f(x, g(y, z))
+
+
+def test_compare_hash_and_factors():
+    x = lazy(w + 1)**3
+    assert x > w**2
+    assert x == (w + 1)**3
+    assert x != lazy(w)
+    assert hash(x) == hash((w + 1)**3)
+    assert list(x.factors()) == list(factors((w + 1)**3))
+    assert isinstance(x, Expr)
+
+
+def test_deep_expression():
+    x = lazy(w)
+    for i in range(5000):
+        x = x + lazy(w**2 + i) * 2
+    assert x.value() == w**2 * 10000 + 4999
@@ -0,0 +1,105 @@
+import pytest
+
+from transfinite import w
+from transfinite.logarithm import from_base, log, log_divmod, to_base
+
+
+@pytest.mark.parametrize(
+    "a,expected",
+    [
+        (1, 0),
+        (17, 0),
+        (w, 1),
+        (w*3 + 7, 1),
+        (w**5 + w, 5),
+        (w**w*3 + 1, w),
+        (w**(w**2 + 4)*2 + w**w, w**2 + 4),
+    ],
+)
+def test_log_base_w(a, expected):
+    assert log(a) == expected
+
+
+@pytest.mark.parametrize(
+    "a,base,expected",
+    [
+        # 2**3 <= 9 < 2**4
+        (9, 2, (3, 1, 1)),
+        (7, w, (0, 7, 0)),
+        # 2**w == w
+        (w, 2, (w, 1, 0)),
+        # 2**(w + 2) == w*4
+        (w*5 + 1, 2, (w + 2, 1, w + 1)),
+        # 10**(w*2) == w**2
+        (w**2*2 + w*7 + 3, 10, (w*2, 2, w*7 + 3)),
+        # (w + 1)**2 == w**2 + w + 1
+        (w**2*2, w + 1, (2, 1, w**2)),
+        (w**2 + w*3, w + 1, (2, 1, w*2)),
+        # (w*2)**2 == w**2*2
+        (w**2 + w, w*2, (1, w, w)),
+        # (w**2)**w == w**w
+        (w**w*3 + w**2, w**2, (w, 3, w**2)),
+        # (w**w)**(w + 1) == w**(w**2 + w)
+        (w**(w**2 + w + 1), w**w, (w + 1, w, 0)),
+    ],
+)
+def test_log_divmod(a, base, expected):
+    q, r, s = log_divmod(a, base)
+    assert (q, r, s) == expected
+    assert base**q * r + s == a
+    assert 0 < r < base
+    assert s < base**q
+    assert base**(q + 1) > a
+
+
+@pytest.mark.parametrize("a,base", [(0, 2), (0, w), (w, 0), (w, 1), (5, 1)])
+def test_log_divmod_invalid_arguments(a, base):
+    with pytest.raises(ValueError):
+        log_divmod(a, base)
+
+
+@pytest.mark.parametrize(
+    "a,base,expected",
+    [
+        (0, 2, []),
+        (13, 2, [(3, 1), (2, 1), (0, 1)]),
+        (w*5 + 1, 2, [(w + 2, 1), (w, 1), (0, 1)]),
+        (w**2*2 + w*7 + 3, 10, [(w*2, 2), (w, 7), (0, 3)]),
+        (w**w*3 + w**5 + 4, w, [(w, 3), (5, 1), (0, 4)]),
+        (w**w*3 + w**5*2 + w**4 + 1, w**2, [(w, 3), (2, w*2 + 1), (0, 1)]),
+        (w**(w**2 + w + 1)*2 + w**(w + 3), w**w, [(w + 1, w*2), (1, w**3)]),
+        (w**2*2 + w*3 + 1, w + 1, [(2, 2), (1, 2)]),
+        (w**3 + w**2*2 + 5, w**2 + w, [(1, w + 1), (0, w**2 + 5)]),
+    ],
+)
+def test_to_base(a, base, expected):
+    terms = to_base(a, base)
+    assert terms == expected
+    assert from_base(terms, base) == a
+
+
+@pytest.mark.parametrize("base", [2, 7, w, w*3, w**2, w**w, w**(w*2 + 1), w + 5, w**w + w])
+def test_to_base_matches_log_divmod(base):
+    for a in [1, 100, w**w**2*5 + w**(w + 3)*2 + w**w + w**7*9 + w*12 + 6, w**(w*5 + 4)*3 + w**w]:
+        terms, rest = [], a
+        while rest != 0:
+            q, r, rest = log_divmod(rest, base)
+            terms.append((q, r))
+        assert to_base(a, base) == terms
+        assert from_base(terms, base) == a
+
+
+@pytest.mark.parametrize(
+    "terms,base",
+    [
+        ([(1, 1), (2, 1)], w),
+        ([(1, 1), (1, 1)], 3),
+        ([(1, 3)], 3),
+        ([(1, w)], w),
+        ([(1, 0)], w),
+        ([(1, 1)], 1),
+    ],
+)
+def test_from_base_invalid_terms(terms, base):
+    with pytest.raises(ValueError):
+        from_base(terms, base)
@@ -0,0 +1,51 @@
+from itertools import permutations
+
+import pytest
+
+from transfinite import w
+from transfinite.natural import natural_sum, natural_product
+
+
+@pytest.mark.parametrize(
+    "ordinals,expected",
+    [
+        ((), 0),
+        ((3, 4), 7),
+        ((w, 3), w + 3),
+        ((3, w), w + 3),
+        ((w + 1, w**2 + w*3), w**2 + w*4 + 1),
+        ((w**w, w**3 + 2, w**w*2 + w), w**w*3 + w**3 + w + 2),
+        ((w**(w + 1), w**w*5, w**(w + 1)*2 + 1), w**(w + 1)*3 + w**w*5 + 1),
+    ],
+)
+def test_natural_sum(ordinals, expected):
+    assert natural_sum(*ordinals) == expected
+    assert all(natural_sum(*p) == expected for p in permutations(ordinals))
+
+
+@pytest.mark.parametrize(
+    "ordinals,expected",
+    [
+        ((), 1),
+        ((3, 4), 12),
+        ((w, 0), 0),
+        ((w, 3), w*3),
+        ((3, w), w*3),
+        ((w + 1, w + 1), w**2 + w*2 + 1),
+        ((w**w + 1, w + 2), w**(w + 1) + w**w*2 + w + 2),
+        ((w**w, w**2), w**(w + 2)),
+        ((w**2, w**w), w**(w + 2)),
+        ((w + 1, w + 1, w + 1), w**3 + w**2*3 + w*3 + 1),
+    ],
+)
+def test_natural_product(ordinals, expected):
+    assert natural_product(*ordinals) == expected
+    assert all(natural_product(*p) == expected for p in permutations(ordinals))
+
+
+@pytest.mark.parametrize(
+    "a,b", [(w, w), (w + 1, w**2), (w**w*2 + 3, w**3 + w), (w**(w + 1), w**w*4 + 1)]
+)
+def test_natural_operations_bound_ordinary_operations(a, b):
+    assert natural_sum(a, b) >= a + b
+    assert natural_product(a, b) >= a * b
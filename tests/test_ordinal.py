@@ -1,10 +1,13 @@
 import copy
+import io
 import operator
 
 import pytest
 
+from transfinite import w
 from transfinite.ordinal import Ordinal, OrdinalConstructionError
-from transfinite.util import as_latex
+from transfinite.ordinal import cnf_terms, from_cnf_terms
+from transfinite.util import as_latex, display_options, iter_latex, iter_str, truncated_latex, write_ordinal
 
 
 @pytest.mark.parametrize(
@@ -167,6 +170,30 @@ def test_greater_than(a, b):
 def test_as_string(a, expected_str, expected_latex):
     assert str(a) == expected_str
     assert as_latex(a) == expected_latex
+    assert "".join(iter_str(a)) == expected_str
+    assert "".join(iter_latex(a)) == expected_latex
+
+
+def test_strings_are_cached_on_shared_exponents():
+    exponent = w**w + 1
+    a = w**exponent * 2 + w**exponent
+    b = w**(exponent + 1) + w**exponent
+    assert str(a) is str(a)
+    assert str(b) == "w**(w**w + 2) + w**(w**w + 1)"
+    assert str(exponent) == "w**w + 1"
+    assert as_latex(b) == r"\omega^{\omega^{\omega}+2}+\omega^{\omega^{\omega}+1}"
+
+
+def test_write_ordinal_with_many_terms():
+    a = from_cnf_terms([(w * i, 1) for i in range(2000, 0, -1)] + [(0, 7)])
+    f = io.StringIO()
+    write_ordinal(a, f)
+    assert f.getvalue() == str(a)
+    assert str(a).startswith("w**(w*2000) + w**(w*1999) + ")
+    assert str(a).endswith(" + w**w + 7")
+    f = io.StringIO()
+    write_ordinal(a, f, latex=True)
+    assert f.getvalue() == as_latex(a)
 
 
 @pytest.mark.parametrize(
@@ -336,6 +363,10 @@ def test_addition(a, b, expected):
                 )
             ),
         ),
+        # (w**2 + w) * w**w == w**w absorbs the infinite addend w, so it
+        # must not add a second w**w term
+        (w**2 + w, w**(w + 1) + w**w, w**(w + 1) + w**w),
+        (w**3 + w, w**(w + 2) + w**w*3, w**(w + 2) + w**w*3),
     ],
 )
 def test_multiplication(a, b, expected):
@@ -458,6 +489,38 @@ def test_power(a, b, expected):
     assert a ** b == expected
 
 
+@pytest.mark.parametrize("a", [w, w*3, w + 2, w**2*2 + w*3 + 4, w**w + w**2 + 1, w**(w + 1)*2 + w])
+@pytest.mark.parametrize("n", range(7))
+def test_finite_power_matches_repeated_multiplication(a, n):
+    expected = 1
+    for _ in range(n):
+        expected *= a
+    assert a ** n == expected
+    assert from_cnf_terms(cnf_terms(a ** n)) == a ** n
+
+
+@pytest.mark.parametrize("a", [2, 5, w, w + 2, w**2*2 + w*3 + 4, w**w*3 + 1])
+@pytest.mark.parametrize("b", [w*2 + 3, w**2 + w + 1, w**w + w**3*2 + 2, w**(w + 1) + w**w])
+def test_infinite_power_splits_exponent(a, b):
+    # a**(x + y) == a**x * a**y
+    for x, y in [(b, 0), (w, b), (b, w + 3), (w**2, b + 1)]:
+        assert a ** (x + y) == a ** x * a ** y
+
+
+def test_power_with_many_terms():
+    limit = from_cnf_terms([(i, 1) for i in range(3000, 0, -1)])
+    b = limit + 3
+    a = w**2 + w + 1
+
+    # a**b == w**(2*limit) * a**3 and 2*limit == limit
+    result = a ** b
+    assert result.exponent == limit + 6
+    assert result.size.terms == (a ** 3).size.terms
+    assert result == w**limit * a**3
+    assert str(2 ** b).startswith("w**(w**2999 + w**2998 + ")
+    assert (b + b).size.terms == 3001
+
+
 @pytest.mark.parametrize(
     "a,expected",
     [
@@ -571,3 +634,144 @@ def test_is_prime(a, expected):
 )
 def test_is_gamma(a, expected):
     assert a.is_gamma() is expected
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        (7, 3, 4),
+        (w, 3, w),
+        (w + 5, 3, w + 5),
+        (w + 5, w, 5),
+        (w*4 + 1, w*3 + 7, w + 1),
+        (w**2, w, w**2),
+        (w**3 + w**2*2, w**3 + w**2, w**2),
+        (w**w*3 + w, w**w*3 + w, 0),
+        (w**(w + 1) + w**5, w**w*2 + w, w**(w + 1) + w**5),
+    ],
+)
+def test_subtraction(a, b, expected):
+    assert a - b == expected
+    assert b + (a - b) == a
+
+
+@pytest.mark.parametrize("a,b", [(3, w), (w, w + 1), (w*2 + 1, w*3), (w**2 + w, w**2 + w*2)])
+def test_subtraction_larger_ordinal_raises(a, b):
+    with pytest.raises(ValueError):
+        _ = a - b
+
+
+@pytest.mark.parametrize(
+    "a,b,expected_quotient,expected_remainder",
+    [
+        (7, w, 0, 7),
+        (w, 3, w, 0),
+        (w*7 + 2, 3, w*7, 2),
+        (w, w, 1, 0),
+        (w + 3, w, 1, 3),
+        (w*5 + 3, w*2, 2, w + 3),
+        (w**2*5 + w*3 + 1, w*2 + 1, w*5 + 1, w + 1),
+        (w**2*4 + w*3 + 1, w**2*5, 0, w**2*4 + w*3 + 1),
+        (w**2*4 + w, w**2*2 + w*2, 1, w**2*2 + w),
+        (w**3 + w, w**2, w, w),
+        (w**w*3 + w**2 + 9, w + 1, w**w*3 + w, 9),
+        (w**(w + 1) + w**w*2 + w**5 + 3, w + 1, w**(w + 1) + w**w*2 + w**4, 3),
+        (w**w**w + 7, w**w + 1, w**w**w, 7),
+    ],
+)
+def test_divmod(a, b, expected_quotient, expected_remainder):
+    q, r = divmod(a, b)
+    assert (q, r) == (expected_quotient, expected_remainder)
+    assert (a // b, a % b) == (q, r)
+    assert b*q + r == a
+    assert r < b
+
+
+@pytest.mark.parametrize("a", [0, 5, w, w**w + 1])
+def test_divmod_by_zero_raises(a):
+    with pytest.raises(ZeroDivisionError):
+        divmod(a, 0)
+
+
+@pytest.mark.parametrize(
+    "a,n,expected",
+    [
+        (w, 0, 0),
+        (w, 5, 5),
+        (w*3, 5, w*2 + 5),
+        (w**2, 4, w*4),
+        (w**2 + w, 4, w**2 + 4),
+        (w**7*2, 3, w**7 + w**6*3),
+        (w**w, 3, w**3),
+        (w**w, 0, 1),
+        (w**(w + 1), 2, w**w*2),
+        (w**(w*2), 3, w**(w + 3)),
+        (w**w**w, 2, w**w**2),
+        (w**w**w*2 + w**(w + 1), 3, w**w**w*2 + w**w*3),
+    ],
+)
+def test_fundamental(a, n, expected):
+    assert a.fundamental(n) == expected
+
+
+@pytest.mark.parametrize("a", [w + 1, w**w + 3])
+def test_fundamental_of_successor_raises(a):
+    with pytest.raises(ValueError):
+        a.fundamental(2)
+
+
+@pytest.mark.parametrize(
+    "a,expected",
+    [(w + 1, w), (w + 7, w + 6), (w**2*3 + w + 1, w**2*3 + w)],
+)
+def test_predecessor(a, expected):
+    assert a.predecessor() == expected
+    assert expected + 1 == a
+
+
+@pytest.mark.parametrize("a", [w, w**w*2 + w**3])
+def test_predecessor_of_limit_raises(a):
+    with pytest.raises(ValueError):
+        a.predecessor()
+
+
+def test_truncated_latex():
+    a = from_cnf_terms([(i, 3) for i in range(1000, 0, -1)] + [(0, 10**60)])
+    assert a._repr_latex_() == f"${truncated_latex(a)}$"  # pylint: disable=protected-access
+    assert truncated_latex(a, max_terms=2) == r"\omega^{1000}\cdot3+\omega^{999}\cdot3+\ldots\text{ (999 more terms)}"
+    assert truncated_latex(a, max_terms=1000, max_digits=10).endswith(
+        r"\omega\cdot3+\ldots\text{ (1 more term)}"
+    )
+    assert truncated_latex(a, max_terms=1001, max_digits=10).endswith(
+        r"+\underbrace{\ldots}_{\approx 61\text{ digits}}"
+    )
+    assert truncated_latex(a, max_terms=1001, max_digits=100) == as_latex(a)
+
+
+def test_truncated_latex_counts_omitted_terms_up_to_a_limit(monkeypatch):
+    monkeypatch.setitem(display_options, "max_counted", 100)
+    a = from_cnf_terms([(i, 1) for i in range(1000, 0, -1)])
+    assert truncated_latex(a, max_terms=1).endswith(r"\ldots\text{ (100+ more terms)}")
+    assert a.addend.cached("size") is None
+    assert a.size.terms == 1000
+    assert truncated_latex(a, max_terms=1).endswith(r"\ldots\text{ (999 more terms)}")
+
+
+def test_truncated_latex_depth():
+    tower = w
+    for _ in range(10):
+        tower = w**tower + 1
+    assert truncated_latex(tower, max_depth=2) == r"\omega^{\omega^{\ldots}+1}+1"
+    assert truncated_latex(w**w + 1, max_depth=2) == r"\omega^{\omega}+1"
+
+
+def test_truncated_latex_is_bounded_for_wide_and_deep_ordinals():
+    a = from_cnf_terms([(i, 3) for i in range(30, 0, -1)])
+    for _ in range(5):
+        a = from_cnf_terms([(a + i, 3) for i in range(30, 0, -1)])
+    latex = truncated_latex(a, max_terms=20, max_depth=6)
+    assert latex.count(r"\omega") == 20
+    assert len(latex) < 1000
+    assert truncated_latex(w**(w + 1) + w, max_terms=1) == (
+        r"\omega^{\ldots\text{ (2 more terms)}}+\ldots\text{ (1 more term)}"
+    )
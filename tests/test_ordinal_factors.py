@@ -0,0 +1,72 @@
+import pytest
+
+from transfinite import w
+from transfinite.ordinal_factors import OrdinalFactors, OrdinalFactorsView
+
+
+@pytest.fixture(name="fs")
+def fs_fixture():
+    # (w + 1) * 2 * (w + 1)**3 * 2 * (w**2 + 1) * 3 * (w + 1)
+    return OrdinalFactors(
+        [(w + 1, 1), (2, 1), (w + 1, 3), (2, 1), (w**2 + 1, 1), (3, 1), (w + 1, 1)]
+    )
+
+
+def test_contains(fs):
+    assert w + 1 in fs
+    assert 2 in fs
+    assert w not in fs
+    assert (w + 1, 1) not in fs
+
+
+@pytest.mark.parametrize(
+    "prime,count,multiplicity,index",
+    [(w + 1, 3, 5, 0), (2, 2, 2, 1), (w**2 + 1, 1, 1, 4), (3, 1, 1, 5)],
+)
+def test_lookups(fs, prime, count, multiplicity, index):
+    assert fs.count(prime) == count
+    assert fs.multiplicity(prime) == multiplicity
+    assert fs.index(prime) == index
+
+
+def test_lookups_of_missing_factor(fs):
+    assert fs.count(w) == 0
+    assert fs.multiplicity(w) == 0
+    with pytest.raises(ValueError):
+        fs.index(w)
+
+
+def test_index_with_start(fs):
+    assert fs.index(w + 1, 1) == 2
+    assert fs.index(w + 1, 3) == 6
+    with pytest.raises(ValueError):
+        fs.index(w + 1, 3, 6)
+
+
+def test_slice_is_view(fs):
+    view = fs[2:6]
+    assert isinstance(view, OrdinalFactorsView)
+    assert list(view) == fs.factors[2:6]
+    assert len(view) == 4
+    assert view[0] == (w + 1, 3)
+    assert view[-1] == (3, 1)
+    assert list(view[1::2]) == fs.factors[3:6:2]
+    assert view.multiplicity(w + 1) == 3
+    assert w**2 + 1 in view
+    assert view.product() == (w + 1)**3 * 2 * (w**2 + 1) * 3
+
+
+def test_divides(fs):
+    a = fs.product()
+    assert fs.divides(a)
+    assert fs.divides(a * (w + 5))
+    assert not fs.divides(a + 1)
+    assert fs[:2].divides(a)
+
+
+def test_repr_latex_truncates_factors():
+    factors = OrdinalFactors([(w**i + 1, 1) for i in range(1, 31)])
+    latex = factors._repr_latex_()  # pylint: disable=protected-access
+    assert latex.startswith(r"$\left(\omega+1\right)\cdot\left(\omega^{2}+1\right)")
+    assert latex.endswith(r"\cdots\text{ (10 more factors)}$")
+    assert factors.as_latex().endswith(r"\left(\omega^{30}+1\right)")
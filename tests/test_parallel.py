@@ -0,0 +1,88 @@
+import operator
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from transfinite import factors, w
+from transfinite.budget import BudgetExceeded, budget
+from transfinite.containers import OrdinalSortedSet
+from transfinite.enumeration import BoundedOrdinals
+from transfinite.ordinal import order_key
+from transfinite.parallel import arithmetic_many, factors_many, map_threads
+from transfinite.recursion import hardy
+
+ORDINALS = list(BoundedOrdinals(w**(w + 1), 2))[1:]
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_factors_many(threads):
+    infinite = [a for a in ORDINALS if not isinstance(a, int)]
+    results = factors_many(infinite + infinite[:10], threads=threads, chunksize=7)
+    assert [list(f) for f in results] == [list(factors(a)) for a in infinite + infinite[:10]]
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_arithmetic_many(threads):
+    pairs = list(zip(ORDINALS, reversed(ORDINALS)))
+    assert arithmetic_many(operator.mul, pairs, threads=threads, chunksize=5) == [a * b for a, b in pairs]
+    assert arithmetic_many(operator.add, iter(pairs), threads=threads) == [a + b for a, b in pairs]
+
+
+@pytest.mark.parametrize("threads", [1, 2])
+def test_budget_applies_in_threads(threads):
+    with budget(max_terms=3):
+        with pytest.raises(BudgetExceeded):
+            arithmetic_many(operator.pow, [(w + 1, 10)], threads=threads)
+    assert arithmetic_many(operator.pow, [(w + 1, 10)], threads=threads) == [(w + 1)**10]
+
+
+def test_map_threads_deduplicates():
+    calls = []
+
+    def square(n):
+        calls.append(n)
+        return n * n
+
+    assert map_threads(square, [(2,), (3,), (2,)], threads=2) == [4, 9, 4]
+    assert sorted(calls) == [2, 3]
+
+
+def test_shared_caches_across_threads():
+    def ordinals():
+        return [w**(w + i) * 3 + w**i + i for i in range(1, 40)]
+
+    shared = ordinals()
+    expected = [(hash(a), str(a), order_key(a)) for a in ordinals()]
+
+    def read(_):
+        return [(hash(a), str(a), order_key(a)) for a in shared]
+
+    with ThreadPoolExecutor(8) as executor:
+        assert all(result == expected for result in executor.map(read, range(16)))
+
+
+def test_sorted_set_across_threads():
+    s = OrdinalSortedSet(load=4)
+    ordinals = ORDINALS[:]
+    random.Random(0).shuffle(ordinals)
+    chunks = [ordinals[i::8] for i in range(8)]
+
+    def add_and_query(chunk):
+        for a in chunk:
+            s.add(a)
+            assert a in s
+            assert s[s.rank(a)] == a
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(add_and_query, chunks))
+
+    assert list(s) == sorted(ORDINALS)
+    assert list(s.irange(w, w**2)) == [a for a in sorted(ORDINALS) if w <= a < w**2]
+
+
+def test_recursion_across_threads():
+    hardy.cache_clear()
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda n: hardy(w * 2, n), range(1, 30)))
+    assert results == [4 * n for n in range(1, 30)]
@@ -0,0 +1,40 @@
+import pytest
+
+from transfinite import w
+from transfinite.budget import BudgetExceeded, budget
+from transfinite.enumeration import BoundedOrdinals
+from transfinite.parsing import parse
+
+
+@pytest.mark.parametrize("a", list(BoundedOrdinals(w**(w + 1) + 1, 2))[::13])
+def test_parse_str_roundtrip(a):
+    assert parse(str(a)) == a
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("7", 7),
+        ("ω", w),
+        ("2 * w", w),
+        ("w * 2", w*2),
+        ("(w + 1)**2", w**2 + w + 1),
+        ("2**w", w),
+        ("w**w**2", w**(w**2)),
+        ("  w**(w + 1)*3+4 ", w**(w + 1)*3 + 4),
+    ],
+)
+def test_parse_expressions(text, expected):
+    assert parse(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "w +", "w w", "(w", "w)", "x", "-1", "w ** ** 2", "__import__('os')"])
+def test_parse_invalid(text):
+    with pytest.raises(ValueError):
+        parse(text)
+
+
+def test_parse_within_budget():
+    with budget(max_bits=1000):
+        with pytest.raises(BudgetExceeded):
+            parse("2**10**10")
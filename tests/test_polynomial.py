@@ -0,0 +1,124 @@
+import operator
+
+import pytest
+
+from transfinite import w
+from transfinite.budget import BudgetExceeded, budget, size
+from transfinite.factorisation import factors
+from transfinite.polynomial import (
+    MAX_DEGREE,
+    PolyOrdinal,
+    coefficients,
+    from_coefficients,
+    poly,
+)
+
+ORDINALS = [
+    0,
+    1,
+    5,
+    w,
+    w + 1,
+    w*3,
+    w**2,
+    w**2 + w*2 + 3,
+    w**3*2 + w + 7,
+    w**3 + w**2 + w + 1,
+    w**4*2 + w**2*3,
+    w**5 + w**3*4 + 2,
+]
+
+LARGE = [w**w, w**w + w**3, w**(w + 1)*2 + 5, w**(MAX_DEGREE + 1)]
+
+
+@pytest.mark.parametrize("a", ORDINALS)
+def test_roundtrip(a):
+    p = poly(a)
+    assert isinstance(p, PolyOrdinal)
+    assert from_coefficients(coefficients(a)) == a
+    assert p.to_ordinal() == a
+    assert p == a and a == p
+    assert hash(p) == hash(a)
+
+
+def test_coefficients():
+    assert coefficients(w**3*2 + w + 7) == (7, 1, 0, 2)
+    assert coefficients(0) == ()
+    assert PolyOrdinal((1, 2, 0, 0)).coefficients == (1, 2)
+    assert poly(w**w) == w**w and not isinstance(poly(w**w), PolyOrdinal)
+    with pytest.raises(ValueError):
+        coefficients(w**w)
+    with pytest.raises(ValueError):
+        PolyOrdinal((0,) * (MAX_DEGREE + 1) + (1,))
+
+
+@pytest.mark.parametrize("op", [operator.add, operator.mul, operator.sub])
+def test_arithmetic(op):
+    for a in ORDINALS + LARGE:
+        for b in ORDINALS + LARGE:
+            try:
+                expected = op(a, b)
+            except ValueError:
+                expected = ValueError
+            if isinstance(a, int) and isinstance(b, int) and op is operator.sub:
+                continue
+            for x, y in [(poly(a), poly(b)), (poly(a), b), (a, poly(b))]:
+                try:
+                    result = op(x, y)
+                except ValueError:
+                    result = ValueError
+                assert result == expected
+
+
+@pytest.mark.parametrize("a", ORDINALS + LARGE[:2])
+@pytest.mark.parametrize("b", [0, 1, 2, 5, w, w + 2, w*3 + 1, w**2])
+def test_power(a, b):
+    expected = a**b
+    assert poly(a)**poly(b) == expected
+    assert poly(a)**b == expected
+    assert a**poly(b) == expected
+
+
+def test_results_in_range_stay_polynomial():
+    assert isinstance(poly(w + 1)**4, PolyOrdinal)
+    assert isinstance(2**poly(w*3 + 2), PolyOrdinal)
+    assert isinstance(poly(w**2) * w, PolyOrdinal)
+    assert not isinstance(poly(w)**w, PolyOrdinal)
+    assert not isinstance(poly(w**MAX_DEGREE) * w, PolyOrdinal)
+
+
+def test_comparison():
+    ordinals = ORDINALS + LARGE
+    for a in ordinals:
+        for b in ordinals:
+            for x, y in [(poly(a), poly(b)), (poly(a), b), (a, poly(b))]:
+                assert (x < y) == (a < b)
+                assert (x <= y) == (a <= b)
+                assert (x > y) == (a > b)
+                assert (x == y) == (a == b)
+    assert sorted(map(poly, reversed(ORDINALS))) == sorted(ORDINALS)
+
+
+@pytest.mark.parametrize("a", [a for a in ORDINALS if not isinstance(a, int)])
+def test_factors(a):
+    assert list(poly(a).factors()) == list(factors(a))
+
+
+def test_factors_of_finite():
+    with pytest.raises(ValueError):
+        poly(5).factors()
+
+
+def test_mixed_dict_keys():
+    table = {a: i for i, a in enumerate(ORDINALS)}
+    assert [table[poly(a)] for a in ORDINALS] == list(range(len(ORDINALS)))
+
+
+def test_powers_respect_budget():
+    with budget(max_terms=10, max_bits=1000):
+        assert poly(w + 1) ** 3 == (w + 1)**3
+        with pytest.raises(BudgetExceeded):
+            _ = poly(w + 1) ** 100
+        with pytest.raises(BudgetExceeded):
+            _ = 2 ** poly(w + 10**6)
+    assert size(poly(w**3*5 + w + 7)) == size(w**3*5 + w + 7)
@@ -0,0 +1,52 @@
+import pytest
+
+from transfinite import w
+from transfinite.primes import is_prime, is_prime_integer, is_prime_many, primes
+
+
+def test_is_prime_integer():
+    assert [n for n in range(50) if is_prime_integer(n)] == [
+        2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47
+    ]
+    assert is_prime_integer(2**61 - 1)
+    assert not is_prime_integer(2**61 + 1)
+    # the least composite passing Miller-Rabin with the bases up to 41
+    assert not is_prime_integer(3317044064679887385961981)
+    assert is_prime_integer(2**127 - 1)
+
+
+ORDINALS = [
+    w, w + 1, w + 2, w*2, w*2 + 1, w**2, w**2 + 1, w**2 + w, w**w, w**w + 1,
+    w**(w + 1), w**(w + 1) + 1, w**w**w, w**w**2, w**(w*2), w**w**(w*2) + 1,
+]
+
+
+@pytest.mark.parametrize("a", ORDINALS)
+def test_is_prime(a):
+    assert is_prime(a) is a.is_prime()
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_is_prime_many(processes):
+    ordinals = ORDINALS * 3 + [0, 1, 2, 7, 9]
+    expected = [is_prime(a) for a in ordinals]
+    assert is_prime_many(ordinals, processes=processes, chunksize=5) == expected
+
+
+def test_primes():
+    assert list(primes(w**3 + 1, 2)) == [w, w + 1, w**2 + 1]
+    assert list(primes(w**3 + 2, 3)) == [w, w + 1, w**2 + 1, w**3 + 1]
+    assert list(primes(w**(w + 1), 1)) == [w, w + 1, w**w, w**w + 1]
+    assert list(primes(20)) == [2, 3, 5, 7, 11, 13, 17, 19]
+    assert list(primes(5, 3)) == [2, 3]
+    assert list(primes(2)) == []
+    with pytest.raises(ValueError):
+        list(primes(w**2))
+
+
+@pytest.mark.parametrize("bound,k", [(w**w**2, 1), (w**(w*2 + 1), 2)])
+def test_primes_are_increasing_and_prime(bound, k):
+    ps = list(primes(bound, k))
+    assert all(p.is_prime() for p in ps)
+    assert all(a < b for a, b in zip(ps, ps[1:]))
+    assert all(p < bound for p in ps)
@@ -0,0 +1,50 @@
+import pytest
+
+from transfinite.budget import size
+from transfinite.encoding import from_bytes
+from transfinite.ordinal import cnf_terms
+from transfinite.parsing import parse
+from transfinite.random_ordinals import SHAPES, RandomOrdinals
+
+
+def is_normal_form(a):
+    if isinstance(a, int):
+        return True
+    terms = cnf_terms(a)
+    return (
+        all(x[0] > y[0] for x, y in zip(terms, terms[1:]))
+        and all(is_normal_form(exponent) for exponent, _ in terms)
+    )
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_shapes(shape):
+    settings = SHAPES[shape]
+    ordinals = RandomOrdinals.from_shape(shape, seed=0, pool_size=200).ordinals(20)
+    for a in ordinals:
+        assert is_normal_form(a)
+        infinite_terms = sum(1 for exponent, _ in cnf_terms(a) if exponent != 0)
+        assert settings["terms"][0] <= infinite_terms <= settings["terms"][1]
+        assert settings["height"][0] <= size(a).height <= settings["height"][1]
+
+
+def test_seeded():
+    def sample(seed):
+        return RandomOrdinals(seed=seed, pool_size=100).ordinals(50)
+
+    assert sample(3) == sample(3)
+    assert sample(3) != sample(4)
+
+
+def test_outputs():
+    def generator():
+        return RandomOrdinals(seed=1, pool_size=100)
+
+    ordinals = generator().ordinals(30)
+    assert [parse(s) for s in generator().strings(30)] == ordinals
+    assert from_bytes(generator().encoded(30)) == ordinals
+
+
+def test_giant_coefficients():
+    a = RandomOrdinals.from_shape("giant", seed=0, coefficient_bits=10000).ordinal()
+    assert size(a).bits > 9000
@@ -0,0 +1,100 @@
+import pytest
+
+from transfinite import w
+from transfinite.recursion import (
+    RecursionBudgetExceeded,
+    fast_growing,
+    hardy,
+    transfinite_recursion,
+)
+
+
+@pytest.mark.parametrize(
+    "alpha,n,expected",
+    [
+        (0, 5, 5),
+        (3, 5, 8),
+        (w, 3, 6),
+        (w + 2, 3, 10),
+        (w*2, 3, 12),
+        (w**2, 2, 8),
+        (w**2, 3, 24),
+        (w**3, 2, 2048),
+    ],
+)
+def test_hardy(alpha, n, expected):
+    assert hardy(alpha, n) == expected
+
+
+@pytest.mark.parametrize(
+    "alpha,n,expected",
+    [(0, 5, 6), (1, 5, 10), (2, 3, 24), (3, 2, 2048), (w, 2, 8), (w, 1, 2)],
+)
+def test_fast_growing(alpha, n, expected):
+    assert fast_growing(alpha, n) == expected
+
+
+def test_deep_recursion_does_not_use_call_stack():
+
+    @transfinite_recursion
+    def depth(n):
+        if n == 0:
+            return 0
+        return (yield n - 1) + 1
+
+    assert depth(50000) == 50000
+    assert depth.stats.max_depth == 50001
+
+
+def test_memoization():
+
+    @transfinite_recursion
+    def calls(alpha):
+        if alpha == 0:
+            return 1
+        left = yield alpha - 1
+        right = yield alpha - 1
+        return left + right
+
+    assert calls(200) == 2**200
+    assert calls.stats.evaluations == 201
+    assert calls.stats.cache_hits == 200
+
+    calls(200)
+    assert calls.stats.cache_hits == 201
+
+    calls.cache_clear()
+    assert (calls.stats.evaluations, calls.stats.cache_hits, calls.stats.max_depth) == (0, 0, 0)
+
+
+def test_budget_exceeded():
+
+    @transfinite_recursion(budget=50)
+    def count_down(n):
+        return (yield n - 1) if n else 0
+
+    assert count_down(40) == 0
+
+    with pytest.raises(RecursionBudgetExceeded):
+        count_down(100)
+
+
+def test_budget_applies_to_each_call():
+
+    @transfinite_recursion(budget=50)
+    def count_down(n):
+        return (yield n - 1) if n else 0
+
+    assert count_down(40) == 0
+    assert count_down(80) == 0
+    assert count_down.stats.evaluations == 81
+
+
+def test_self_dependent_call_raises():
+
+    @transfinite_recursion
+    def loop(n):
+        return (yield n)
+
+    with pytest.raises(RecursionError):
+        loop(1)
@@ -0,0 +1,27 @@
+from itertools import count, repeat
+
+import pytest
+
+from transfinite import w
+from transfinite.sequences import descend
+
+
+@pytest.mark.parametrize(
+    "a,schedule,expected",
+    [
+        (0, repeat(2), []),
+        (3, repeat(2), [2, 1, 0]),
+        (w*2, count(1), [w + 1, w, 3, 2, 1, 0]),
+        (w**2 + 1, repeat(2), [w**2, w*2, w + 2, w + 1, w, 2, 1, 0]),
+        (w**w, [2, 1], [w**2, w]),
+    ],
+)
+def test_descend(a, schedule, expected):
+    assert list(descend(a, schedule)) == expected
+
+
+@pytest.mark.parametrize("a", [w**2*2 + w*3 + 4, w**w + w**3, w**(w + 1)])
+def test_descend_is_strictly_decreasing(a):
+    sequence = [a] + list(descend(a, repeat(3)))
+    assert sequence[-1] == 0
+    assert all(x > y for x, y in zip(sequence, sequence[1:]))
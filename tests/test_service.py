@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+
+import transfinite.service
+from transfinite.service import OrdinalClient, OrdinalService, ServiceError, evaluate, evaluate_batch, serve
+
+
+@pytest.mark.parametrize(
+    "op,args,expected",
+    [
+        ("parse", ["w*2 + w"], "w*3"),
+        ("compare", ["w + 1", "w*2"], -1),
+        ("compare", ["w*2", "w + w"], 0),
+        ("add", ["1", "w"], "w"),
+        ("sub", ["w*2", "w"], "w"),
+        ("mul", ["w + 1", "w"], "w**2"),
+        ("pow", ["w", "w"], "w**w"),
+        ("factors", ["w**2 + w"], [["w", 1], ["w + 1", 1]]),
+    ],
+)
+def test_evaluate(op, args, expected):
+    assert evaluate(op, args) == expected
+
+
+@pytest.mark.parametrize("op,args", [("factors", ["5"]), ("divide", ["w", "2"]), ("add", ["w"])])
+def test_evaluate_invalid(op, args):
+    with pytest.raises(ValueError):
+        evaluate(op, args)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_service_batches_and_deduplicates():
+    async def main():
+        async with OrdinalService(processes=1, batch_delay=0.01) as service:
+            results = await asyncio.gather(
+                *[service.request("mul", "w + 1", f"w + {i % 5}") for i in range(50)]
+            )
+            again = await service.request("mul", "w + 1", "w + 0")
+            return results, again, service.metrics()
+
+    results, again, metrics = run(main())
+    assert results[:2] == ["w**2", "w**2 + w + 1"]
+    assert again == "w**2"
+    assert metrics["requests"] == metrics["completed"] == 51
+    assert metrics["deduplicated"] == 45
+    assert metrics["cache_hits"] == 1
+    assert metrics["batched"] == 5
+    assert metrics["batches"] < 5
+
+
+def test_service_errors_and_limits():
+    async def main():
+        async with OrdinalService(processes=1, limits={"max_terms": 10}) as service:
+            with pytest.raises(ServiceError, match="BudgetExceeded"):
+                await service.request("pow", "w + 1", "100")
+            with pytest.raises(ServiceError, match="ValueError"):
+                await service.request("parse", "w +")
+            return service.metrics()
+
+    assert run(main())["errors"] == 2
+
+
+def test_default_limits():
+    [(ok, error)] = evaluate_batch([("pow", ["w + 1", "1000000"])])
+    assert not ok and error.startswith("BudgetExceeded")
+    assert evaluate_batch([("pow", ["w + 1", "3"])], limits={}) == [(True, "w**3 + w**2 + w + 1")]
+
+    async def main():
+        async with OrdinalService(processes=1) as service:
+            with pytest.raises(ServiceError, match="BudgetExceeded"):
+                await service.request("pow", "w + 1", "1000000")
+
+    run(main())
+
+
+@pytest.mark.parametrize(
+    "op,args", [("pow", ["7", "3000000"]), ("pow", ["3**1000", "3**1000"]), ("mul", ["2**600000", "2**600000"])]
+)
+def test_default_limits_finite(op, args):
+    [(ok, error)] = evaluate_batch([(op, args)])
+    assert not ok and error.startswith("BudgetExceeded")
+
+
+def test_close_with_outstanding_request():
+    async def main():
+        service = await OrdinalService(processes=1, batch_delay=60).start()
+        pending = asyncio.ensure_future(service.request("add", "w", "1"))
+        await asyncio.sleep(0.01)
+        await service.close()
+        with pytest.raises(ServiceError, match="closed"):
+            await asyncio.wait_for(pending, 5)
+
+    run(main())
+
+
+def test_client_over_tcp():
+    async def main():
+        async with OrdinalService(processes=1) as service:
+            server = await serve(service)
+            port = server.sockets[0].getsockname()[1]
+            async with await OrdinalClient.connect(port=port) as client:
+                results = await asyncio.gather(
+                    client.request("add", "w", "w"),
+                    client.request("factors", "w**w + w"),
+                    client.request("compare", "w", "5"),
+                )
+                with pytest.raises(ServiceError):
+                    await client.request("sub", "w", "w + 1")
+                metrics = await client.metrics()
+            server.close()
+            await server.wait_closed()
+            return results, metrics
+
+    results, metrics = run(main())
+    assert results == ["w*2", [["w", 1], ["w**w + 1", 1]], 1]
+    assert metrics["requests"] == 4
+
+
+def test_client_receives_large_results():
+    async def main():
+        async with OrdinalService(processes=1) as service:
+            server = await serve(service)
+            port = server.sockets[0].getsockname()[1]
+            async with await OrdinalClient.connect(port=port) as client:
+                large = await asyncio.wait_for(client.request("pow", "w + 1", "20000"), 30)
+                small = await asyncio.wait_for(client.request("add", "w", "1"), 5)
+            server.close()
+            await server.wait_closed()
+            return large, small
+
+    large, small = run(main())
+    assert len(large) > 2**16
+    assert large.startswith("w**20000 + w**19999") and large.endswith("w + 1")
+    assert small == "w + 1"
+
+
+def test_client_fails_requests_after_the_connection_fails(monkeypatch):
+    async def main():
+        async with OrdinalService(processes=1) as service:
+            server = await serve(service)
+            port = server.sockets[0].getsockname()[1]
+            monkeypatch.setattr(transfinite.service, "MESSAGE_LIMIT", 1024)
+            async with await OrdinalClient.connect(port=port) as client:
+                with pytest.raises(ConnectionError):
+                    await asyncio.wait_for(client.request("pow", "w + 1", "1000"), 5)
+                with pytest.raises(ConnectionError):
+                    await asyncio.wait_for(client.request("add", "w", "1"), 5)
+            server.close()
+            await server.wait_closed()
+
+    run(main())
+
+
+def test_server_replies_to_unexpected_errors():
+    def broken_metrics():
+        raise RuntimeError("broken")
+
+    async def main():
+        async with OrdinalService(processes=1) as service:
+            service.metrics = broken_metrics
+            server = await serve(service)
+            port = server.sockets[0].getsockname()[1]
+            async with await OrdinalClient.connect(port=port) as client:
+                with pytest.raises(ServiceError, match="RuntimeError: broken"):
+                    await asyncio.wait_for(client.metrics(), 5)
+                result = await client.request("add", "w", "1")
+            server.close()
+            await server.wait_closed()
+            return result
+
+    assert run(main()) == "w + 1"
+
+
+def test_client_over_unix_socket(tmp_path):
+    path = str(tmp_path / "transfinite.sock")
+
+    async def main():
+        async with OrdinalService(processes=1) as service:
+            server = await serve(service, path=path)
+            async with await OrdinalClient.connect(path=path) as client:
+                result = await client.request("pow", "2", "w + 3")
+            server.close()
+            await server.wait_closed()
+            return result
+
+    assert run(main()) == "w*8"
+
+
+def test_service_with_process_pool():
+    async def main():
+        async with OrdinalService(processes=2) as service:
+            return await asyncio.gather(*[service.request("pow", "w", str(n)) for n in range(1, 4)])
+
+    assert run(main()) == ["w", "w**2", "w**3"]
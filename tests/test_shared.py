@@ -0,0 +1,51 @@
+import operator
+
+import pytest
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+# pylint: disable=wrong-import-position
+from transfinite import w
+from transfinite.factorisation import factors
+from transfinite.shared import SharedOrdinalArena, arithmetic_many, factors_many, share
+
+ORDINALS = [w, w + 1, w**2*3 + w + 2, w**w + w**2, w**(w**w*2 + 1)*4 + w**w, (w + 1)**3, w*7]
+
+
+@pytest.fixture(name="arena")
+def arena_fixture():
+    with share(ORDINALS) as arena:
+        yield arena
+
+
+def test_share(arena):
+    assert list(arena) == ORDINALS
+    assert arena[3] == w**w + w**2
+
+
+def test_attach_by_name(arena):
+    attached = SharedOrdinalArena(arena.name)
+    assert list(attached) == ORDINALS
+    attached.close()
+    assert arena[2] == ORDINALS[2]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_factors_many(arena, processes):
+    results = factors_many(arena, processes=processes, chunksize=3)
+    assert [list(fs) for fs in results] == [list(factors(a)) for a in ORDINALS]
+    assert list(factors_many(arena, [4], processes=processes)[0]) == list(factors(ORDINALS[4]))
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_arithmetic_many(arena, processes):
+    pairs = [(i, j) for i in range(len(ORDINALS)) for j in range(len(ORDINALS))]
+    expected = [ORDINALS[i] * ORDINALS[j] for i, j in pairs]
+    assert arithmetic_many(operator.mul, arena, pairs, processes=processes, chunksize=10) == expected
+
+
+def test_large_coefficients():
+    # the sum has a coefficient too large for a table, so is pickled
+    with share([w * 2**63]) as arena:
+        assert arithmetic_many(operator.mul, arena, [(0, 0)], processes=1) == [w**2 * 2**63]
+        assert arithmetic_many(operator.add, arena, [(0, 0)], processes=1) == [w * 2**64]
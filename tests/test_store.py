@@ -0,0 +1,72 @@
+import operator
+
+import pytest
+
+from transfinite import w
+from transfinite.enumeration import BoundedOrdinals
+from transfinite.store import OrdinalStore, OrdinalTable, encode_table, write_store
+
+ORDINALS = list(BoundedOrdinals(w**(w + 1) + 1, 2))[::7] + [w**w**w + 7, 5, 0, w]
+
+OPERATORS = [operator.lt, operator.le, operator.eq, operator.ne, operator.gt, operator.ge]
+
+
+@pytest.fixture(name="store")
+def store_fixture(tmp_path):
+    path = tmp_path / "ordinals.tbl"
+    write_store(path, ORDINALS)
+    with OrdinalStore(path) as store:
+        yield store
+
+
+def test_roundtrip(store):
+    assert len(store) == len(ORDINALS)
+    assert list(store) == ORDINALS
+    assert store[3] == ORDINALS[3]
+    assert store[-1] == ORDINALS[-1]
+
+
+def test_slicing(store):
+    assert store[1:3] == ORDINALS[1:3]
+    assert store[::-5] == ORDINALS[::-5]
+    assert store[len(ORDINALS):] == []
+    with pytest.raises(TypeError):
+        store.__getitem__("a")
+
+
+def test_shared_exponents_are_interned():
+    table = OrdinalTable(encode_table([w**w + 1, w**w * 2 + w**w, w**w]))
+    # the nodes are 0, 1, w, w**w, w**w + 1 and w**w*3
+    assert len(table.order) == 6
+    assert table[0].exponent is table[1].exponent
+
+
+def test_limits(store):
+    expected = [i for i, a in enumerate(ORDINALS) if not isinstance(a, int) and a.is_limit()]
+    assert list(store.limits()) == expected
+
+
+@pytest.mark.parametrize("op", OPERATORS)
+@pytest.mark.parametrize("a", [0, 3, w, w + 1, w**2 * 2 + 3, w**w + w, w**w**w + 8])
+def test_select(store, op, a):
+    assert list(store.select(op, a)) == [i for i, x in enumerate(ORDINALS) if op(x, a)]
+
+
+@pytest.mark.parametrize("op", OPERATORS)
+@pytest.mark.parametrize("a", [0, 1, 2, w, w + 3])
+def test_select_leading_exponent(store, op, a):
+    expected = [
+        i for i, x in enumerate(ORDINALS)
+        if x != 0 and op(0 if isinstance(x, int) else x.exponent, a)
+    ]
+    assert list(store.select_leading_exponent(op, a)) == expected
+
+
+def test_not_a_table():
+    with pytest.raises(ValueError):
+        OrdinalTable(bytes(100))
+
+
+def test_coefficient_too_large():
+    with pytest.raises(OverflowError):
+        encode_table([w * 2**64])
@@ -1,4 +1,6 @@
 from .ordinal import Ordinal
 from .factorisation import factors
+from .logarithm import log
+from .natural import natural_sum, natural_product
 
 w = Ordinal()
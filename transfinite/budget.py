@@ -0,0 +1,162 @@
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+Size = namedtuple("Size", ["terms", "height", "bits"])
+Size.__doc__ = """
+The size of an ordinal: the number of terms of its normal form
+(counting a nonzero finite part as a term), the height of the tower of
+nested exponents, and the largest bit length of an integer appearing
+anywhere in it (copies, finite parts and finite exponents).
+"""
+
+_limits = ContextVar("budget", default=None)
+
+
+class BudgetExceeded(ArithmeticError):
+    """
+    Raised when an operation may produce an ordinal larger than
+    the current budget allows.
+
+    """
+
+
+def size(a):
+    """
+    Return the Size of the finite or infinite ordinal a.
+
+    The size of an Ordinal is computed on first use and cached as its
+    size property, so this takes constant time when repeated.
+
+    """
+    if isinstance(a, int):
+        return Size(1 if a else 0, 0, a.bit_length())
+    return a.size
+
+
+def _finite_part(a):
+    while not isinstance(a, int):
+        a = a.addend
+    return a
+
+
+def predict_add(a, b):
+    """
+    Return an upper bound on the Size of a + b.
+
+    """
+    x, y = size(a), size(b)
+    return Size(x.terms + y.terms, max(x.height, y.height), max(x.bits, y.bits) + 1)
+
+
+def predict_mul(a, b):
+    """
+    Return an upper bound on the Size of a * b.
+
+    """
+    if a == 0 or b == 0:
+        return Size(0, 0, 0)
+
+    x, y = size(a), size(b)
+    return Size(x.terms + y.terms, max(x.height, y.height), x.bits + y.bits + 1)
+
+
+def predict_pow(a, b):
+    """
+    Return an upper bound on the Size of a ** b.
+
+    This takes time proportional to the number of terms of b, to find
+    its finite part, and does not depend on a.
+
+    """
+    if b == 0 or a == 1:
+        return Size(1, 0, 1)
+
+    if a == 0:
+        return Size(0, 0, 0)
+
+    x, y = size(a), size(b)
+    n = _finite_part(b)
+
+    if isinstance(a, int):
+        # k**n, or w**g * k**n where g has the terms of b
+        if isinstance(b, int):
+            return Size(1, 0, x.bits * n)
+        return Size(2, y.height + 1, max(y.bits + 1, x.bits * n))
+
+    # Every multiplication by a adds at most its terms. In the normal
+    # form of a**n the coefficients are those of a, or the leading one
+    # times the finite part of a, and the exponents are the leading
+    # exponent of a times at most n - 1 plus an exponent of a
+    power = Size(x.terms * max(n, 1), x.height, max(2 * x.bits, x.bits + n.bit_length() + 1))
+
+    if isinstance(b, int):
+        return power
+
+    # a**b == w**(leading exponent of a * limit part of b) * a**n
+    return Size(
+        power.terms + 1,
+        max(x.height, y.height + 1),
+        max(power.bits, x.bits + y.bits + 2),
+    )
+
+
+def predict_factors(a):
+    """
+    Return an upper bound on the Size of the factorisation of a, where
+    terms is the number of factors.
+
+    The factors of the least infinite term are one per term of its
+    exponent, plus its copies, and each other term contributes at most
+    two factors (w**e + 1 and copies).
+
+    """
+    x = size(a)
+
+    if isinstance(a, int):
+        return x
+
+    least = a
+    while not isinstance(least.addend, int):
+        least = least.addend
+
+    return Size(size(least.exponent).terms + 1 + 2 * x.terms, x.height, x.bits)
+
+
+@contextmanager
+def budget(max_terms=None, max_height=None, max_bits=None):
+    """
+    Context manager limiting the size of the ordinals computed in it.
+
+    Inside the block, ordinal arithmetic and factorisation first
+    predict an upper bound on the size of the result and raise
+    BudgetExceeded if any of its terms, height or bits is over the
+    limit, before doing any work. Limits that are None are not
+    checked. The predictions are upper bounds, so an operation can be
+    rejected even if its actual result would have been within budget.
+
+    """
+    token = _limits.set(Size(max_terms, max_height, max_bits))
+    try:
+        yield
+    finally:
+        _limits.reset(token)
+
+
+def check(predict, *args):
+    """
+    Raise BudgetExceeded if the predicted size of the operation is over
+    the current budget. Does nothing if there is no budget.
+
+    """
+    limits = _limits.get()
+    if limits is None:
+        return
+
+    predicted = predict(*args)
+
+    for name, limit, value in zip(Size._fields, limits, predicted):
+        if limit is not None and value > limit:
+            raise BudgetExceeded(
+                f"{predict.__name__} predicts {name} of {value}, over the budget of {limit}"
+            )
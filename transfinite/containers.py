@@ -0,0 +1,293 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import MutableMapping, MutableSet
+from functools import wraps
+from itertools import accumulate, chain
+from threading import RLock
+
+from transfinite.ordinal import order_key
+
+
+def _synchronized(method):
+    """
+    Decorator running the method while holding the object's lock.
+
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class OrdinalSortedSet(MutableSet):
+    """
+    A set of ordinals kept in increasing order.
+
+    The ordinals are stored in a list of sorted chunks, each holding at
+    most 2*load ordinals, alongside their cached order keys (see
+    ordinal.order_key). The chunks and the largest key of each chunk
+    form a two-level search tree, so that locating an ordinal takes two
+    binary searches over plain tuples and inserting or deleting only
+    moves the elements of one chunk.
+
+    Initialising the set from an iterable sorts the ordinals once and
+    splits them into chunks, which is much faster than adding them one
+    at a time.
+
+    The set can be shared between threads: each method holds a lock
+    while it reads or changes the chunks. Iterating while another
+    thread changes the set may miss or repeat ordinals, as for a list.
+
+    """
+    def __init__(self, iterable=(), load=500):
+        self._lock = RLock()
+        self._load = load
+        self._values = []
+        self._keys = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+
+        values = sorted(set(iterable), key=order_key)
+        keys = [order_key(a) for a in values]
+
+        for i in range(0, len(values), load):
+            self._values.append(values[i:i + load])
+            self._keys.append(keys[i:i + load])
+            self._maxes.append(keys[min(i + load, len(values)) - 1])
+
+        self._len = len(values)
+
+    @property
+    def lock(self):
+        """
+        The reentrant lock held by each method, which callers can hold
+        to make several calls atomic.
+
+        """
+        return self._lock
+
+    def _locate(self, key):
+        """
+        Return (chunk, position) of the first key not less than key.
+
+        """
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return i, 0
+        return i, bisect_left(self._keys[i], key)
+
+    @_synchronized
+    def __contains__(self, a):
+        key = order_key(a)
+        i, j = self._locate(key)
+        return i < len(self._keys) and self._keys[i][j] == key
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._values)
+
+    def __reversed__(self):
+        return (a for values in reversed(self._values) for a in reversed(values))
+
+    @_synchronized
+    def add(self, value):
+        key = order_key(value)
+
+        if not self._maxes:
+            self._values.append([value])
+            self._keys.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            self._offsets = None
+            return
+
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        keys = self._keys[i]
+        j = bisect_left(keys, key)
+
+        if j < len(keys) and keys[j] == key:
+            return
+
+        keys.insert(j, key)
+        self._values[i].insert(j, value)
+        self._maxes[i] = keys[-1]
+        self._len += 1
+        self._offsets = None
+
+        if len(keys) > 2 * self._load:
+            self._values[i + 1:i + 1] = [self._values[i][self._load:]]
+            self._keys[i + 1:i + 1] = [keys[self._load:]]
+            del self._values[i][self._load:]
+            del keys[self._load:]
+            self._maxes[i:i + 1] = [keys[-1], self._keys[i + 1][-1]]
+
+    @_synchronized
+    def discard(self, value):
+        key = order_key(value)
+        i, j = self._locate(key)
+
+        if i == len(self._keys) or self._keys[i][j] != key:
+            return
+
+        del self._keys[i][j]
+        del self._values[i][j]
+        self._len -= 1
+        self._offsets = None
+
+        if self._keys[i]:
+            self._maxes[i] = self._keys[i][-1]
+        else:
+            del self._keys[i]
+            del self._values[i]
+            del self._maxes[i]
+
+    def _get_offsets(self):
+        """
+        Return the number of ordinals before each chunk.
+
+        """
+        if self._offsets is None:
+            self._offsets = [0] + list(accumulate(len(values) for values in self._values))
+        return self._offsets
+
+    @_synchronized
+    def rank(self, a):
+        """
+        Return the number of ordinals in the set less than a.
+
+        """
+        i, j = self._locate(order_key(a))
+        return self._get_offsets()[i] + j
+
+    @_synchronized
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("index out of range")
+        offsets = self._get_offsets()
+        i = bisect_right(offsets, index) - 1
+        return self._values[i][index - offsets[i]]
+
+    def irange(self, minimum=None, maximum=None):
+        """
+        Iterate over the ordinals a with minimum <= a < maximum. Either
+        bound can be None to leave the range unbounded on that side.
+
+        """
+        with self.lock:
+            start = 0 if minimum is None else self.rank(minimum)
+            stop = self._len if maximum is None else self.rank(maximum)
+            if start >= stop:
+                return iter(())
+
+            offsets = self._get_offsets()
+            i = bisect_right(offsets, start) - 1
+            j = start - offsets[i]
+            chunks = []
+
+            # Copy the slices of the chunks in the range, so that later
+            # changes to the set do not affect the iteration
+            while stop - start > 0:
+                chunk = self._values[i][j:j + stop - start]
+                chunks.append(chunk)
+                start += len(chunk)
+                i, j = i + 1, 0
+
+        return chain.from_iterable(chunks)
+
+    @_synchronized
+    def successor(self, a):
+        """
+        Return the least ordinal in the set greater than a, or None.
+
+        """
+        key = order_key(a)
+        i = bisect_right(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        return self._values[i][bisect_right(self._keys[i], key)]
+
+    @_synchronized
+    def predecessor(self, a):
+        """
+        Return the greatest ordinal in the set less than a, or None.
+
+        """
+        rank = self.rank(a)
+        return self[rank - 1] if rank else None
+
+    def __repr__(self):
+        return f"OrdinalSortedSet({list(self)!r})"
+
+
+class OrdinalSortedDict(MutableMapping):
+    """
+    A mapping with ordinal keys, iterated in increasing order of key.
+
+    The keys are held in an OrdinalSortedSet, so the same range and
+    rank queries are available. As for the set, each method holds a
+    lock, so the mapping can be shared between threads.
+
+    """
+    def __init__(self, items=(), load=500):
+        self._lock = RLock()
+        if isinstance(items, MutableMapping):
+            items = items.items()
+        self._data = dict(items)
+        self._keys = OrdinalSortedSet(self._data, load)
+
+    @property
+    def lock(self):
+        """
+        The lock held by each method, as for OrdinalSortedSet.lock.
+
+        """
+        return self._lock
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    @_synchronized
+    def __setitem__(self, key, value):
+        if key not in self._data:
+            self._keys.add(key)
+        self._data[key] = value
+
+    @_synchronized
+    def __delitem__(self, key):
+        del self._data[key]
+        self._keys.discard(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(self._keys)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def rank(self, key):
+        return self._keys.rank(key)
+
+    def key_at(self, index):
+        return self._keys[index]
+
+    def irange(self, minimum=None, maximum=None):
+        return self._keys.irange(minimum, maximum)
+
+    def successor(self, key):
+        return self._keys.successor(key)
+
+    def predecessor(self, key):
+        return self._keys.predecessor(key)
+
+    def __repr__(self):
+        return f"OrdinalSortedDict({[(k, self._data[k]) for k in self]!r})"
@@ -0,0 +1,98 @@
+from transfinite.ordinal import Ordinal, cnf_terms
+
+
+def _write_varint(n, out):
+    """
+    Append the non-negative integer to the bytearray in LEB128 form:
+    7 bits per byte, least significant first, with the high bit set on
+    every byte but the last.
+
+    """
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, offset):
+    n = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, offset
+        shift += 7
+
+
+def _write_ordinal(a, out):
+    if isinstance(a, int):
+        out.append(0)
+        _write_varint(a, out)
+        return
+
+    terms = cnf_terms(a)
+    finite = terms.pop()[1] if terms[-1][0] == 0 else 0
+
+    _write_varint(len(terms), out)
+    for exponent, copies in terms:
+        _write_ordinal(exponent, out)
+        _write_varint(copies, out)
+    _write_varint(finite, out)
+
+
+def _read_ordinal(data, offset):
+    n_terms, offset = _read_varint(data, offset)
+    terms = []
+
+    for _ in range(n_terms):
+        exponent, offset = _read_ordinal(data, offset)
+        copies, offset = _read_varint(data, offset)
+        terms.append((exponent, copies))
+
+    a, offset = _read_varint(data, offset)
+
+    for exponent, copies in reversed(terms):
+        a = Ordinal.unchecked(exponent, copies, a)
+
+    return a, offset
+
+
+def to_bytes(*ordinals):
+    """
+    Return a compact binary encoding of the ordinals.
+
+    Each ordinal is written as the number of its infinite terms, then
+    for each term its exponent (encoded in the same way) and copies,
+    and finally its finite part, with every integer as a LEB128 varint.
+    A finite ordinal is therefore 0 followed by its value, so small
+    ordinals take a few bytes and coefficients can be of any size.
+
+    """
+    out = bytearray()
+    for a in ordinals:
+        _write_ordinal(a, out)
+    return bytes(out)
+
+
+def from_bytes(data):
+    """
+    Return the list of ordinals encoded in the bytes by to_bytes().
+
+    The terms are trusted to be in decreasing order and are not
+    compared, so only data written by to_bytes() should be decoded.
+
+    """
+    return list(iter_from_bytes(data))
+
+
+def iter_from_bytes(data):
+    """
+    Lazily yield the ordinals encoded in the bytes by to_bytes().
+
+    """
+    data = memoryview(data)
+    offset = 0
+    while offset < len(data):
+        a, offset = _read_ordinal(data, offset)
+        yield a
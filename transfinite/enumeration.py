@@ -0,0 +1,165 @@
+from transfinite.ordinal import cnf_terms, from_cnf_terms
+from transfinite.util import is_finite_ordinal
+
+
+class BoundedOrdinals:
+    """
+    The ordinals less than a bound whose coefficients, at every level of
+    nesting, are at most max_coefficient, in increasing order.
+
+    Coefficients include the copies of every term, the finite part, and
+    finite exponents. For example, with max_coefficient=2 the ordinals
+    below w**w are the polynomials in w of degree at most 2 with
+    coefficients at most 2, and the ordinals below w**w**2 have exponents
+    of the form w*a + b with a, b <= 2.
+
+    With the allowed exponents x_1 > x_2 > ... > x_m (these are themselves
+    the bounded ordinals up to the leading exponent of the bound), each
+    ordinal corresponds to its coefficients (c_1, ..., c_m), and the
+    order of the ordinals is the order of the integers with these digits
+    in base (max_coefficient + 1). Ordinals are therefore generated,
+    counted, located and partitioned by working with integer indexes,
+    without building or sorting the whole set.
+
+    """
+    def __init__(self, bound, max_coefficient, start=0, stop=None):
+
+        if max_coefficient < 1:
+            raise ValueError("max_coefficient must be at least 1")
+
+        self.bound = bound
+        self.max_coefficient = max_coefficient
+        self.base = max_coefficient + 1
+
+        if is_finite_ordinal(bound):
+            self.exponents = [0] if bound else []
+        else:
+            self.exponents = list(BoundedOrdinals(bound.exponent + 1, max_coefficient))
+            self.exponents.reverse()
+
+        size = min(self.rank(bound), self.base ** len(self.exponents))
+        self.start = start
+        self.stop = size if stop is None else min(stop, size)
+
+    def _view(self, start, stop):
+        view = BoundedOrdinals.__new__(BoundedOrdinals)
+        view.__dict__.update(self.__dict__)
+        view.start = max(start, self.start)
+        view.stop = min(stop, self.stop)
+        return view
+
+    def rank(self, a):
+        """
+        Return the number of bounded ordinals (ignoring the upper bound)
+        that are less than a.
+
+        """
+        terms = cnf_terms(a)
+        m = len(self.exponents)
+        rank = 0
+        j = 0
+
+        for i, exponent in enumerate(self.exponents):
+
+            if j == len(terms):
+                break
+
+            weight = self.base ** (m - i - 1)
+            term_exponent, copies = terms[j]
+
+            # a has a term with an exponent that is not allowed, so every
+            # ordinal agreeing with a so far is less than a
+            if term_exponent > exponent:
+                return rank + self.base * weight
+
+            if term_exponent == exponent:
+                if copies > self.max_coefficient:
+                    return rank + self.base * weight
+                rank += copies * weight
+                j += 1
+
+        if j < len(terms):
+            rank += 1
+
+        return rank
+
+    def count(self):
+        """
+        Return the number of ordinals, without enumerating them.
+
+        """
+        return max(self.stop - self.start, 0)
+
+    def __len__(self):
+        return self.count()
+
+    def _ordinal(self, digits):
+        return from_cnf_terms(
+            [(e, c) for e, c in zip(self.exponents, digits) if c]
+        )
+
+    def _digits(self, index):
+        digits = []
+        for _ in self.exponents:
+            index, digit = divmod(index, self.base)
+            digits.append(digit)
+        digits.reverse()
+        return digits
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count()
+        if not 0 <= index < self.count():
+            raise IndexError("index out of range")
+        return self._ordinal(self._digits(self.start + index))
+
+    def __contains__(self, a):
+        index = self.rank(a)
+        return self.start <= index < self.stop and self._ordinal(self._digits(index)) == a
+
+    def _iterate(self, start):
+        digits = self._digits(start)
+
+        for _ in range(start, self.stop):
+            yield self._ordinal(digits)
+
+            # Add 1 to the digits
+            i = len(digits) - 1
+            while i >= 0 and digits[i] == self.max_coefficient:
+                digits[i] = 0
+                i -= 1
+            if i >= 0:
+                digits[i] += 1
+
+    def __iter__(self):
+        return self._iterate(self.start)
+
+    def seek(self, a):
+        """
+        Return an iterator over the ordinals greater than or equal to a.
+
+        """
+        return self._iterate(max(self.rank(a), self.start))
+
+    def partition(self, n):
+        """
+        Split the ordinals into n disjoint consecutive ranges of nearly
+        equal size, for example to share out between parallel workers.
+
+        """
+        size, excess = divmod(self.count(), n)
+        views = []
+        start = self.start
+
+        for i in range(n):
+            stop = start + size + (i < excess)
+            views.append(self._view(start, stop))
+            start = stop
+
+        return views
+
+    def __repr__(self):
+        return (
+            f"BoundedOrdinals({self.bound!r}, max_coefficient={self.max_coefficient}, "
+            f"start={self.start}, stop={self.stop})"
+        )
@@ -1,5 +1,6 @@
+from transfinite.budget import check, predict_factors
 from transfinite.ordinal import Ordinal
-from transfinite.ordinal_factors import OrdinalFactors
+from transfinite.ordinal_factors import OrdinalFactors, power_factors
 from transfinite.util import is_finite_ordinal
 
 
@@ -11,17 +12,7 @@ def subtract(a, b):
     if a <= b:
         raise ValueError("First argument must be greater than second argument")
 
-    if is_finite_ordinal(a):
-        return a - b
-
-    if is_finite_ordinal(b) or a.exponent > b.exponent:
-        return a
-
-    if a.exponent == b.exponent and a.copies == b.copies:
-        return subtract(a.addend, b.addend)
-
-    # Here we know that a.copies > b.copies
-    return Ordinal(a.exponent, a.copies - b.copies, a.addend)
+    return a - b
 
 
 def divide_terms_by_ordinal(terms, ordinal):
@@ -111,6 +102,8 @@ def factors(ordinal):
 
     Note: finite integers are not broken into prime factors.
     """
+    check(predict_factors, ordinal)
+
     terms = ordinal_terms(ordinal)
 
     # If the ordinal is a limit ordinal, it has the terms:
@@ -154,3 +147,180 @@ def factors(ordinal):
         terms = divide_terms_by_ordinal(terms, least_term)
 
     return OrdinalFactors(factors_)
+
+
+def factors_of_product(a_factors, b_factors):
+    """
+    Return the prime factors of a*b, given the prime factors of a and b.
+
+    Only the factors at the boundary of the two factorisations are
+    combined, so this is much cheaper than factorising a*b directly.
+    """
+    return a_factors * b_factors
+
+
+class FactorTracker:
+    """
+    The factors of a running sum x, updated as terms are added to it:
+
+      tracker = FactorTracker(w**3)
+      tracker += w**2 * 5       # x == w**3 + w**2*5
+      tracker += w + 1          # x == w**3 + w**2*5 + w + 1
+      tracker.factors()         # == factors(w**3 + w**2*5 + w + 1)
+
+    As in factors(), the prime factors of x, read from the last one
+    back, come from its pairs of consecutive infinite terms: the terms
+    w**a * c + w**b, where a > b, give the factors (c, 1) and
+    (w**(a-b) + 1, 1), for the difference a-b of their exponents (the
+    ordinal d with b + d == a, see subtract()). Only the least infinite
+    term and the finite part of x give other factors.
+
+    Adding t to x removes the terms of x less than t (or changes the
+    copies of a term equal to the leading term of t) and appends the
+    terms of t, so only the factors of the pairs at the end of x change.
+    The tracker keeps the factors of each pair, in reverse order, along
+    with the terms, so an addition costs time proportional to the number
+    of terms added and removed instead of to the size of x.
+
+    """
+    def __init__(self, ordinal=0):
+        # The infinite terms (exponent, copies) of x, in decreasing order
+        self._terms = []
+        self._finite = 0
+
+        # The grouped factors of the pairs of terms, from the last
+        # factor back, and for each term after the first, the length of
+        # that list and its last factor before the term was appended
+        self._pair_factors = []
+        self._saved = []
+
+        # The least length of self._pair_factors during the last addition
+        self._stable = 0
+
+        self._ordinal = None
+        self._factors = None
+        self.add(ordinal)
+
+    def _push(self, exponent, copies):
+        if self._terms:
+            upper_exponent, upper_copies = self._terms[-1]
+            pair = self._pair_factors
+            self._saved.append((len(pair), pair[-1] if pair else None))
+
+            term = Ordinal(subtract(upper_exponent, exponent), upper_copies)
+            for factor, power in reversed(factorise_term_successor(term)):
+                if pair and pair[-1][0] == factor:
+                    pair[-1] = (factor, pair[-1][1] + power)
+                else:
+                    pair.append((factor, power))
+
+        self._terms.append((exponent, copies))
+
+    def _pop(self):
+        self._terms.pop()
+        if self._terms:
+            length, last = self._saved.pop()
+            del self._pair_factors[length:]
+            self._stable = min(self._stable, length)
+            if length:
+                self._pair_factors[-1] = last
+
+    def add(self, t):
+        """
+        Update the tracker to x + t and return it.
+
+        """
+        self._stable = len(self._pair_factors)
+
+        if is_finite_ordinal(t):
+            if t:
+                self._finite += t
+                self._ordinal = self._factors = None
+            return self
+
+        self._finite = 0
+        while self._terms and self._terms[-1][0] < t.exponent:
+            self._pop()
+
+        if self._terms and self._terms[-1][0] == t.exponent:
+            self._terms[-1] = (t.exponent, self._terms[-1][1] + t.copies)
+            t = t.addend
+
+        while not is_finite_ordinal(t):
+            self._push(t.exponent, t.copies)
+            t = t.addend
+
+        self._finite = t
+        self._ordinal = self._factors = None
+        return self
+
+    def __iadd__(self, t):
+        return self.add(t)
+
+    @property
+    def ordinal(self):
+        """
+        The current value of x. As the terms of an Ordinal are a chain
+        from the leading term down, it is rebuilt after each addition in
+        time proportional to the number of terms of x.
+
+        """
+        if self._ordinal is None:
+            ordinal = self._finite
+            for exponent, copies in reversed(self._terms):
+                ordinal = Ordinal.unchecked(exponent, copies, ordinal)
+            self._ordinal = ordinal
+        return self._ordinal
+
+    def factors(self):
+        """
+        Return the prime factors of x, as factors(x) would.
+
+        The factors are built from scratch after each addition, in time
+        proportional to their number. To follow the factors along many
+        additions, use changed_factors() instead.
+
+        """
+        if self._factors is None:
+            self._factors = OrdinalFactors.unchecked(self._leading_factors(0))
+        return self._factors
+
+    def changed_factors(self):
+        """
+        Return the list of the first factors of x that may have changed
+        with the last addition. The factors of x after them are the same
+        as the last factors before it, so if the list has n fewer items
+        than factors(), factors() is the list followed by the last n
+        factors of x before the addition.
+
+        This takes time proportional to the number of changed factors,
+        like the addition itself.
+
+        """
+        return self._leading_factors(max(self._stable - 1, 0))
+
+    def _leading_factors(self, start):
+        """
+        Return the list of the factors of x, up to those of the pairs of
+        terms in self._pair_factors[start:].
+
+        """
+        if not self._terms:
+            raise ValueError("Finite ordinals are not factorised")
+
+        exponent, copies = self._terms[-1]
+
+        if self._finite:
+            factors_ = [(self._finite, 1)] if self._finite > 1 else []
+            factors_ += factorise_term_successor(Ordinal(exponent, copies))
+        else:
+            factors_ = power_factors(exponent)
+            if copies > 1:
+                factors_.append((copies, 1))
+
+        pair = self._pair_factors[start:][::-1]
+        if pair and factors_[-1][0] == pair[0][0]:
+            factor, power = factors_.pop()
+            pair[0] = (factor, power + pair[0][1])
+
+        return factors_ + pair
@@ -0,0 +1,114 @@
+from transfinite.ordinal import cnf_terms, from_cnf_terms
+from transfinite.util import is_finite_ordinal
+
+
+def hereditary(n, base):
+    """
+    Write the integer n in hereditary base notation and return the
+    ordinal obtained by replacing the base with w.
+
+    For example, in hereditary base 2:
+
+      35 == 2**(2**2 + 1) + 2 + 1
+
+    so hereditary(35, 2) == w**(w**w + 1) + w + 1.
+
+    """
+    terms = []
+    exponent = 0
+
+    while n:
+        n, digit = divmod(n, base)
+        if digit:
+            terms.append((hereditary(exponent, base), digit))
+        exponent += 1
+
+    terms.reverse()
+    return from_cnf_terms(terms)
+
+
+def evaluate(ordinal, base):
+    """
+    Return the integer obtained by replacing w with base in the ordinal.
+
+    This is the inverse of hereditary(). Note that the integer can be
+    extremely large even for small ordinals and bases.
+
+    """
+    if is_finite_ordinal(ordinal):
+        return ordinal
+
+    return sum(
+        copies * base ** evaluate(exponent, base)
+        for exponent, copies in cnf_terms(ordinal)
+    )
+
+
+def decrement(ordinal, base):
+    """
+    Return the hereditary base representation of evaluate(ordinal, base) - 1.
+
+    This works on the ordinal directly, without evaluating it. Only the
+    least term w**x*c changes, using:
+
+      base**x - 1 == base**(x - 1)*(base - 1) + ... + base*(base - 1) + (base - 1)
+
+    where each x - 1 is itself computed by decrement().
+
+    """
+    terms = cnf_terms(ordinal)
+    exponent, copies = terms.pop()
+
+    if copies > 1:
+        terms.append((exponent, copies - 1))
+
+    while exponent != 0:
+        exponent = decrement(exponent, base)
+        terms.append((exponent, base - 1))
+
+    return from_cnf_terms(terms)
+
+
+def goodstein_from(ordinal, base):
+    """
+    Lazily yield the (base, ordinal) pairs of a Goodstein sequence,
+    starting from the given ordinal in hereditary base notation.
+
+    Each yielded pair is a checkpoint: passing it back to this function
+    resumes the sequence from that point.
+
+    """
+    while True:
+        yield base, ordinal
+
+        if ordinal == 0:
+            return
+
+        # Replacing the base by base + 1 leaves the ordinal unchanged,
+        # so only the subtraction of 1 needs to be computed.
+        base += 1
+        ordinal = decrement(ordinal, base)
+
+
+def goodstein(n, base=2):
+    """
+    Lazily yield the (base, ordinal) pairs of the Goodstein sequence of
+    the integer n. The integer values of the sequence are given by
+    evaluate(ordinal, base).
+
+    The ordinals are strictly decreasing, which is why the sequence
+    always reaches 0. For example, goodstein(3) yields the ordinals:
+
+      w + 1, w, 3, 2, 1, 0
+
+    """
+    return goodstein_from(hereditary(n, base), base)
+
+
+def goodstein_values(n, base=2):
+    """
+    Lazily yield the integer values of the Goodstein sequence of n.
+
+    """
+    for base_, ordinal in goodstein(n, base):
+        yield evaluate(ordinal, base_)
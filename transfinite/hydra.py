@@ -0,0 +1,207 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice, repeat
+
+from transfinite.natural import merge_terms
+from transfinite.ordinal import cnf_terms, from_cnf_terms
+
+
+class HydraNode:
+    """
+    A node of a hydra (a rooted tree).
+
+    Each node caches the ordinal of the subtree rooted at it, which is
+    the natural sum of w**x over the ordinals x of its children. A leaf
+    therefore has ordinal 0 and a node with k leaves as children has
+    ordinal k.
+
+    """
+    def __init__(self, children=()):
+        self.parent = None
+        self.children = []
+        for child in children:
+            child.parent = self
+            self.children.append(child)
+        self.ordinal = 0
+        self.update_ordinal()
+
+    def update_ordinal(self):
+        """
+        Recompute the ordinal of this node from the cached ordinals of
+        its children.
+
+        """
+        self.ordinal = from_cnf_terms(
+            merge_terms([[(child.ordinal, 1)] for child in self.children])
+        )
+
+    def copy(self):
+        """
+        Return a copy of the subtree rooted at this node, reusing the
+        cached ordinals rather than recomputing them.
+
+        """
+        node = HydraNode.__new__(HydraNode)
+        node.parent = None
+        node.children = []
+        for child in self.children:
+            child_copy = child.copy()
+            child_copy.parent = node
+            node.children.append(child_copy)
+        node.ordinal = self.ordinal
+        return node
+
+    def is_head(self):
+        return not self.children and self.parent is not None
+
+    def __repr__(self):
+        return f"HydraNode({self.children!r})" if self.children else "HydraNode()"
+
+
+def node_from_ordinal(ordinal):
+    """
+    Return the tree whose root node has the given ordinal.
+
+    """
+    children = []
+
+    for exponent, copies in cnf_terms(ordinal):
+        child = node_from_ordinal(exponent)
+        children.append(child)
+        children.extend(child.copy() for _ in range(copies - 1))
+
+    return HydraNode(children)
+
+
+class Hydra:
+    """
+    A hydra in the Kirby-Paris hydra game.
+
+    At step n, Hercules chops off a head (a leaf other than the root).
+    If the head's parent is not the root, the parent's subtree (with the
+    head removed) grows n new copies from the grandparent. The ordinal
+    of the hydra strictly decreases with every chop, so Hercules always
+    wins, whatever heads he chooses.
+
+    After a chop, only the ordinals of the nodes between the chopped
+    head and the root are recomputed.
+
+    """
+    def __init__(self, root=None):
+        self.root = HydraNode() if root is None else root
+
+    @classmethod
+    def from_ordinal(cls, ordinal):
+        return cls(node_from_ordinal(ordinal))
+
+    @property
+    def ordinal(self):
+        return self.root.ordinal
+
+    def is_dead(self):
+        return not self.root.children
+
+    def heads(self):
+        """
+        Yield the heads of the hydra, from left to right.
+
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.is_head():
+                yield node
+            stack.extend(reversed(node.children))
+
+    def chop(self, head, n):
+        """
+        Chop off the head, with n copies of its parent's subtree
+        regrowing from its grandparent.
+
+        """
+        if not head.is_head():
+            raise ValueError("Only a leaf other than the root can be chopped")
+
+        parent = head.parent
+        parent.children.remove(head)
+        parent.update_ordinal()
+
+        grandparent = parent.parent
+
+        if grandparent is not None:
+            for _ in range(n):
+                node = parent.copy()
+                node.parent = grandparent
+                grandparent.children.append(node)
+            parent = grandparent
+
+        while parent is not None:
+            parent.update_ordinal()
+            parent = parent.parent
+
+    def battle(self, strategy, start=1):
+        """
+        Lazily fight the hydra, yielding its ordinal after each chop.
+
+        The strategy is a function taking the hydra and returning the
+        head to chop. The first chop is step `start`, which is also the
+        number of copies regrown.
+
+        """
+        for n in count(start):
+            if self.is_dead():
+                return
+            self.chop(strategy(self), n)
+            yield self.ordinal
+
+
+def rightmost_head(hydra):
+    """
+    Strategy choosing the head reached by always taking the last child.
+
+    """
+    node = hydra.root
+    while node.children:
+        node = node.children[-1]
+    return node
+
+
+def leftmost_head(hydra):
+    """
+    Strategy choosing the head reached by always taking the first child.
+
+    """
+    node = hydra.root
+    while node.children:
+        node = node.children[0]
+    return node
+
+
+def battle_length(ordinal, strategy, max_steps=None):
+    """
+    Return the number of chops needed to kill the hydra with the given
+    ordinal, or None if it is still alive after max_steps chops.
+
+    """
+    hydra = Hydra.from_ordinal(ordinal)
+    steps = sum(1 for _ in islice(hydra.battle(strategy), max_steps))
+    return steps if hydra.is_dead() else None
+
+
+def battle_lengths(ordinals, strategy, max_steps=None, processes=None):
+    """
+    Return battle_length() for each ordinal, fighting the battles in
+    parallel in a pool of processes.
+
+    The strategy must be picklable (e.g. a module-level function). If
+    processes is 1 the battles are fought in the current process.
+
+    """
+    ordinals = list(ordinals)
+
+    if processes == 1:
+        return [battle_length(a, strategy, max_steps) for a in ordinals]
+
+    with ProcessPoolExecutor(processes) as executor:
+        return list(
+            executor.map(battle_length, ordinals, repeat(strategy), repeat(max_steps))
+        )
@@ -0,0 +1,271 @@
+import operator
+from itertools import count
+from threading import Lock
+from weakref import WeakValueDictionary
+
+from transfinite.factorisation import factors
+from transfinite.ordinal import Ordinal, is_ordinal
+
+OPERATIONS = {"+": operator.add, "*": operator.mul, "**": operator.pow}
+
+_UNSET = object()
+
+# Every expression that exists is in this table, keyed by its operation
+# and the ids of its arguments (or its value, for a constant), so that
+# building an identical expression returns the existing one
+_table = WeakValueDictionary()
+_table_lock = Lock()
+_ids = count()
+
+
+class Expr:
+    """
+    An ordinal expression that is evaluated only when needed.
+
+    Expressions are built from ordinals with lazy() and combined with
+    +, * and **, recording a directed acyclic graph instead of
+    computing anything. Identical subexpressions are the same node, and
+    the value of each node is computed at most once, when value(), a
+    comparison or factors() is first called on an expression using it.
+
+    Some identities are applied as the graph is built:
+
+      n + a == a          (n finite, a known to be infinite)
+      a + 0 == a,  0 + a == a
+      a * 1 == a,  1 * a == a,  a * 0 == 0 * a == 0
+      a ** 0 == 1, a ** 1 == a, 1 ** a == 1
+      (x ** a) ** b == x ** (a * b)
+      (x ** a) * (x ** b) == x ** (a + b)   (and x * x == x ** 2)
+
+    where a constant w**a counts as w ** a, and sums and products of
+    finite constants are computed.
+
+    """
+    __slots__ = ("op", "args", "id", "infinite", "_value", "__weakref__")
+
+    def __init__(self, op, args, node_id, value=_UNSET):
+        # Expressions are created by lazy() and the operators, through
+        # _node(), which gives each distinct expression one instance
+        self.op = op
+        self.args = args
+        self.id = node_id
+        self._value = value
+        self.infinite = _is_infinite(op, args, value)
+
+    def value(self):
+        """
+        Return the ordinal the expression evaluates to.
+
+        The graph is evaluated with an explicit stack, so deeply nested
+        expressions do not hit the recursion limit: a node is evaluated
+        only once all of its arguments are.
+
+        """
+        stack = [self]
+
+        while self._value is _UNSET:
+            node = stack[-1]
+            pending = [arg for arg in node.args if not arg.is_evaluated()]
+            if pending:
+                stack.extend(pending)
+            elif node is not self:
+                node.value()
+                stack.pop()
+            else:
+                self._value = OPERATIONS[self.op](*(arg.value() for arg in self.args))
+
+        return self._value
+
+    def is_evaluated(self):
+        return self._value is not _UNSET
+
+    def factors(self):
+        return factors(self.value())
+
+    def is_constant(self):
+        return self.op is None
+
+    def __add__(self, other):
+        other = lazy(other)
+        return NotImplemented if other is NotImplemented else _add(self, other)
+
+    def __radd__(self, other):
+        other = lazy(other)
+        return NotImplemented if other is NotImplemented else _add(other, self)
+
+    def __mul__(self, other):
+        other = lazy(other)
+        return NotImplemented if other is NotImplemented else _mul(self, other)
+
+    def __rmul__(self, other):
+        other = lazy(other)
+        return NotImplemented if other is NotImplemented else _mul(other, self)
+
+    def __pow__(self, other):
+        other = lazy(other)
+        return NotImplemented if other is NotImplemented else _pow(self, other)
+
+    def __rpow__(self, other):
+        other = lazy(other)
+        return NotImplemented if other is NotImplemented else _pow(other, self)
+
+    def _compare(self, other, op):
+        if isinstance(other, Expr):
+            other = other.value()
+        elif not is_ordinal(other):
+            return NotImplemented
+        return op(self.value(), other)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return self._compare(other, operator.eq)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __hash__(self):
+        return hash(self.value())
+
+    def __str__(self):
+        if self.op is None:
+            return str(self._value)
+        return f"{_operand(self.args[0])}{self.op}{_operand(self.args[1])}"
+
+    def __repr__(self):
+        if self.op is None:
+            return f"lazy({self._value!r})"
+        return f"Expr({self})"
+
+
+def _operand(expr):
+    if expr.is_constant() and (isinstance(expr.value(), int) or expr.value() == Ordinal()):
+        return str(expr)
+    return f"({expr})"
+
+
+def _node(op, args, value=_UNSET):
+    """
+    Return the expression with the operation and arguments (or the
+    constant value), creating it only if it does not already exist.
+
+    """
+    key = (op, value) if op is None else (op,) + tuple(arg.id for arg in args)
+
+    with _table_lock:
+        node = _table.get(key)
+        if node is None:
+            node = Expr(op, args, next(_ids), value)
+            _table[key] = node
+
+    return node
+
+
+def lazy(a):
+    """
+    Return the constant expression for the ordinal a. An expression is
+    returned unchanged, and NotImplemented is returned for anything
+    else.
+
+    """
+    if isinstance(a, Expr):
+        return a
+    if not is_ordinal(a):
+        return NotImplemented
+    return _node(None, (), a)
+
+
+def _constant(expr, value):
+    # Compare with == only for constants of the same type, so that
+    # a constant Ordinal is never compared with an int
+    return expr.is_constant() and type(expr.value()) is type(value) and expr.value() == value
+
+
+def _is_infinite(op, args, value):
+    """
+    Return True if the expression is certainly infinite, judging from
+    its structure (and whether its arguments are) without evaluating it.
+
+    """
+    if op is None:
+        return isinstance(value, Ordinal)
+    a, b = args
+    if op == "+":
+        return a.infinite or b.infinite
+    if op == "*":
+        return a.infinite and b.infinite
+    if a.infinite:
+        return b.infinite or b.is_constant() and b.value() != 0
+    return a.is_constant() and a.value() > 1 and b.infinite
+
+
+def _finite_constants(a, b):
+    return (
+        a.is_constant() and isinstance(a.value(), int)
+        and b.is_constant() and isinstance(b.value(), int)
+    )
+
+
+def _add(a, b):
+    if _constant(b, 0):
+        return a
+    if _constant(a, 0):
+        return b
+    if _finite_constants(a, b):
+        return lazy(a.value() + b.value())
+    if a.is_constant() and isinstance(a.value(), int) and b.infinite:
+        return b
+    return _node("+", (a, b))
+
+
+def _split_power(expr):
+    """
+    Return (x, e) such that the expression is x ** e, with a constant
+    w**e written as w ** e.
+
+    """
+    if expr.op == "**":
+        return expr.args
+    if expr.is_constant() and isinstance(expr.value(), Ordinal):
+        a = expr.value()
+        if a.copies == 1 and a.addend == 0 and a.exponent != 1:
+            return lazy(Ordinal()), lazy(a.exponent)
+    return expr, lazy(1)
+
+
+def _mul(a, b):
+    if _constant(a, 0) or _constant(b, 0):
+        return lazy(0)
+    if _constant(b, 1):
+        return a
+    if _constant(a, 1):
+        return b
+    if _finite_constants(a, b):
+        return lazy(a.value() * b.value())
+
+    x, e = _split_power(a)
+    y, f = _split_power(b)
+    if x is y:
+        return _pow(x, _add(e, f))
+
+    return _node("*", (a, b))
+
+
+def _pow(a, b):
+    if _constant(b, 0) or _constant(a, 1):
+        return lazy(1)
+    if _constant(b, 1):
+        return a
+    x, e = _split_power(a)
+    if not _constant(e, 1):
+        return _pow(x, _mul(e, b))
+    return _node("**", (a, b))
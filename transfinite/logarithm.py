@@ -0,0 +1,179 @@
+from transfinite.ordinal import Ordinal, cnf_terms, from_cnf_terms
+from transfinite.util import is_finite_ordinal
+
+
+def integer_log(n, base):
+    """
+    Return the pair (k, base**k) where k is the largest integer such
+    that base**k <= n.
+
+    """
+    k, power = 0, 1
+    while power * base <= n:
+        power *= base
+        k += 1
+    return k, power
+
+
+def log_divmod(a, base):
+    """
+    Return the ordinals (q, r, s) such that:
+
+      a == base**q * r + s
+
+    where 0 < r < base and s < base**q. The exponent q is the greatest
+    ordinal such that base**q <= a.
+
+    The exponent is computed from the leading exponents of a and base,
+    rather than by searching over powers of base:
+
+      * if base == w, q is the leading exponent of a
+      * if base == n is finite, then n**(w*x + k) == w**x * n**k, so
+        q == w*x + k where x is the leading exponent of a and k is the
+        integer logarithm of the leading copies of a
+      * otherwise base**q has leading exponent (base.exponent * q), so q
+        is found by left division of a.exponent by base.exponent
+
+    The coefficient r and remainder s then follow from left division
+    of a by base**q.
+
+    """
+    if a == 0:
+        raise ValueError("Logarithm of 0 is not defined")
+
+    if base in (0, 1):
+        raise ValueError("Base must be greater than 1")
+
+    if a < base:
+        return 0, a, 0
+
+    if is_finite_ordinal(a):
+        q, power = integer_log(a, base)
+
+    elif base == Ordinal():
+        q, power = a.exponent, Ordinal(a.exponent)
+
+    elif is_finite_ordinal(base):
+        k, coefficient = integer_log(a.copies, base)
+        q = Ordinal() * a.exponent + k
+        power = Ordinal(a.exponent, coefficient)
+
+    else:
+        q, excess = divmod(a.exponent, base.exponent)
+        power = base ** q
+
+        # When the leading exponents are equal, base**q might exceed a
+        # (e.g. a == w*2 and base == w + 1) and the predecessor of q is
+        # needed instead. This can only happen when q is a successor.
+        if excess == 0 and power > a:
+            limit, finite = divmod(q, Ordinal())
+            q = Ordinal() * limit + (finite - 1)
+            power = base ** q
+
+    r, s = divmod(a, power)
+    return q, r, s
+
+
+def log(a, base=None):
+    """
+    Return the greatest ordinal q such that base**q <= a.
+
+    If base is not given, it defaults to w so the result is the
+    greatest exponent e such that w**e <= a.
+
+    """
+    if base is None:
+        base = Ordinal()
+
+    return log_divmod(a, base)[0]
+
+
+def _digits(n, base):
+    """
+    Yield the pairs (k, d) of the nonzero digits d of n in the base,
+    where d is the digit of base**k, from the most significant.
+
+    """
+    digits = []
+    k = 0
+    while n:
+        n, d = divmod(n, base)
+        if d:
+            digits.append((k, d))
+        k += 1
+    return reversed(digits)
+
+
+def to_base(a, base):
+    """
+    Return the base normal form of the ordinal a as a list of pairs
+    (e, c) such that:
+
+      a == base**e1 * c1 + base**e2 * c2 + ...
+
+    where e1 > e2 > ... and 0 < c < base, for any base > 1.
+
+    For a finite base or a power of w, the terms are read directly
+    from the terms of a:
+
+      * if base == n is finite, a term w**x * c of a is the sum of the
+        terms n**(w*x + k) * d for the digits d of c in base n, since
+        n**(w*x + k) == w**x * n**k
+      * if base == w**y, a term w**x * c of a has x == y*q + z with
+        z < y, by left division, and is part of base**q * r where r is
+        the sum of the w**z * c for the terms of a with the same q
+
+    Other bases are handled by repeated calls to log_divmod().
+
+    """
+    if base in (0, 1):
+        raise ValueError("Base must be greater than 1")
+
+    terms = []
+
+    if is_finite_ordinal(base):
+        for exponent, copies in cnf_terms(a):
+            limit = Ordinal() * exponent
+            terms.extend((limit + k, d) for k, d in _digits(copies, base))
+
+    elif base.copies == 1 and base.addend == 0:
+        for exponent, copies in cnf_terms(a):
+            q, z = divmod(exponent, base.exponent)
+            if terms and terms[-1][0] == q:
+                terms[-1][1].append((z, copies))
+            else:
+                terms.append((q, [(z, copies)]))
+
+        terms = [(q, from_cnf_terms(parts)) for q, parts in terms]
+
+    else:
+        while a != 0:
+            q, r, a = log_divmod(a, base)
+            terms.append((q, r))
+
+    return terms
+
+
+def from_base(terms, base):
+    """
+    Return the ordinal with the base normal form given by the list of
+    pairs (e, c), as returned by to_base().
+
+    """
+    if base in (0, 1):
+        raise ValueError("Base must be greater than 1")
+
+    a = 0
+    previous = None
+
+    # Sum from the least term, so that each addition only copies the
+    # terms of the new term and not of the sum so far
+    for exponent, copies in reversed(terms):
+        if previous is not None and exponent <= previous:
+            raise ValueError("Exponents must be in decreasing order")
+        if not 0 < copies < base:
+            raise ValueError("Coefficients must be greater than 0 and less than the base")
+        a = base**exponent * copies + a
+        previous = exponent
+
+    return a
@@ -0,0 +1,72 @@
+from heapq import merge
+from operator import itemgetter
+
+from transfinite.ordinal import cnf_terms, from_cnf_terms
+
+
+def merge_terms(term_sequences):
+    """
+    Merge sequences of (exponent, copies) pairs, each in descending order
+    of exponent, into one such list, adding the copies of equal exponents.
+
+    """
+    merged = []
+
+    for exponent, copies in merge(*term_sequences, key=itemgetter(0), reverse=True):
+        if merged and merged[-1][0] == exponent:
+            merged[-1] = (exponent, merged[-1][1] + copies)
+        else:
+            merged.append((exponent, copies))
+
+    return merged
+
+
+def natural_sum(*ordinals):
+    """
+    Return the natural (Hessenberg) sum of the ordinals.
+
+    Unlike ordinary addition, the natural sum is commutative: the terms
+    of every ordinal are kept and terms with the same exponent have
+    their copies added together. For example, the natural sum of w + 1
+    and w**2 + w*3 is w**2 + w*4 + 1.
+
+    The terms of all the ordinals are merged in a single pass.
+
+    """
+    return from_cnf_terms(merge_terms([cnf_terms(a) for a in ordinals]))
+
+
+def _natural_product_terms(a_terms, b_terms):
+    """
+    Return the terms of the natural product of two ordinals, given their
+    terms.
+
+    Each term w**x*c of the first ordinal multiplied by the terms w**y*d
+    of the second gives the sequence of terms w**(x # y)*(c*d), which is
+    already in descending order of exponent, so all that is needed is to
+    merge these sequences.
+
+    """
+    sequences = [
+        [(natural_sum(x, y), c * d) for y, d in b_terms]
+        for x, c in a_terms
+    ]
+    return merge_terms(sequences)
+
+
+def natural_product(*ordinals):
+    """
+    Return the natural (Hessenberg) product of the ordinals.
+
+    The natural product is commutative and distributes over the natural
+    sum, with the product of w**x and w**y being w**(x # y), where #
+    denotes the natural sum. For example, the natural product of w + 1
+    with itself is w**2 + w*2 + 1.
+
+    """
+    terms = [(0, 1)]
+
+    for a in ordinals:
+        terms = _natural_product_terms(terms, cnf_terms(a))
+
+    return from_cnf_terms(terms)
@@ -1,6 +1,7 @@
 from functools import total_ordering
 
-from transfinite.util import is_finite_ordinal, as_latex, exp_by_squaring
+from transfinite.budget import Size, check, predict_add, predict_mul, predict_pow
+from transfinite.util import is_finite_ordinal, iter_str, truncated_latex
 
 
 class OrdinalConstructionError(Exception):
@@ -25,6 +26,15 @@ class Ordinal:
 
     """
 
+    # Ordinals are treated as immutable, so the hash, and the sort key
+    # and strings (see cached()), are computed at most once and shared
+    # by every ordinal using this one as a key or an exponent. They are
+    # only stored on the instance once computed, so building an ordinal
+    # costs no more than setting its three fields. No object hashes to
+    # -1, so it marks a hash not yet computed
+    _hash = -1
+    _cache = None
+
     def __init__(self, exponent=1, copies=1, addend=0):
 
         if exponent == 0 or not is_ordinal(exponent):
@@ -43,6 +53,72 @@ class Ordinal:
         self.copies = copies
         self.addend = addend
 
+    @classmethod
+    def unchecked(cls, exponent=1, copies=1, addend=0):
+        """
+        Return the ordinal w**exponent * copies + addend without
+        checking that the arguments form a valid normal form.
+
+        This skips the comparison of exponents done by the constructor,
+        for code (such as decoders and random generators) that builds
+        ordinals from terms already known to be in decreasing order.
+
+        """
+        ordinal = cls.__new__(cls)
+        ordinal.exponent = exponent
+        ordinal.copies = copies
+        ordinal.addend = addend
+        return ordinal
+
+    @property
+    def size(self):
+        """
+        The budget.Size of the ordinal: its number of terms, the height
+        of its tower of exponents and the largest bit length of an
+        integer in it, computed on first use and cached.
+
+        """
+        size = self.cached("size")
+        if size is None:
+            chain = []
+            a = self
+            while isinstance(a, Ordinal) and a.cached("size") is None:
+                chain.append(a)
+                a = a.addend
+            for a in reversed(chain):
+                size = a.cached("size", _size)
+        return size
+
+    def cached(self, key, compute=None):
+        """
+        Return the value cached on the ordinal under the key, such as
+        "str" or "latex". If nothing is cached and compute is given, the
+        value compute(self) is cached and returned, otherwise None.
+
+        The value is computed before it is stored, so threads racing to
+        fill the cache at worst compute the same value twice and need no
+        lock.
+
+        """
+        cache = self._cache
+        value = None if cache is None else cache.get(key)
+        if value is None and compute is not None:
+            value = compute(self)
+            if cache is None:
+                cache = self._cache = {}
+            cache[key] = value
+        return value
+
+    def order_key(self):
+        """
+        Return the sort key of the ordinal (see ordinal.order_key()),
+        computed once and cached.
+
+        """
+        return self.cached("order_key", lambda a: tuple(
+            (order_key(exponent), copies) for exponent, copies in cnf_terms(a)
+        ))
+
     def is_limit(self):
         """
         Return true if ordinal is a limit ordinal.
@@ -91,69 +167,145 @@ class Ordinal:
         """
         return self.copies == 1 and self.addend == 1 or self.is_delta()
 
-    def _repr_latex_(self):
-        return f"${as_latex(self)}$"
+    def predecessor(self):
+        """
+        Return the ordinal a such that a + 1 is this successor ordinal.
 
-    def __repr__(self):
-        return str(self)
+        """
+        if self.is_limit():
+            raise ValueError("Limit ordinals do not have a predecessor")
 
-    def __str__(self):
-        term = "w"
+        terms = cnf_terms(self)
+        _, finite = terms.pop()
+        terms.append((0, finite - 1))
+        return from_cnf_terms(terms)
 
-        # Only use parentheses for exponent if finite and greater than 1,
-        # or its addend is nonzero or its copies is greater than 1.
+    def fundamental(self, n):
+        """
+        Return the n-th element of the standard fundamental sequence
+        of this limit ordinal:
 
-        if self.exponent == 1:
-            pass
+          (a + w**(b + 1))[n] == a + w**b*n
+          (a + w**c)[n]       == a + w**(c[n])     (c a limit ordinal)
 
-        elif (
-            is_finite_ordinal(self.exponent)
-            or self.exponent.copies == 1
-            and self.exponent.addend == 0
-        ):
-            term += f"**{self.exponent}"
+        Only the least term of the ordinal changes, and the exponents
+        of the other terms are shared with the result.
+
+        """
+        if not self.is_limit():
+            raise ValueError("Only limit ordinals have fundamental sequences")
+
+        terms = cnf_terms(self)
+        exponent, copies = terms.pop()
+
+        if copies > 1:
+            terms.append((exponent, copies - 1))
+
+        if is_finite_ordinal(exponent):
+            if n:
+                terms.append((exponent - 1, n))
+
+        elif exponent.is_successor():
+            if n:
+                terms.append((exponent.predecessor(), n))
 
         else:
-            term += f"**({self.exponent})"
+            terms.append((exponent.fundamental(n), 1))
+
+        return from_cnf_terms(terms)
 
-        if self.copies != 1:
-            term += f"*{self.copies}"
+    def _repr_latex_(self):
+        return f"${truncated_latex(self)}$"
 
-        if self.addend != 0:
-            term += f" + {self.addend}"
+    def __repr__(self):
+        return str(self)
 
-        return term
+    def __str__(self):
+        return self.cached("str", lambda a: "".join(iter_str(a, cache=True)))
 
     def __hash__(self):
-        return hash(self.as_tuple())
+        if self._hash == -1:
+            # Hash the terms from the last one up, so that hashing an
+            # ordinal with many terms does not recurse along its addends
+            chain = []
+            a = self
+            while isinstance(a, Ordinal) and a._hash == -1:
+                chain.append(a)
+                a = a.addend
+            for a in reversed(chain):
+                a._hash = hash((a.exponent, a.copies, a.addend))
+        return self._hash
 
     def __eq__(self, other):
-        if isinstance(other, Ordinal):
-            return self.as_tuple() == other.as_tuple()
-        return False
-
-    def __lt__(self, other):
-        if isinstance(other, Ordinal):
-            return self.as_tuple() < other.as_tuple()
         if is_finite_ordinal(other):
             return False
-        return NotImplemented
+        if not isinstance(other, Ordinal):
+            return NotImplemented
+        a, b = self, other
+        while isinstance(a, Ordinal) and isinstance(b, Ordinal):
+            if a is b:
+                return True
+            if a.exponent != b.exponent or a.copies != b.copies:
+                return False
+            a, b = a.addend, b.addend
+        return a == b
+
+    def __lt__(self, other):  # pylint: disable=too-many-return-statements
+        if is_finite_ordinal(other):
+            return False
+        if not isinstance(other, Ordinal):
+            return NotImplemented
+
+        # Compare (exponent, copies) term by term, as for as_tuple()
+        a, b = self, other
+        while isinstance(a, Ordinal) and isinstance(b, Ordinal):
+            if a is b:
+                return False
+            if a.exponent != b.exponent:
+                return a.exponent < b.exponent
+            if a.copies != b.copies:
+                return a.copies < b.copies
+            a, b = a.addend, b.addend
+
+        if isinstance(a, Ordinal):
+            return False
+        if isinstance(b, Ordinal):
+            return True
+        return a < b
 
     def __add__(self, other):
 
         if not is_ordinal(other):
             return NotImplemented
 
-        # (w**a*b + c) + x == w**a*b + (c + x)
-        if is_finite_ordinal(other) or self.exponent > other.exponent:
-            return Ordinal(self.exponent, self.copies, self.addend + other)
+        check(predict_add, self, other)
+
+        # (w**a*b + c) + x == w**a*b + (c + x) while a is greater than the
+        # leading exponent of x. The terms are collected in a loop rather
+        # than by recursion, so that ordinals with many terms can be added
+        lead = 0 if is_finite_ordinal(other) else other.exponent
+        terms = []
+        a = self
+
+        while isinstance(a, Ordinal) and a.exponent > lead:
+            terms.append((a.exponent, a.copies))
+            a = a.addend
 
         # (w**a*b + c) + (w**a*d + e) == w**a*(b + d) + e
-        if self.exponent == other.exponent:
-            return Ordinal(self.exponent, self.copies + other.copies, other.addend)
+        if isinstance(a, Ordinal) and a.exponent == lead:
+            total = Ordinal.unchecked(lead, a.copies + other.copies, other.addend)
+
+        elif is_finite_ordinal(other):
+            total = a + other
 
-        # other is strictly greater than self
-        return other
+        # other is strictly greater than the remaining terms
+        else:
+            total = other
+
+        for exponent, copies in reversed(terms):
+            total = Ordinal.unchecked(exponent, copies, total)
+
+        return total
 
     def __radd__(self, other):
 
@@ -163,11 +315,51 @@ class Ordinal:
         # n + a == a
         return self
 
+    def __sub__(self, other):
+
+        if not is_ordinal(other):
+            return NotImplemented
+
+        # (x + a) - (x + b) == a - b, so skip the terms both ordinals share
+        a, b = self, other
+        while (
+            isinstance(a, Ordinal)
+            and isinstance(b, Ordinal)
+            and a.exponent == b.exponent
+            and a.copies == b.copies
+        ):
+            a, b = a.addend, b.addend
+
+        if is_finite_ordinal(a):
+            if is_finite_ordinal(b) and b <= a:
+                return a - b
+            raise ValueError("Cannot subtract an ordinal from a smaller ordinal")
+
+        # b + a == a when b < w**a.exponent
+        if is_finite_ordinal(b) or a.exponent > b.exponent:
+            return a
+
+        # (w**x*(e + c) + d) - (w**x*e + f) == w**x*c + d
+        if a.exponent == b.exponent and a.copies > b.copies:
+            return Ordinal(a.exponent, a.copies - b.copies, a.addend)
+
+        raise ValueError("Cannot subtract an ordinal from a smaller ordinal")
+
+    def __rsub__(self, other):
+
+        if not is_finite_ordinal(other):
+            return NotImplemented
+
+        # n < a for every infinite ordinal a
+        raise ValueError("Cannot subtract an ordinal from a smaller ordinal")
+
     def __mul__(self, other):
 
         if not is_ordinal(other):
             return NotImplemented
 
+        check(predict_mul, self, other)
+
         if other == 0:
             return 0
 
@@ -175,11 +367,11 @@ class Ordinal:
         if is_finite_ordinal(other):
             return Ordinal(self.exponent, self.copies * other, self.addend)
 
-        # (w**a*b + c) * (w**x*y + z) == w**(a + x)*y + (c*z + (w**a*b + c)*z)
+        # (w**a*b + c) * (w**x*y + z) == w**(a + x)*y + (w**a*b + c)*z
         return Ordinal(
             self.exponent + other.exponent,
             other.copies,
-            self.addend * other.addend + self * other.addend,
+            self * other.addend,
         )
 
     def __rmul__(self, other):
@@ -190,20 +382,81 @@ class Ordinal:
         if other == 0:
             return 0
 
+        check(predict_mul, other, self)
+
         # n * (w**a*b + c) == w**a*b + (n*c)
         return Ordinal(self.exponent, self.copies, other * self.addend)
 
+    def __divmod__(self, other):
+
+        if not is_ordinal(other):
+            return NotImplemented
+
+        return left_divmod(self, other)
+
+    def __rdivmod__(self, other):
+
+        if not is_finite_ordinal(other):
+            return NotImplemented
+
+        return left_divmod(other, self)
+
+    def __floordiv__(self, other):
+
+        if not is_ordinal(other):
+            return NotImplemented
+
+        return left_divmod(self, other)[0]
+
+    def __rfloordiv__(self, other):
+
+        if not is_finite_ordinal(other):
+            return NotImplemented
+
+        return left_divmod(other, self)[0]
+
+    def __mod__(self, other):
+
+        if not is_ordinal(other):
+            return NotImplemented
+
+        return left_divmod(self, other)[1]
+
+    def __rmod__(self, other):
+
+        if not is_finite_ordinal(other):
+            return NotImplemented
+
+        return left_divmod(other, self)[1]
+
     def __pow__(self, other):
 
         if not is_ordinal(other):
             return NotImplemented
 
-        # Finite powers are computed using repeated multiplication
-        if is_finite_ordinal(other):
-            return exp_by_squaring(self, other)
+        check(predict_pow, self, other)
 
-        # (w**a*b + c) ** (w**x*y + z) == (w**(a * w**x * y)) * (w**a*b + c)**z
-        return Ordinal(self.exponent * Ordinal(other.exponent, other.copies)) * self**other.addend
+        # a**(b + n) == a**b * a**n, where b is the limit part and n the
+        # finite part of the exponent
+        limit_terms = cnf_terms(other)
+        n = limit_terms.pop()[1] if limit_terms and limit_terms[-1][0] == 0 else 0
+
+        power_terms = _finite_power_terms(self, n)
+
+        if not limit_terms:
+            return _from_normal_terms(power_terms)
+
+        # a**(w**x*y) == w**(self.exponent * w**x*y) and
+        # self.exponent * w**x == w**(self.exponent.exponent + x)
+        # (or just w**x if self.exponent is finite), so a**b is w**g with
+        # g computed term by term
+        alpha = self.exponent
+        if isinstance(alpha, Ordinal):
+            limit_terms = [(alpha.exponent + x, y) for x, y in limit_terms]
+        gamma = _from_normal_terms(limit_terms)
+
+        # w**g * a**n adds g to every exponent of a**n
+        return _from_normal_terms([(gamma + e, c) for e, c in power_terms])
 
     def __rpow__(self, other):
 
@@ -214,16 +467,17 @@ class Ordinal:
         if other in (0, 1):
             return other
 
-        # n**(w*c + a) == (w**c) * (n**a)
-        if self.exponent == 1:
-            return Ordinal(self.copies, other ** self.addend)
-
-        # n**(w**m*c + a) == w**(w**(m-1) * c) * n**a
-        if is_finite_ordinal(self.exponent):
-            return Ordinal(Ordinal(self.exponent - 1, self.copies)) * other**self.addend
+        check(predict_pow, other, self)
 
-        # n**(w**a*c + b) == w**(w**a*c) * n**b
-        return Ordinal(Ordinal(self.exponent, self.copies)) * other**self.addend
+        # n**(w**x*y) == w**(w**(x-1)*y) for finite x, and w**(w**x*y)
+        # for infinite x, so n**(b + m) == w**g * n**m with g computed
+        # term by term from the limit part b
+        terms = cnf_terms(self)
+        m = terms.pop()[1] if terms[-1][0] == 0 else 0
+        gamma = _from_normal_terms(
+            [(x - 1 if is_finite_ordinal(x) else x, y) for x, y in terms]
+        )
+        return Ordinal.unchecked(gamma, other ** m)
 
     def as_tuple(self):
         """
@@ -239,3 +493,206 @@ def is_ordinal(a):
 
     """
     return is_finite_ordinal(a) or isinstance(a, Ordinal)
+
+
+def cnf_terms(a):
+    """
+    Return the terms of the ordinal as a list of (exponent, copies) pairs
+    in descending order of exponent.
+
+    The finite part of the ordinal, if nonzero, is the last pair and has
+    exponent 0. For example:
+
+      w**w*2 + w**3 + 7
+
+    becomes the list
+
+      [(w, 2), (3, 1), (0, 7)]
+
+    """
+    terms = []
+
+    while isinstance(a, Ordinal):
+        terms.append((a.exponent, a.copies))
+        a = a.addend
+
+    if a:
+        terms.append((0, a))
+
+    return terms
+
+
+def from_cnf_terms(terms):
+    """
+    Build an ordinal from (exponent, copies) pairs in descending order
+    of exponent. This is the inverse of cnf_terms().
+
+    """
+    ordinal = 0
+
+    for exponent, copies in reversed(terms):
+        if exponent == 0:
+            ordinal = copies
+        else:
+            ordinal = Ordinal(exponent, copies, ordinal)
+
+    return ordinal
+
+
+def _from_normal_terms(terms):
+    """
+    Build an ordinal from (exponent, copies) pairs known to be in
+    strictly descending order of exponent, without validating them.
+
+    """
+    ordinal = 0
+
+    for exponent, copies in reversed(terms):
+        if exponent == 0:
+            ordinal = copies
+        else:
+            ordinal = Ordinal.unchecked(exponent, copies, ordinal)
+
+    return ordinal
+
+
+def _finite_power_terms(a, n):
+    """
+    Return the terms of a**n for an infinite ordinal a and integer n.
+
+    With x the leading exponent of a, a*L == w**x * L for any limit
+    ordinal L, since the terms of a after its leading term are
+    absorbed. Hence if a is a limit ordinal
+
+      a**n == w**(x*(n-1)) * a
+
+    and if a == L + k with L a limit ordinal and k finite, writing L'
+    for L with its leading coefficient multiplied by k,
+
+      a**n == w**(x*(n-1))*L + w**(x*(n-2))*L' + ... + w**x*L' + L' + k
+
+    so the terms are written down directly, in descending order.
+
+    """
+    if n == 0:
+        return [(0, 1)]
+
+    terms = cnf_terms(a)
+    x = a.exponent
+
+    if terms[-1][0] != 0:
+        shift = x * (n - 1)
+        return [(shift + e, c) for e, c in terms]
+
+    k = terms.pop()[1]
+    leading = [(terms[0][0], terms[0][1] * k)] + terms[1:]
+    power = [(x * (n - 1) + e, c) for e, c in terms]
+
+    for j in range(n - 2, -1, -1):
+        shift = x * j
+        power.extend((shift + e, c) for e, c in leading)
+
+    power.append((0, k))
+    return power
+
+
+def left_divmod(a, b):
+    """
+    Return the pair of ordinals (q, r) such that a == b*q + r and r < b.
+
+    Division is on the left, as ordinal multiplication is not commutative.
+    The quotient and remainder are read directly from the terms of a and
+    the leading term of b:
+
+      b == w**x*m + b'
+
+    Terms w**y*c of a with y > x give the terms w**(y - x)*c of the
+    quotient, and the term of a with exponent x (if any) determines the
+    finite part of the quotient and the remainder.
+
+    """
+    if b == 0:
+        raise ZeroDivisionError("Ordinal division by zero")
+
+    if is_finite_ordinal(a) and is_finite_ordinal(b):
+        return divmod(a, b)
+
+    if is_finite_ordinal(b):
+        exponent, copies, tail = 0, b, 0
+    else:
+        exponent, copies, tail = b.as_tuple()
+
+    terms = cnf_terms(a)
+    quotient = []
+
+    # b * w**(y - x) == w**y for y > x
+    i = 0
+    while i < len(terms) and terms[i][0] > exponent:
+        quotient.append((terms[i][0] - exponent, terms[i][1]))
+        i += 1
+
+    rest = terms[i:]
+
+    if not rest or rest[0][0] != exponent:
+        return from_cnf_terms(quotient), from_cnf_terms(rest)
+
+    # Here a == b*q' + w**x*k + rest' and we want the greatest n such that
+    # b*n == w**x*(m*n) + b' is not greater than w**x*k + rest'
+    n, excess = divmod(rest[0][1], copies)
+    rest_tail = from_cnf_terms(rest[1:])
+
+    if excess == 0:
+        if rest_tail >= tail:
+            remainder = rest_tail - tail
+        else:
+            n -= 1
+            remainder = from_cnf_terms([(exponent, copies)] + rest[1:])
+    else:
+        remainder = from_cnf_terms([(exponent, excess)] + rest[1:])
+
+    if n:
+        quotient.append((0, n))
+
+    return from_cnf_terms(quotient), remainder
+
+
+def _size(a):
+    """
+    Return the Size of the Ordinal a from the sizes of its addend and
+    exponent: the number of terms, counting a nonzero finite part as a
+    term, the height of the tower of exponents and the largest bit
+    length of an integer.
+
+    """
+    exponent, copies, addend = a.exponent, a.copies, a.addend
+    bits = copies.bit_length()
+
+    if isinstance(addend, Ordinal):
+        terms, height, bits = addend.size.terms + 1, addend.size.height, max(bits, addend.size.bits)
+    else:
+        terms, height, bits = 2 if addend else 1, 1, max(bits, addend.bit_length())
+
+    if isinstance(exponent, Ordinal):
+        height, bits = max(height, exponent.size.height + 1), max(bits, exponent.size.bits)
+    else:
+        bits = max(bits, exponent.bit_length())
+
+    return Size(terms, height, bits)
+
+
+def order_key(a):
+    """
+    Return a tuple of nested tuples and integers that compares in the
+    same way as the ordinal, for use as a sort key.
+
+    The key is the tuple of (order_key(exponent), copies) pairs of the
+    terms of the ordinal. Comparing keys is done entirely by Python's
+    built-in tuple comparison, and the key of an Ordinal is cached (see
+    Ordinal.order_key()), so sorting and searching with it is much
+    faster than comparing the ordinals directly.
+
+    """
+    if is_finite_ordinal(a):
+        return (((), a),) if a else ()
+
+    return a.order_key()
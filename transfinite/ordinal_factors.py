@@ -1,10 +1,14 @@
 from collections.abc import Sequence
+from itertools import islice
 
+from transfinite.ordinal import Ordinal
 from transfinite.util import (
     as_latex,
+    display_options,
     group_factors,
     is_finite_ordinal,
     multiply_factors,
+    truncated_latex,
 )
 
 
@@ -26,21 +30,142 @@ class OrdinalFactors(Sequence):
     """
     def __init__(self, factors):
         self.factors = group_factors(factors)
+        self._index = None
+        self._latex = None
+
+    @classmethod
+    def unchecked(cls, factors):
+        """
+        Return the OrdinalFactors of a list of (ordinal, exponent) pairs
+        known to have no consecutive equal ordinals, without grouping.
+
+        The list is used directly, not copied.
+
+        """
+        ordinal_factors = cls.__new__(cls)
+        ordinal_factors.factors = factors
+        ordinal_factors._index = None
+        ordinal_factors._latex = None
+        return ordinal_factors
 
     def __iter__(self):
         return iter(self.factors)
 
+    def _get_index(self):
+        """
+        Return a dict mapping each ordinal in the factors to a pair of
+        (list of positions, sum of exponents). It is built on first use,
+        and only stored once complete, so other threads never see a
+        partly built index.
+
+        """
+        if self._index is None:
+            index = {}
+            for position, (ordinal, exponent) in enumerate(self):
+                positions, total = index.get(ordinal, ([], 0))
+                positions.append(position)
+                index[ordinal] = (positions, total + exponent)
+            self._index = index
+        return self._index
+
     def __contains__(self, other):
-        return other in (ordinal for ordinal, _ in self.factors)
+        return other in self._get_index()
+
+    def count(self, value):
+        """
+        Return the number of positions where the ordinal occurs as a factor.
+
+        """
+        positions, _ = self._get_index().get(value, ((), 0))
+        return len(positions)
+
+    def index(self, value, start=0, stop=None):
+        """
+        Return the first position of the ordinal in the factors.
+
+        """
+        positions, _ = self._get_index().get(value, ((), 0))
+        stop = len(self) if stop is None else stop
+
+        for position in positions:
+            if start <= position < stop:
+                return position
+
+        raise ValueError(f"{value} is not a factor")
+
+    def multiplicity(self, value):
+        """
+        Return the sum of the exponents of the ordinal in the factors.
+
+        """
+        _, total = self._get_index().get(value, ((), 0))
+        return total
+
+    def divides(self, ordinal):
+        """
+        Return True if the product of the factors is a left divisor of
+        the ordinal, i.e. ordinal == product * q for some ordinal q.
+
+        """
+        return ordinal % self.product() == 0
 
     def __len__(self):
         return len(self.factors)
 
     def __getitem__(self, item):
+        if isinstance(item, slice):
+            return OrdinalFactorsView(self.factors, range(len(self.factors))[item])
         return self.factors[item]
 
     def product(self):
-        return multiply_factors(self.factors)
+        return multiply_factors(self)
+
+    def __mul__(self, other):
+        """
+        Return the factors of the product of the two factorised ordinals,
+        without factorising the product from scratch.
+
+        If the right ordinal b is a successor, its factors are simply
+        appended, merging finite factors that meet at the boundary.
+
+        Otherwise b begins with delta primes w**w**y1 * ... == w**y, and
+
+          a * w**y == w**(x + y)
+
+        where x is the leading exponent of a, so all of the factors of a
+        collapse into the delta primes of w**(x + y).
+        """
+        if not isinstance(other, OrdinalFactors):
+            return NotImplemented
+
+        left, right = list(self), list(other)
+
+        i = 0
+        while i < len(right) and is_delta_factor(right[i][0]):
+            i += 1
+
+        if i:
+            # Build the delta primes of w**x, then add those of w**y
+            deltas = []
+            for ordinal, exponent in left:
+                if is_finite_ordinal(ordinal):
+                    continue
+                if ordinal.is_limit():
+                    add_power_factors(deltas, [(ordinal, exponent)])
+                else:
+                    # (w**x + 1)**n leads with w**(x*n), and the factors
+                    # of w**(x*n) are those of w**x with the multiplicity
+                    # of the leading factor multiplied by n
+                    (first, multiplicity), *rest = power_factors(ordinal.exponent)
+                    add_power_factors(deltas, [(first, multiplicity * exponent)] + rest)
+            add_power_factors(deltas, right[:i])
+            left, right = deltas, right[i:]
+
+        elif left and right and is_finite_ordinal(left[-1][0]) and is_finite_ordinal(right[0][0]):
+            (n, e), (m, f) = left.pop(), right.pop(0)
+            left.append((n**e * m**f, 1))
+
+        return OrdinalFactors(left + right)
 
     def __str__(self):
         return str(self.factors)
@@ -49,7 +174,17 @@ class OrdinalFactors(Sequence):
         return f"OrdinalFactors({str(self)})"
 
     def _repr_latex_(self):
-        latex = self.as_latex()
+        """
+        Render at most display_options["max_terms"] factors, each
+        truncated as by util.truncated_latex().
+
+        """
+        max_factors = display_options["max_terms"]
+        latex = r"\cdot".join(
+            _factor_latex(factor, truncated_latex) for factor in islice(self, max_factors)
+        )
+        if len(self) > max_factors:
+            latex += rf"\cdots\text{{ ({len(self) - max_factors:,} more factors)}}"
         return f"${latex}$"
 
     def as_latex(self):
@@ -68,25 +203,101 @@ class OrdinalFactors(Sequence):
 
         Note that since factors are prime, there are some cases
         that do not need to be covered here (e.g. w*n).
+
+        The string is cached, and each factor's LaTeX is cached on
+        the ordinal itself, so a factor shared with other
+        factorisations is rendered only once.
         """
-        fs_latex = []
+        if self._latex is None:
+            self._latex = r"\cdot".join(map(_factor_latex, self))
+        return self._latex
+
+
+def _factor_latex(factor, render=as_latex):
+    ordinal, exponent = factor
+
+    if is_finite_ordinal(ordinal) or ordinal.addend == 0 and exponent == 1:
+        return render(ordinal)
+
+    if exponent == 1:
+        return rf"\left({render(ordinal)}\right)"
 
-        for ordinal, exponent in self.factors:
+    return rf"\left({render(ordinal)}\right)^{{{exponent}}}"
 
-            if is_finite_ordinal(ordinal):
-                fs_latex.append(str(ordinal))
-                continue
 
-            latex_ordinal = as_latex(ordinal)
+class OrdinalFactorsView(OrdinalFactors):
+    """
+    A slice of an OrdinalFactors object.
+
+    The view shares the list of factors of the object it was sliced
+    from instead of copying it, so slicing takes constant time.
+
+    """
+    def __init__(self, factors, indices):  # pylint: disable=super-init-not-called
+        self._factors = factors
+        self._indices = indices
+        self._index = None
+        self._latex = None
+
+    @property
+    def factors(self):
+        return [self._factors[i] for i in self._indices]
+
+    def __iter__(self):
+        return (self._factors[i] for i in self._indices)
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return OrdinalFactorsView(self._factors, self._indices[item])
+        return self._factors[self._indices[item]]
+
+
+def is_delta_factor(ordinal):
+    return not is_finite_ordinal(ordinal) and ordinal.is_limit()
+
+
+def power_factors(exponent):
+    """
+    Return the prime factors of w**exponent, which are delta primes
+    in descending order. For example:
+
+      w**(w**3*2 + w + 4) == (w**w**3)**2 * w**w * w**4
+
+    """
+    factors = []
+
+    while isinstance(exponent, Ordinal):
+        factors.append((Ordinal(Ordinal(exponent.exponent)), exponent.copies))
+        exponent = exponent.addend
+
+    if exponent:
+        factors.append((Ordinal(), exponent))
+
+    return factors
+
+
+def add_power_factors(factors, more):
+    """
+    Given the prime factors of w**x and of w**y, update the first list
+    in place to be the prime factors of w**(x + y) == w**x * w**y.
+
+    Factors of w**x less than the leading factor of w**y are absorbed,
+    just as terms of x less than the leading term of y are absorbed
+    in the sum x + y.
+    """
+    if not more:
+        return
 
-            if ordinal.addend > 0 or exponent > 1:
-                f = rf"\left({latex_ordinal}\right)"
-            else:
-                f = latex_ordinal
+    first, exponent = more[0]
 
-            if exponent > 1:
-                f += f"^{{{exponent}}}"
+    while factors and factors[-1][0] < first:
+        factors.pop()
 
-            fs_latex.append(f)
+    if factors and factors[-1][0] == first:
+        factors[-1] = (first, factors[-1][1] + exponent)
+        more = more[1:]
 
-        return r"\cdot".join(fs_latex)
+    factors.extend(more)
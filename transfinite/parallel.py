@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from transfinite.factorisation import factors
+
+
+def _apply_chunk(function, chunk):
+    return [function(*args) for args in chunk]
+
+
+def map_threads(function, arguments, threads=None, chunksize=1000):
+    """
+    Return [function(*args) for args in arguments], computed in chunks
+    by a pool of threads.
+
+    Equal arguments are computed only once. Each chunk runs in a copy
+    of the caller's context, so a budget() set by the caller applies in
+    the threads too. On a free-threaded build of Python the chunks run
+    in parallel; otherwise the threads take turns holding the GIL and
+    processes (see e.g. primes.is_prime_many) scale better.
+
+    Ordinal arithmetic, comparison and factorisation, and the shared
+    caches they use, are safe to call from several threads. Objects
+    that change state without a lock, such as FactorTracker and Hydra,
+    must not be used from more than one thread at a time.
+
+    If threads is 1 the function is applied in the current thread.
+
+    """
+    arguments = [tuple(args) for args in arguments]
+    distinct = list(dict.fromkeys(arguments))
+    chunks = [distinct[i:i + chunksize] for i in range(0, len(distinct), chunksize)]
+
+    if threads == 1:
+        results = [r for chunk in chunks for r in _apply_chunk(function, chunk)]
+    else:
+        with ThreadPoolExecutor(threads) as executor:
+            # A context can only be entered by one thread at a time, so
+            # each chunk gets its own copy
+            computed = [
+                executor.submit(copy_context().run, _apply_chunk, function, chunk) for chunk in chunks
+            ]
+            results = [r for future in computed for r in future.result()]
+
+    computed = dict(zip(distinct, results))
+    return [computed[args] for args in arguments]
+
+
+def factors_many(ordinals, threads=None, chunksize=1000):
+    """
+    Return the factors of each of the ordinals, computed by a pool of
+    threads.
+
+    """
+    return map_threads(factors, ((a,) for a in ordinals), threads, chunksize)
+
+
+def arithmetic_many(op, pairs, threads=None, chunksize=1000):
+    """
+    Return op(a, b) for each pair (a, b), where op is for example
+    operator.mul, computed by a pool of threads.
+
+    """
+    return map_threads(op, pairs, threads, chunksize)
@@ -0,0 +1,115 @@
+import re
+
+from transfinite.budget import check, predict_pow
+from transfinite.ordinal import Ordinal
+
+TOKEN = re.compile(r"\s*(?:(\d+)|(\*\*|[+*()]|w|ω))")
+
+
+def tokenize(text):
+    """
+    Return a list of (position, token) pairs for the string, where a
+    token is an int or one of the strings "+", "*", "**", "(", ")"
+    and "w".
+
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Unexpected character at position {position}: {text[position:position + 10]!r}")
+        number, symbol = match.groups()
+        tokens.append((match.start(match.lastindex), int(number) if number else symbol.replace("ω", "w")))
+        position = match.end()
+
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive descent parser evaluating the tokens, with the grammar
+
+      sum     := product ("+" product)*
+      product := power ("*" power)*
+      power   := atom ("**" power)?
+      atom    := integer | "w" | "(" sum ")"
+
+    so that ** binds tightest and is right associative, as in Python.
+
+    """
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self):
+        return self.tokens[self.i][1] if self.i < len(self.tokens) else None
+
+    def take(self, expected=None):
+        if self.i == len(self.tokens):
+            raise ValueError("Unexpected end of input")
+        position, token = self.tokens[self.i]
+        if expected is not None and token != expected:
+            raise ValueError(f"Expected {expected!r} at position {position}, found {token!r}")
+        self.i += 1
+        return token
+
+    def sum(self):
+        value = self.product()
+        while self.peek() == "+":
+            self.take()
+            value = value + self.product()
+        return value
+
+    def product(self):
+        value = self.power()
+        while self.peek() == "*":
+            self.take()
+            value = value * self.power()
+        return value
+
+    def power(self):
+        base = self.atom()
+        if self.peek() != "**":
+            return base
+        self.take()
+        exponent = self.power()
+        # Ordinal powers check the budget themselves, but 2**10**10
+        # would otherwise be computed as a Python integer
+        check(predict_pow, base, exponent)
+        return base ** exponent
+
+    def atom(self):
+        token = self.take()
+        if isinstance(token, int):
+            return token
+        if token == "w":
+            return Ordinal()
+        if token == "(":
+            value = self.sum()
+            self.take(")")
+            return value
+        raise ValueError(f"Unexpected {token!r} at position {self.tokens[self.i - 1][0]}")
+
+
+def parse(text):
+    """
+    Return the ordinal written in the string, for example
+
+      "w**(w + 1)*2 + w + 3"
+
+    The string may be any expression using non-negative integers, w
+    (or ω), +, *, ** and parentheses, and the ordinal operations are
+    used to evaluate it, so in particular parse(str(a)) == a. Nothing
+    is passed to eval(), so untrusted strings can be parsed, although
+    inside budget() very large results are rejected.
+
+    """
+    parser = _Parser(tokenize(text))
+    value = parser.sum()
+    if parser.i != len(parser.tokens):
+        position, token = parser.tokens[parser.i]
+        raise ValueError(f"Unexpected {token!r} at position {position}")
+    return value
@@ -0,0 +1,440 @@
+from functools import total_ordering
+
+from transfinite.budget import Size, check, predict_pow, size
+from transfinite.ordinal import Ordinal
+from transfinite.ordinal_factors import OrdinalFactors
+from transfinite.util import is_finite_ordinal
+
+# PolyOrdinal stores a coefficient for every degree, so the degree is
+# limited to keep the tuples small. Results of greater degree are
+# returned as Ordinal instead.
+MAX_DEGREE = 4096
+
+
+def coefficients(a):
+    """
+    Return the ordinal a < w**w as the tuple of the coefficients of its
+    terms, where item k is the coefficient of w**k. The last item is
+    nonzero, so 0 is the empty tuple. For example:
+
+      w**3*2 + w + 7
+
+    becomes the tuple
+
+      (7, 1, 0, 2)
+
+    """
+    if is_finite_ordinal(a):
+        return (a,) if a else ()
+
+    if not isinstance(a.exponent, int):
+        raise ValueError("Only ordinals less than w**w have coefficients")
+
+    c = [0] * (a.exponent + 1)
+    while isinstance(a, Ordinal):
+        c[a.exponent] = a.copies
+        a = a.addend
+    c[0] = a
+    return tuple(c)
+
+
+def from_coefficients(c):
+    """
+    Build an ordinal from a tuple of coefficients, as returned by
+    coefficients(). This is the inverse of coefficients().
+
+    """
+    ordinal = c[0] if c else 0
+
+    for k in range(1, len(c)):
+        if c[k]:
+            ordinal = Ordinal.unchecked(k, c[k], ordinal)
+
+    return ordinal
+
+
+def _add(a, b):
+    # The terms of a of lower degree than b are absorbed
+    if not b:
+        return a
+    d = len(b) - 1
+    if len(a) <= d:
+        return b
+    return b[:d] + (a[d] + b[d],) + a[d + 1:]
+
+
+def _sub(a, b):
+    # Skip the top terms a and b share. Then if the rest of b is less
+    # than the leading term of the rest of a, b + a == a, and otherwise
+    # (w**d*(e + c) + x) - (w**d*e + y) == w**d*c + x
+    if len(b) > len(a):
+        return None
+    b = b + (0,) * (len(a) - len(b))
+    d = len(a) - 1
+    while d >= 0 and a[d] == b[d]:
+        d -= 1
+    if d < 0:
+        return ()
+    if b[d] == 0:
+        return a[:d + 1]
+    if a[d] > b[d]:
+        return a[:d] + (a[d] - b[d],)
+    return None
+
+
+def _mul(a, b):
+    # With d the degree of a, a * w**k == w**(d + k) for k > 0 and a * n
+    # multiplies the leading coefficient of a by n
+    if not a or not b:
+        return ()
+    d = len(a) - 1
+    if b[0]:
+        low = a[:d] + (a[d] * b[0],)
+    else:
+        low = (0,) * (d + 1)
+    return low + b[1:]
+
+
+def _pow(a, n):
+    # As in ordinal._finite_power_terms(), with d the degree of a the
+    # copies of the infinite part of a shifted up by d*j take the
+    # degrees d*j + 1 to d*j + d, so they are written into place
+    if n == 0:
+        return (1,)
+    if len(a) <= 1:
+        return tuple(x**n for x in a)
+    if n == 1:
+        return a
+
+    d = len(a) - 1
+    k = a[0]
+
+    if k == 0:
+        return (0,) * (d * (n - 1)) + a
+
+    power = [0] * (d * n + 1)
+    power[0] = k
+    infinite = a[1:]
+    leading = infinite[:-1] + (infinite[-1] * k,)
+
+    for j in range(n - 1):
+        power[d * j + 1:d * j + d + 1] = leading
+    power[d * (n - 1) + 1:] = infinite
+
+    return tuple(power)
+
+
+def _power(a, b):
+    # The coefficients of a**b, or None if a**b is not less than w**w or
+    # has degree greater than MAX_DEGREE
+    if len(b) <= 1:
+        n = b[0] if b else 0
+        if (len(a) - 1) * n > MAX_DEGREE:
+            return None
+        return _pow(a, n)
+
+    if len(a) > 1 or len(b) > 2 or b[1] > MAX_DEGREE:
+        return None
+
+    # n**(w*k + m) == w**k * n**m, and 0**b == 0, 1**b == 1
+    n = a[0] if a else 0
+    if n <= 1:
+        return a
+    return (0,) * b[1] + (n**b[0],)
+
+
+class _HashValue:  # pylint: disable=too-few-public-methods
+    """
+    An object with the given hash, standing in for an Ordinal addend
+    when hashing a tuple as Ordinal.__hash__ does.
+
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value
+
+
+@total_ordering
+class PolyOrdinal:
+    """
+    An ordinal less than w**w, stored as the tuple of the coefficients
+    of its terms (see coefficients()), w**k*c being c at position k.
+
+    Addition, subtraction, multiplication, finite powers, comparison
+    and factorisation are done on the tuples directly, without building
+    a chain of Ordinal objects. The degree is at most MAX_DEGREE, and a
+    result not less than w**w, or of greater degree, is returned as an
+    Ordinal.
+
+    A PolyOrdinal compares and hashes equal to the Ordinal or integer
+    with the same value, and can be combined with either. Use poly() to
+    convert an ordinal when it is in range.
+
+    """
+    __slots__ = ("coefficients", "_hash")
+
+    def __init__(self, c=()):
+        c = tuple(c)
+        if not all(is_finite_ordinal(x) for x in c):
+            raise ValueError("coefficients must be non-negative integers")
+        end = len(c)
+        while end and c[end - 1] == 0:
+            end -= 1
+        if end - 1 > MAX_DEGREE:
+            raise ValueError(f"Degree must be at most {MAX_DEGREE}")
+        self.coefficients = c[:end]
+        self._hash = None
+
+    @classmethod
+    def unchecked(cls, c):
+        """
+        Return the PolyOrdinal with the tuple of coefficients c, which
+        must have a nonzero last item and degree at most MAX_DEGREE,
+        without checking or copying it.
+
+        """
+        a = cls.__new__(cls)
+        a.coefficients = c
+        a._hash = None
+        return a
+
+    @classmethod
+    def from_ordinal(cls, a):
+        """
+        Return the PolyOrdinal equal to the ordinal a < w**w, which
+        must have degree at most MAX_DEGREE.
+
+        """
+        if not is_finite_ordinal(a) and isinstance(a.exponent, int) and a.exponent > MAX_DEGREE:
+            raise ValueError(f"Degree must be at most {MAX_DEGREE}")
+        return cls.unchecked(coefficients(a))
+
+    @property
+    def degree(self):
+        return max(len(self.coefficients) - 1, 0)
+
+    @property
+    def size(self):
+        """
+        The budget.Size of the ordinal, as for the equal Ordinal.
+
+        """
+        c = self.coefficients
+        if len(c) <= 1:
+            return size(c[0] if c else 0)
+        bits = max(max(x.bit_length() for x in c), (len(c) - 1).bit_length())
+        return Size(sum(1 for x in c if x), 1, bits)
+
+    def to_ordinal(self):
+        """
+        Return the equal Ordinal, or integer if finite.
+
+        """
+        return from_coefficients(self.coefficients)
+
+    def is_finite(self):
+        return len(self.coefficients) <= 1
+
+    def is_limit(self):
+        return not self.is_finite() and self.coefficients[0] == 0
+
+    def factors(self):
+        """
+        Return the prime factors, as factorisation.factors() would for
+        the equal Ordinal.
+
+        As there, the least infinite term and the finite part give the
+        first factors, and each pair of consecutive infinite terms
+        w**j*c + w**k gives the factors (w**(j-k) + 1) and c.
+
+        """
+        c = self.coefficients
+        degrees = [k for k in range(len(c) - 1, 0, -1) if c[k]]
+
+        if not degrees:
+            raise ValueError("Finite ordinals are not factorised")
+
+        least = degrees.pop()
+
+        # The degree of the last factor, if it is w**k + 1
+        successor = None
+
+        if c[0]:
+            factors_ = [(c[0], 1)] if c[0] > 1 else []
+            factors_.append((Ordinal.unchecked(least, 1, 1), 1))
+            successor = least
+        else:
+            factors_ = [(Ordinal(), least)]
+
+        for k in reversed(degrees):
+            if c[least] > 1:
+                factors_.append((c[least], 1))
+                successor = None
+            if successor == k - least:
+                factor, exponent = factors_.pop()
+                factors_.append((factor, exponent + 1))
+            else:
+                factors_.append((Ordinal.unchecked(k - least, 1, 1), 1))
+                successor = k - least
+            least = k
+
+        if c[least] > 1:
+            factors_.append((c[least], 1))
+
+        return OrdinalFactors.unchecked(factors_)
+
+    def __str__(self):
+        return str(self.to_ordinal())
+
+    def __repr__(self):
+        return f"PolyOrdinal({self.coefficients})"
+
+    def __hash__(self):
+        if self._hash is None:
+            # Ordinal hashes (exponent, copies, addend), with the addend
+            # hashed first, so the terms are hashed from the least up
+            c = self.coefficients
+            h = c[0] if c else 0
+            first = True
+            for k in range(1, len(c)):
+                if c[k]:
+                    h = hash((k, c[k], h if first else _HashValue(h)))
+                    first = False
+            self._hash = hash(h) if first else h
+        return self._hash
+
+    def __eq__(self, other):
+        other = _coefficients_of(other)
+        if other is NotImplemented:
+            return other
+        return self.coefficients == other
+
+    def __lt__(self, other):
+        other = _coefficients_of(other)
+        if other is NotImplemented:
+            return other
+        if other is None:
+            return True
+        a = self.coefficients
+        if len(a) != len(other):
+            return len(a) < len(other)
+        return a[::-1] < other[::-1]
+
+    def __add__(self, other):
+        b = _coefficients_of(other)
+        if b is NotImplemented:
+            return b
+        if b is None:
+            return self.to_ordinal() + other
+        return _result(_add(self.coefficients, b))
+
+    def __radd__(self, other):
+        a = _coefficients_of(other)
+        if a is NotImplemented:
+            return a
+        if a is None:
+            return other + self.to_ordinal()
+        return _result(_add(a, self.coefficients))
+
+    def __sub__(self, other):
+        b = _coefficients_of(other)
+        if b is NotImplemented:
+            return b
+        c = None if b is None else _sub(self.coefficients, b)
+        if c is None:
+            raise ValueError("Cannot subtract an ordinal from a smaller ordinal")
+        return _result(c)
+
+    def __rsub__(self, other):
+        a = _coefficients_of(other)
+        if a is NotImplemented:
+            return a
+        if a is None:
+            return other - self.to_ordinal()
+        c = _sub(a, self.coefficients)
+        if c is None:
+            raise ValueError("Cannot subtract an ordinal from a smaller ordinal")
+        return _result(c)
+
+    def __mul__(self, other):
+        b = _coefficients_of(other)
+        if b is NotImplemented:
+            return b
+        if b is None:
+            return self.to_ordinal() * other
+        return _result(_mul(self.coefficients, b))
+
+    def __rmul__(self, other):
+        a = _coefficients_of(other)
+        if a is NotImplemented:
+            return a
+        if a is None:
+            return other * self.to_ordinal()
+        return _result(_mul(a, self.coefficients))
+
+    def __pow__(self, other):
+        b = _coefficients_of(other)
+        if b is NotImplemented:
+            return b
+        if b is not None:
+            check(predict_pow, self, _to_ordinal(other))
+        c = None if b is None else _power(self.coefficients, b)
+        if c is None:
+            return self.to_ordinal() ** _to_ordinal(other)
+        return _result(c)
+
+    def __rpow__(self, other):
+        a = _coefficients_of(other)
+        if a is NotImplemented:
+            return a
+        if a is not None:
+            check(predict_pow, other, self.to_ordinal())
+        c = None if a is None else _power(a, self.coefficients)
+        if c is None:
+            return other ** self.to_ordinal()
+        return _result(c)
+
+
+def _coefficients_of(a):
+    """
+    Return the coefficients of the PolyOrdinal, Ordinal or integer a,
+    None for an Ordinal not less than w**w or of degree greater than
+    MAX_DEGREE (so greater than any PolyOrdinal), and NotImplemented
+    for anything else.
+
+    """
+    if isinstance(a, PolyOrdinal):
+        return a.coefficients
+    if is_finite_ordinal(a):
+        return (a,) if a else ()
+    if isinstance(a, Ordinal):
+        if isinstance(a.exponent, int) and a.exponent <= MAX_DEGREE:
+            return coefficients(a)
+        return None
+    return NotImplemented
+
+
+def _to_ordinal(a):
+    return a.to_ordinal() if isinstance(a, PolyOrdinal) else a
+
+
+def _result(c):
+    if len(c) - 1 > MAX_DEGREE:
+        return from_coefficients(c)
+    return PolyOrdinal.unchecked(c)
+
+
+def poly(a):
+    """
+    Return the PolyOrdinal equal to the ordinal a if it is less than
+    w**w and its degree is at most MAX_DEGREE, otherwise return a.
+
+    """
+    c = _coefficients_of(a)
+    if c is NotImplemented:
+        raise TypeError(f"{a!r} is not an ordinal")
+    return a if c is None else PolyOrdinal.unchecked(c)
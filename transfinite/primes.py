@@ -0,0 +1,157 @@
+from concurrent.futures import ProcessPoolExecutor
+from random import SystemRandom
+
+from transfinite.enumeration import BoundedOrdinals
+from transfinite.ordinal import Ordinal
+from transfinite.util import is_finite_ordinal
+
+# Miller-Rabin with these bases is correct for all n below
+# DETERMINISTIC_BOUND (about 3.3 * 10**24), which is itself the least
+# composite passing all of them
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+DETERMINISTIC_BOUND = 3317044064679887385961981
+
+# Further random bases tried for n at or above DETERMINISTIC_BOUND. A
+# composite passes each with probability at most 1/4
+EXTRA_ROUNDS = 32
+
+
+def _is_strong_probable_prime(n, d, s, a):
+    # With n - 1 == d * 2**s and d odd, n is a strong probable prime to
+    # base a if a**d == 1 or a**(d * 2**r) == n - 1 for some r < s
+    x = pow(a, d, n)
+    if x in (1, n - 1):
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def is_prime_integer(n):
+    """
+    Return True if the integer n is prime.
+
+    The answer is exact for n less than DETERMINISTIC_BOUND. Larger n
+    are also tested with EXTRA_ROUNDS random bases, so there the answer
+    is probabilistic: a composite is reported as prime with probability
+    at most 4**-EXTRA_ROUNDS. An answer of False is always exact.
+
+    """
+    if n < 2:
+        return False
+
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    if not all(_is_strong_probable_prime(n, d, s, a) for a in SMALL_PRIMES):
+        return False
+
+    if n < DETERMINISTIC_BOUND:
+        return True
+
+    rng = SystemRandom()
+    return all(_is_strong_probable_prime(n, d, s, rng.randrange(2, n - 1)) for _ in range(EXTRA_ROUNDS))
+
+
+def is_prime(a):
+    """
+    Return True if the finite or infinite ordinal a is prime. Integers
+    are tested with is_prime_integer(), which is probabilistic from
+    DETERMINISTIC_BOUND up.
+
+    For infinite ordinals this is Ordinal.is_prime() with the method
+    calls inlined: a is prime if it is w**x + 1, or w**w**y, or w.
+
+    """
+    if is_finite_ordinal(a):
+        return is_prime_integer(a)
+
+    if a.copies != 1:
+        return False
+
+    if a.addend == 1:
+        return True
+
+    if a.addend != 0:
+        return False
+
+    exponent = a.exponent
+    return exponent == 1 or (
+        isinstance(exponent, Ordinal) and exponent.copies == 1 and exponent.addend == 0
+    )
+
+
+def _is_prime_chunk(ordinals):
+    return [is_prime(a) for a in ordinals]
+
+
+def is_prime_many(ordinals, processes=None, chunksize=10000):
+    """
+    Return a list of booleans saying whether each ordinal is prime.
+
+    Equal ordinals are classified only once. If processes is given the
+    distinct ordinals are classified in chunks by a pool of that many
+    processes.
+
+    """
+    ordinals = list(ordinals)
+    distinct = list(dict.fromkeys(ordinals))
+
+    if processes is None:
+        results = _is_prime_chunk(distinct)
+    else:
+        chunks = [distinct[i:i + chunksize] for i in range(0, len(distinct), chunksize)]
+        with ProcessPoolExecutor(processes) as executor:
+            results = [r for chunk in executor.map(_is_prime_chunk, chunks) for r in chunk]
+
+    classified = dict(zip(distinct, results))
+    return [classified[a] for a in ordinals]
+
+
+def primes(bound, max_coefficient=None):
+    """
+    Lazily yield the prime ordinals less than bound, in increasing
+    order: the prime integers if bound is finite, and otherwise the
+    infinite primes, as there are infinitely many finite ones.
+
+    Every infinite prime is either w**x + 1 or w**w**y (including w
+    itself), so the primes are generated from the exponents x, which
+    are enumerated by BoundedOrdinals with the given max_coefficient.
+    Without this restriction there would be infinitely many primes
+    below, for example, w**w + 1, and they could not be listed in
+    increasing order, so max_coefficient must be given when bound is
+    infinite.
+
+    """
+    if is_finite_ordinal(bound):
+        yield from (n for n in range(2, bound) if is_prime_integer(n))
+        return
+
+    if max_coefficient is None:
+        raise ValueError("max_coefficient is needed to list the primes below an infinite bound")
+
+    for exponent in BoundedOrdinals(bound.exponent + 1, max_coefficient):
+
+        if exponent == 0:
+            continue
+
+        power = Ordinal(exponent)
+        if power >= bound:
+            return
+
+        if power.is_delta():
+            yield power
+
+        successor = Ordinal(exponent, addend=1)
+        if successor >= bound:
+            return
+
+        yield successor
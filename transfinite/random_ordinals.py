@@ -0,0 +1,139 @@
+import random
+
+from transfinite.encoding import to_bytes
+from transfinite.ordinal import Ordinal, order_key
+
+SHAPES = {
+    # A mix of small ordinals
+    "balanced": {"terms": (1, 5), "height": (1, 3), "coefficient_bits": 4},
+    # Towers of exponents with few terms at each level
+    "deep": {"terms": (1, 2), "height": (12, 12), "coefficient_bits": 2},
+    # Sums of very many terms with finite exponents
+    "wide": {"terms": (1000, 1000), "height": (1, 1), "coefficient_bits": 4},
+    # Few terms with huge coefficients
+    "giant": {"terms": (1, 4), "height": (1, 2), "coefficient_bits": 4096},
+}
+
+
+class RandomOrdinals:
+    """
+    A seeded generator of random infinite ordinals.
+
+    Each ordinal has a number of infinite terms chosen uniformly from
+    the range terms, a height (see budget.Size) chosen uniformly from
+    the range height, and coefficients and finite part of at most
+    coefficient_bits bits.
+
+    To avoid comparing ordinals, the exponents are drawn from pools of
+    pool_size ordinals (and the integers up to pool_size), generated
+    in the same way and sorted once. Since a greater ordinal never has
+    a smaller height, each pool is ordered by height too. The leading
+    exponent is drawn from the part of the pool with the right height
+    and the other exponents from below it, in decreasing order, so
+    every ordinal is built as a valid normal form with
+    Ordinal.unchecked(). Exponents are shared between ordinals.
+
+    """
+    def __init__(self, seed=None, terms=(1, 5), height=(1, 3), coefficient_bits=4, pool_size=1000):  # pylint: disable=too-many-arguments
+        if terms[0] < 1 or height[0] < 1 or coefficient_bits < 1:
+            raise ValueError("terms, height and coefficient_bits must be at least 1")
+
+        self.random = random.Random(seed)
+        self.terms = terms
+        self.height = height
+        self.coefficient_bits = coefficient_bits
+        self.pool_size = max(pool_size, terms[1])
+
+        # Pools of exponents for each height, in decreasing order, and
+        # the position in each pool where each height starts
+        self._pools = {1: list(range(self.pool_size, 0, -1))}
+        self._starts = {1: {0: 0}}
+
+    @classmethod
+    def from_shape(cls, shape, seed=None, **options):
+        """
+        Return a generator with the settings in SHAPES, updated with the
+        keyword arguments.
+
+        """
+        return cls(seed, **dict(SHAPES[shape], **options))
+
+    def _coefficient(self):
+        return self.random.getrandbits(self.coefficient_bits) or 1
+
+    def _pool(self, height):
+        """
+        Return the pool of exponents for ordinals of the given height,
+        which contains ordinals of height less than it.
+
+        """
+        if height not in self._pools:
+            count = max(self.pool_size // (height - 1), 1)
+            ordinals = {self._ordinal(h) for h in range(1, height) for _ in range(count)}
+            pool = sorted(ordinals, key=order_key, reverse=True) + self._pools[1]
+            self._pools[height] = pool
+            self._starts[height] = self._height_starts(pool)
+        return self._pools[height]
+
+    @staticmethod
+    def _height(a):
+        return 0 if isinstance(a, int) else a.size.height
+
+    def _height_starts(self, pool):
+        starts = {}
+        for i in range(len(pool) - 1, -1, -1):
+            starts[self._height(pool[i])] = i
+        return starts
+
+    def _ordinal(self, height):
+        pool = self._pool(height)
+        starts = self._starts[height]
+        rand = self.random
+
+        # The leading exponent has height one less than the ordinal, and
+        # if possible leaves enough smaller exponents for the other terms
+        n_terms = rand.randint(*self.terms)
+        start = starts[height - 1]
+        stop = min(starts.get(height - 2, len(pool)), len(pool) - n_terms + 1)
+        leading = rand.randrange(start, max(stop, start + 1))
+
+        rest = min(n_terms - 1, len(pool) - leading - 1)
+        positions = sorted(rand.sample(range(leading + 1, len(pool)), rest), reverse=True)
+
+        a = rand.getrandbits(self.coefficient_bits)
+        for i in positions:
+            a = Ordinal.unchecked(pool[i], self._coefficient(), a)
+        return Ordinal.unchecked(pool[leading], self._coefficient(), a)
+
+    def ordinal(self):
+        """
+        Return a random ordinal.
+
+        """
+        return self._ordinal(self.random.randint(*self.height))
+
+    def __iter__(self):
+        while True:
+            yield self.ordinal()
+
+    def ordinals(self, n):
+        """
+        Return a list of n random ordinals.
+
+        """
+        return [self.ordinal() for _ in range(n)]
+
+    def strings(self, n):
+        """
+        Return a list of the strings of n random ordinals.
+
+        """
+        return [str(a) for a in self.ordinals(n)]
+
+    def encoded(self, n):
+        """
+        Return the binary encoding (see encoding.to_bytes()) of n random
+        ordinals.
+
+        """
+        return to_bytes(*self.ordinals(n))
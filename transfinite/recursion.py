@@ -0,0 +1,203 @@
+from functools import update_wrapper
+from inspect import isgenerator
+
+from transfinite.util import is_finite_ordinal
+
+
+class RecursionBudgetExceeded(Exception):
+    pass
+
+
+class RecursionStats:
+    """
+    Counters describing the work done by a TransfiniteFunction.
+
+      evaluations  number of calls evaluated (not found in the cache)
+      cache_hits   number of calls answered from the cache
+      max_depth    greatest number of pending calls at any one time
+
+    """
+    def __init__(self):
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.max_depth = 0
+
+    def reset(self):
+        """
+        Set all of the counters back to zero.
+
+        """
+        self.evaluations = self.cache_hits = self.max_depth = 0
+
+    def __repr__(self):
+        return (
+            f"RecursionStats(evaluations={self.evaluations}, "
+            f"cache_hits={self.cache_hits}, max_depth={self.max_depth})"
+        )
+
+
+_MISSING = object()
+
+
+def _returns(value):
+    """
+    Generator that immediately returns the value.
+
+    """
+    return value
+    yield  # pylint: disable=unreachable
+
+
+class TransfiniteFunction:
+    """
+    A function defined by transfinite recursion, evaluated with an
+    explicit stack and memoized on its arguments.
+
+    The definition is a generator function. To make a recursive call
+    it yields a tuple of arguments and receives the result:
+
+      def hardy(alpha, n):
+          if alpha == 0:
+              return n
+          if alpha.is_successor():
+              return (yield alpha.predecessor(), n + 1)
+          return (yield alpha.fundamental(n), n)
+
+    A definition may also be a plain function for its base cases.
+    Recursive calls never use the Python call stack, so the depth of
+    recursion is limited only by memory. If a budget is given,
+    RecursionBudgetExceeded is raised once a call evaluates more than
+    that many calls, not counting those found in the cache.
+
+    The function can be called from several threads at once. Each call
+    keeps its own stack of pending calls and the threads share the
+    cache, so a value may occasionally be computed by two threads, but
+    never incorrectly. The stats are then only approximate.
+
+    """
+    def __init__(self, definition, budget=None):
+        update_wrapper(self, definition)
+        self.definition = definition
+        self.budget = budget
+        self.cache = {}
+        self.stats = RecursionStats()
+
+    def _start(self, args):
+        result = self.definition(*args)
+        return result if isgenerator(result) else _returns(result)
+
+    def _evaluate(self, args, evaluations):
+        # evaluations counts the calls evaluated by the current top-level
+        # call, including this one, so each call has the whole budget
+        self.stats.evaluations += 1
+        if self.budget is not None and evaluations > self.budget:
+            raise RecursionBudgetExceeded(f"More than {self.budget} evaluations")
+        return self._start(args)
+
+    def __call__(self, *args):
+        value = self.cache.get(args, _MISSING)
+        if value is not _MISSING:
+            self.stats.cache_hits += 1
+            return value
+
+        evaluations = 1
+        stack = [(args, self._evaluate(args, evaluations))]
+        pending = {args}
+        value = None
+
+        while stack:
+            self.stats.max_depth = max(self.stats.max_depth, len(stack))
+            key, generator = stack[-1]
+
+            try:
+                call = generator.send(value)
+            except StopIteration as stop:
+                stack.pop()
+                pending.discard(key)
+                value = self.cache[key] = stop.value
+                continue
+
+            if not isinstance(call, tuple):
+                call = (call,)
+
+            value = self.cache.get(call, _MISSING)
+            if value is not _MISSING:
+                self.stats.cache_hits += 1
+                continue
+
+            if call in pending:
+                raise RecursionError(f"Call with arguments {call} depends on itself")
+
+            evaluations += 1
+            stack.append((call, self._evaluate(call, evaluations)))
+            pending.add(call)
+            value = None
+
+        return value
+
+    def cache_clear(self):
+        self.cache = {}
+        self.stats.reset()
+
+
+def transfinite_recursion(definition=None, *, budget=None):
+    """
+    Decorator turning a generator function into a TransfiniteFunction.
+
+    It can be used as @transfinite_recursion or with a budget, as
+    @transfinite_recursion(budget=10**6).
+
+    """
+    if definition is None:
+        return lambda definition: TransfiniteFunction(definition, budget)
+    return TransfiniteFunction(definition, budget)
+
+
+@transfinite_recursion
+def hardy(alpha, n):
+    """
+    The Hardy hierarchy:
+
+      H_0(n)     == n
+      H_a+1(n)   == H_a(n + 1)
+      H_a(n)     == H_a[n](n)     (a a limit ordinal)
+
+    """
+    if is_finite_ordinal(alpha):
+        return n + alpha
+
+    if alpha.is_successor():
+        return (yield alpha.predecessor(), n + 1)
+
+    return (yield alpha.fundamental(n), n)
+
+
+@transfinite_recursion
+def fast_growing(alpha, n):
+    """
+    The fast-growing hierarchy:
+
+      f_0(n)     == n + 1
+      f_a+1(n)   == f_a(f_a(...f_a(n)...))   (n applications of f_a)
+      f_a(n)     == f_a[n](n)               (a a limit ordinal)
+
+    The closed forms f_1(n) == 2*n and f_2(n) == n * 2**n are used.
+
+    """
+    if alpha == 0:
+        return n + 1
+
+    if alpha == 1:
+        return 2 * n
+
+    if alpha == 2:
+        return n * 2**n
+
+    if is_finite_ordinal(alpha) or alpha.is_successor():
+        beta = alpha - 1 if is_finite_ordinal(alpha) else alpha.predecessor()
+        value = n
+        for _ in range(n):
+            value = yield beta, value
+        return value
+
+    return (yield alpha.fundamental(n), n)
@@ -0,0 +1,38 @@
+from transfinite.util import is_finite_ordinal
+
+
+def descend(a, schedule):
+    """
+    Lazily yield a descending sequence of ordinals starting below a.
+
+    Each step takes the next integer n from the schedule (an iterable)
+    and moves from the current ordinal to:
+
+     * its predecessor, if it is a successor ordinal, or
+     * its n-th fundamental sequence element, if it is a limit ordinal.
+
+    Since every descending sequence of ordinals is finite, the sequence
+    always ends at 0 unless the schedule is exhausted first. For example:
+
+      descend(w*2, itertools.count(1))
+
+    yields w + 1, w, 3, 2, 1, 0.
+
+    """
+    schedule = iter(schedule)
+
+    while a != 0:
+
+        try:
+            n = next(schedule)
+        except StopIteration:
+            return
+
+        if is_finite_ordinal(a):
+            a -= 1
+        elif a.is_limit():
+            a = a.fundamental(n)
+        else:
+            a = a.predecessor()
+
+        yield a
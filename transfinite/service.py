@@ -0,0 +1,400 @@
+import asyncio
+import itertools
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from transfinite.budget import budget, check, predict_add, predict_mul, predict_pow
+from transfinite.factorisation import factors
+from transfinite.parsing import parse
+from transfinite.util import is_finite_ordinal
+
+ARITHMETIC = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * b,
+    "pow": lambda a, b: a ** b,
+}
+
+# Predictions checked against the budget before each operation, since
+# arithmetic on two integers does not check the budget itself (the
+# difference is never larger than the first operand)
+PREDICTIONS = {"add": predict_add, "mul": predict_mul, "pow": predict_pow}
+
+# Limits (keyword arguments to budget()) applied to every request unless
+# others are given, so that a single request cannot take up a worker
+# with an enormous result
+DEFAULT_LIMITS = {"max_terms": 100_000, "max_height": 1_000, "max_bits": 1_000_000}
+
+# Limit on the length of a message (one line of JSON) read by the server
+# and client, well above the length of a result within DEFAULT_LIMITS
+# (asyncio's default of 64 KiB is exceeded by a few thousand terms)
+MESSAGE_LIMIT = 2**28
+
+
+class ServiceError(Exception):
+    """
+    Raised by the client when the service could not compute a request.
+
+    """
+
+
+def evaluate(op, args):
+    """
+    Compute a single request, with the ordinals in args given as
+    strings, and return a result that can be encoded as JSON.
+
+    The operations are:
+
+      parse    ("w*2 + w")         -> "w*3"
+      compare  ("w + 1", "w*2")    -> -1, 0 or 1
+      add, sub, mul, pow ("w", "2") -> "w*2", ...
+      factors  ("w**2 + w")         -> [["w", 1], ["w + 1", 1]]
+
+    """
+    ordinals = [parse(str(arg)) for arg in args]
+
+    if op == "parse" and len(ordinals) == 1:
+        return str(ordinals[0])
+
+    if op == "compare" and len(ordinals) == 2:
+        a, b = ordinals
+        return (a > b) - (a < b)
+
+    if op in ARITHMETIC and len(ordinals) == 2:
+        if op in PREDICTIONS:
+            check(PREDICTIONS[op], *ordinals)
+        return str(ARITHMETIC[op](*ordinals))
+
+    if op == "factors" and len(ordinals) == 1:
+        if is_finite_ordinal(ordinals[0]):
+            raise ValueError("Finite ordinals are not factorised")
+        return [[str(factor), exponent] for factor, exponent in factors(ordinals[0])]
+
+    raise ValueError(f"Unknown operation {op!r} with {len(args)} arguments")
+
+
+def evaluate_batch(requests, limits=None):
+    """
+    Compute each (op, args) request, returning a list of pairs
+    (True, result) or (False, error message).
+
+    Each request is computed inside budget(**limits), with limits
+    DEFAULT_LIMITS if not given. Pass an empty dict to compute requests
+    without limits.
+
+    """
+    if limits is None:
+        limits = DEFAULT_LIMITS
+
+    results = []
+
+    for op, args in requests:
+        try:
+            with budget(**limits):
+                results.append((True, evaluate(op, args)))
+        except Exception as e:  # pylint: disable=broad-except
+            results.append((False, f"{type(e).__name__}: {e}"))
+
+    return results
+
+
+class OrdinalService:  # pylint: disable=too-many-instance-attributes
+    """
+    Computes requests from many concurrent callers in batches.
+
+    Requests are queued and collected into batches of at most
+    batch_size, waiting at most batch_delay seconds for a batch to
+    fill. Each batch is computed by a pool of worker processes (or, if
+    processes is 1, a thread of the current process), so the event
+    loop is never blocked.
+
+    Results are kept in a shared LRU cache of cache_size entries. A
+    request identical to one already being computed waits for that
+    result instead of being computed again.
+
+    limits is a dict of keyword arguments to budget(), applied to every
+    request, by default DEFAULT_LIMITS.
+
+    """
+    # The batching options are independent settings, so they are kept
+    # as separate keyword arguments
+    def __init__(self, processes=None, batch_size=64, batch_delay=0.001, cache_size=10000, limits=None):  # pylint: disable=too-many-arguments
+        self.processes = processes
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.cache_size = cache_size
+        self.limits = DEFAULT_LIMITS if limits is None else limits
+
+        self._cache = OrderedDict()
+        self._in_flight = {}
+        self._queue = None
+        self._executor = None
+        self._batcher = None
+        self._batches = set()
+        self._slots = None
+
+        self._started = time.monotonic()
+        self._counts = dict.fromkeys(
+            ["requests", "completed", "errors", "cache_hits", "deduplicated", "batches", "batched"], 0
+        )
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    async def start(self):
+        if self.processes != 1:
+            self._executor = ProcessPoolExecutor(self.processes)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.processes or os.cpu_count() or 1)
+        self._batcher = asyncio.ensure_future(self._collect_batches())
+        self._started = time.monotonic()
+        return self
+
+    async def close(self):
+        """
+        Stop the service. Requests still waiting to be computed raise
+        ServiceError.
+
+        """
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, *self._batches, return_exceptions=True)
+            self._batcher = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        for future in self._in_flight.values():
+            if not future.done():
+                future.set_exception(ServiceError("The service was closed"))
+        self._in_flight.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, op, *args):
+        """
+        Return the result of the operation, raising ServiceError if it
+        could not be computed.
+
+        """
+        start = time.monotonic()
+        self._counts["requests"] += 1
+        key = (op, tuple(str(arg) for arg in args))
+
+        try:
+            if key in self._cache:
+                self._counts["cache_hits"] += 1
+                self._cache.move_to_end(key)
+                ok, result = self._cache[key]
+
+            elif key in self._in_flight:
+                self._counts["deduplicated"] += 1
+                ok, result = await asyncio.shield(self._in_flight[key])
+
+            else:
+                future = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = future
+                self._queue.put_nowait(key)
+                ok, result = await asyncio.shield(future)
+
+        finally:
+            latency = time.monotonic() - start
+            self._counts["completed"] += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+
+        if not ok:
+            self._counts["errors"] += 1
+            raise ServiceError(result)
+
+        return result
+
+    async def _collect_batches(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.batch_delay
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._slots.acquire()
+            task = asyncio.ensure_future(self._compute(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _compute(self, batch):
+        loop = asyncio.get_running_loop()
+
+        try:
+            results = await loop.run_in_executor(self._executor, evaluate_batch, batch, self.limits)
+        except Exception as e:  # pylint: disable=broad-except
+            results = [(False, f"{type(e).__name__}: {e}")] * len(batch)
+        finally:
+            self._slots.release()
+
+        self._counts["batches"] += 1
+        self._counts["batched"] += len(batch)
+
+        for key, result in zip(batch, results):
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            future = self._in_flight.pop(key)
+            if not future.done():
+                future.set_result(result)
+
+    def metrics(self):
+        """
+        Return a dict of counts of requests, batches, cache hits and
+        deduplicated requests, with latency (in seconds) and throughput
+        (completed requests per second).
+
+        """
+        metrics = dict(self._counts)
+        completed = metrics["completed"]
+        metrics["mean_latency"] = self._latency_total / completed if completed else 0.0
+        metrics["max_latency"] = self._latency_max
+        metrics["mean_batch_size"] = metrics["batched"] / metrics["batches"] if metrics["batches"] else 0.0
+        metrics["throughput"] = completed / max(time.monotonic() - self._started, 1e-9)
+        metrics["cache_size"] = len(self._cache)
+        return metrics
+
+
+async def serve(service, host="127.0.0.1", port=0, path=None):
+    """
+    Start a server answering requests with the service, on a Unix
+    socket at path if given, otherwise on TCP at host and port.
+
+    Messages are JSON objects, one per line. A request
+
+      {"id": 1, "op": "mul", "args": ["w + 1", "w"]}
+
+    is answered, possibly out of order, by
+
+      {"id": 1, "result": "w**2"}  or  {"id": 1, "error": "..."}
+
+    and the op "metrics" returns service.metrics(). Every request is
+    answered, with an error if anything goes wrong handling it, so a
+    client never waits forever. Returns the asyncio Server.
+
+    """
+    async def respond(message, writer):
+        response = {"id": message.get("id")}
+        try:
+            if message.get("op") == "metrics":
+                response["result"] = service.metrics()
+            else:
+                response["result"] = await service.request(message["op"], *message.get("args", ()))
+        except ServiceError as e:
+            response["error"] = str(e)
+        except (KeyError, TypeError) as e:
+            response["error"] = f"Malformed request: {e}"
+        except Exception as e:  # pylint: disable=broad-except
+            response["error"] = f"{type(e).__name__}: {e}"
+        writer.write(json.dumps(response).encode() + b"\n")
+
+    async def handle(reader, writer):
+        tasks = set()
+        try:
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    message = {}
+                if not isinstance(message, dict):
+                    message = {}
+                task = asyncio.ensure_future(respond(message, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    if path is not None:
+        return await asyncio.start_unix_server(handle, path, limit=MESSAGE_LIMIT)
+    return await asyncio.start_server(handle, host, port, limit=MESSAGE_LIMIT)
+
+
+class OrdinalClient:
+    """
+    Client for a server started by serve().
+
+    Requests can be made concurrently over one connection, and each
+    is matched to its response by id.
+
+    """
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._pending = {}
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=None, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MESSAGE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MESSAGE_LIMIT)
+        return cls(reader, writer)
+
+    async def _receive(self):
+        try:
+            async for line in self._reader:
+                response = json.loads(line)
+                future = self._pending.pop(response["id"], None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    future.set_exception(ServiceError(response["error"]))
+                else:
+                    future.set_result(response["result"])
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection to the service closed"))
+
+    async def request(self, op, *args):
+        """
+        Send a request (see serve()) and return its result.
+
+        Raises ConnectionError if the connection to the service is
+        closed.
+
+        """
+        if self._receiver.done():
+            raise ConnectionError("Connection to the service closed")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {"id": request_id, "op": op, "args": [str(arg) for arg in args]}
+        self._writer.write(json.dumps(message).encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def metrics(self):
+        return await self.request("metrics")
+
+    async def close(self):
+        self._writer.close()
+        await asyncio.gather(self._receiver, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,197 @@
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError as e:  # Python 3.7
+    raise ImportError("transfinite.shared needs multiprocessing.shared_memory, added in Python 3.8") from e
+
+from transfinite.factorisation import factors
+from transfinite.ordinal_factors import OrdinalFactors
+from transfinite.store import OrdinalTable, encode_table
+
+# Arenas open in this process, by name, so that a worker attaches to
+# each arena once and keeps the ordinals it has built between tasks
+_attached = {}
+
+
+class SharedOrdinalArena(OrdinalTable):
+    """
+    An ordinal table (see store.encode_table()) in a block of shared
+    memory, which other processes can attach to by name.
+
+    Ordinals are passed between processes as their integer handles, the
+    positions of the ordinals in the table, instead of being pickled.
+    Each process reads the table without copying it and builds Ordinal
+    objects only for the handles it uses, with shared exponents built
+    once.
+
+    An arena is created from ordinals with share(), and the process that
+    created it frees the memory when it is closed. Opening an arena by
+    name attaches to an existing block, which is left in place when
+    closed unless owner is True.
+
+    """
+    def __init__(self, name, owner=False):
+        self._memory = SharedMemory(name)
+        self._owner = owner
+        super().__init__(self._memory.buf)
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    def close(self):
+        if _attached.get(self.name) is self:
+            del _attached[self.name]
+        self.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _create(data):
+    """
+    Return a new block of shared memory holding the bytes.
+
+    """
+    memory = SharedMemory(create=True, size=max(len(data), 1))
+    memory.buf[:len(data)] = data
+    return memory
+
+
+def share(ordinals):
+    """
+    Return a new SharedOrdinalArena holding the ordinals, where the
+    ordinal at position i has handle i.
+
+    Coefficients must be less than 2**64.
+
+    """
+    memory = _create(encode_table(ordinals))
+    name = memory.name
+    arena = SharedOrdinalArena(name, owner=True)
+    memory.close()
+    _attached[name] = arena
+    return arena
+
+
+@atexit.register
+def _close_arenas():
+    for arena in list(_attached.values()):
+        arena.close()
+
+
+def _attach(name):
+    if name not in _attached:
+        _attached[name] = SharedOrdinalArena(name)
+    return _attached[name]
+
+
+def _share_results(ordinals):
+    """
+    Return the name of a new block of shared memory holding a table of
+    the ordinals, or the list of ordinals itself if a coefficient is too
+    large to be stored in a table.
+
+    """
+    try:
+        data = encode_table(ordinals)
+    except OverflowError:
+        return ordinals
+    memory = _create(data)
+    memory.close()
+    return memory.name
+
+
+def _read_results(results):
+    """
+    Return the list of ordinals returned by _share_results(), freeing
+    the shared memory holding them.
+
+    """
+    if not isinstance(results, str):
+        return results
+    memory = SharedMemory(results)
+    table = OrdinalTable(memory.buf)
+    ordinals = list(table)
+    table.release()
+    memory.close()
+    memory.unlink()
+    return ordinals
+
+
+def _factors_chunk(name, handles):
+    arena = _attach(name)
+    counts, flat = [], []
+    for handle in handles:
+        factors_ = factors(arena[handle])
+        counts.append(len(factors_))
+        for factor in factors_:
+            flat.extend(factor)
+    return counts, _share_results(flat)
+
+
+def _arithmetic_chunk(op, name, pairs):
+    arena = _attach(name)
+    return _share_results([op(arena[a], arena[b]) for a, b in pairs])
+
+
+def _chunks(items, chunksize):
+    items = list(items)
+    return [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def _map(function, arena, chunks, processes, *args):
+    names = [arena.name] * len(chunks)
+    if processes == 1:
+        return list(map(function, *args, names, chunks))
+    with ProcessPoolExecutor(processes) as executor:
+        return list(executor.map(function, *args, names, chunks))
+
+
+def factors_many(arena, handles=None, processes=None, chunksize=1000):
+    """
+    Return the factors of the ordinals in the arena with the handles
+    (by default, all of them), computed in chunks by a pool of processes.
+
+    Each worker reads the ordinals from the arena and writes the factors
+    of its chunk to a new table in shared memory, so neither the
+    arguments nor the results are pickled. If processes is 1 the factors
+    are computed in the current process.
+
+    """
+    if handles is None:
+        handles = range(len(arena))
+
+    results = []
+    for counts, flat in _map(_factors_chunk, arena, _chunks(handles, chunksize), processes):
+        flat = _read_results(flat)
+        start = 0
+        for count in counts:
+            stop = start + 2 * count
+            results.append(OrdinalFactors.unchecked(list(zip(flat[start:stop:2], flat[start + 1:stop:2]))))
+            start = stop
+    return results
+
+
+def arithmetic_many(op, arena, pairs, processes=None, chunksize=1000):
+    """
+    Return op(a, b) for each pair of handles (a, b) of ordinals in the
+    arena, where op is a picklable function such as operator.mul,
+    computed in chunks by a pool of processes.
+
+    The results of each chunk are written to a new table in shared
+    memory, unless a coefficient is too large to be stored in a table.
+    If processes is 1 the results are computed in the current process.
+
+    """
+    chunks = _chunks(pairs, chunksize)
+    ops = [op] * len(chunks)
+    return [a for results in _map(_arithmetic_chunk, arena, chunks, processes, ops) for a in _read_results(results)]
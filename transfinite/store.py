@@ -0,0 +1,230 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+from transfinite.ordinal import Ordinal, cnf_terms, order_key
+
+MAGIC = b"TRNSFNT1"
+ENDIAN_MARKER = 0x0102030405060708
+HEADER = struct.Struct("=8sQQQQ")
+
+
+def encode_table(ordinals):
+    """
+    Return the bytes of a columnar table storing the ordinals.
+
+    All the distinct ordinals in the collection, including every exponent
+    at every level of nesting, are interned as nodes. Node 0 is the
+    ordinal 0. Node i has the terms offsets[i] to offsets[i + 1] - 1, and
+    term t is w**(node exponents[t]) * coefficients[t], with a finite
+    ordinal being a single term with exponent node 0.
+
+    The nodes are also sorted: ranks[i] is the position of node i in
+    increasing order and order[p] is the node at position p. Since every
+    ordinal is interned, nodes are equal exactly when their indexes are,
+    and compare in the same way as their ranks. The collection itself is
+    the column of node indexes records.
+
+    The table is a header followed by the columns as arrays of unsigned
+    64-bit integers in native byte order, so coefficients must be less
+    than 2**64.
+
+    """
+    nodes = {0: 0}
+    values = [0]
+    offsets = array("Q", [0, 0])
+    exponents = array("Q")
+    coefficients = array("Q")
+
+    def intern(a):
+        if a in nodes:
+            return nodes[a]
+        terms = [(intern(exponent), copies) for exponent, copies in cnf_terms(a)]
+        for exponent, copies in terms:
+            exponents.append(exponent)
+            coefficients.append(copies)
+        offsets.append(len(exponents))
+        nodes[a] = len(values)
+        values.append(a)
+        return nodes[a]
+
+    records = array("Q", (intern(a) for a in ordinals))
+
+    order = array("Q", sorted(range(len(values)), key=lambda i: order_key(values[i])))
+    ranks = array("Q", bytes(8 * len(values)))
+    for position, node in enumerate(order):
+        ranks[node] = position
+
+    header = HEADER.pack(MAGIC, ENDIAN_MARKER, len(values), len(exponents), len(records))
+    columns = [offsets, exponents, coefficients, ranks, order, records]
+    return header + b"".join(column.tobytes() for column in columns)
+
+
+class OrdinalTable:  # pylint: disable=too-many-instance-attributes
+    """
+    A read-only collection of ordinals backed by a buffer in the format
+    written by encode_table().
+
+    The columns are memoryviews of the buffer, so opening a table does
+    no work proportional to its size. Scans such as limits() and
+    select() are evaluated on the integer columns, and Ordinal objects
+    are only built when an element is accessed. Nodes built this way are
+    cached, so shared exponents are built once. Slicing the table
+    returns a list of ordinals.
+
+    """
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer)
+        magic, marker, n_nodes, n_terms, n_records = HEADER.unpack_from(self._buffer)
+
+        if magic != MAGIC:
+            raise ValueError("Buffer does not contain an ordinal table")
+
+        if marker != ENDIAN_MARKER:
+            raise ValueError("Ordinal table was written with a different byte order")
+
+        sizes = [n_nodes + 1, n_terms, n_terms, n_nodes, n_nodes, n_records]
+        starts = accumulate([HEADER.size] + [8 * size for size in sizes])
+
+        self.offsets, self.exponents, self.coefficients, self.ranks, self.order, self.records = (
+            self._buffer[start:start + 8 * size].cast("Q") for start, size in zip(starts, sizes)
+        )
+        self._nodes = {0: 0}
+
+    def release(self):
+        """
+        Release the views of the underlying buffer.
+
+        """
+        for column in (self.offsets, self.exponents, self.coefficients, self.ranks, self.order, self.records):
+            column.release()
+        self._buffer.release()
+
+    def node(self, index):
+        """
+        Return the ordinal stored at the node index.
+
+        """
+        if index in self._nodes:
+            return self._nodes[index]
+
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        ordinal = 0
+
+        for t in range(stop - 1, start - 1, -1):
+            exponent, copies = self.exponents[t], self.coefficients[t]
+            if exponent == 0:
+                ordinal = copies
+            else:
+                ordinal = Ordinal(self.node(exponent), copies, ordinal)
+
+        self._nodes[index] = ordinal
+        return ordinal
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.node(node) for node in self.records[index]]
+        return self.node(self.records[index])
+
+    def __iter__(self):
+        return (self.node(node) for node in self.records)
+
+    def _position(self, a):
+        """
+        Return a key comparing with 2*rank + 1 of each node as the
+        ordinal a compares with that node.
+
+        """
+        key = order_key(a)
+        keys = _OrderKeys(self)
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            return 2 * position + 1
+        return 2 * position
+
+    def limits(self):
+        """
+        Yield the indexes of the stored limit ordinals.
+
+        """
+        offsets, exponents = self.offsets, self.exponents
+        for i, node in enumerate(self.records):
+            stop = offsets[node + 1]
+            if stop > offsets[node] and exponents[stop - 1] != 0:
+                yield i
+
+    def select(self, op, a):
+        """
+        Yield the indexes i of the stored ordinals x with op(x, a) true,
+        where op is a comparison from the operator module.
+
+        """
+        position = self._position(a)
+        ranks = self.ranks
+        for i, node in enumerate(self.records):
+            if op(2 * ranks[node] + 1, position):
+                yield i
+
+    def select_leading_exponent(self, op, a):
+        """
+        Yield the indexes i of the stored nonzero ordinals whose leading
+        exponent x has op(x, a) true.
+
+        """
+        position = self._position(a)
+        offsets, exponents, ranks = self.offsets, self.exponents, self.ranks
+        for i, node in enumerate(self.records):
+            start = offsets[node]
+            if start < offsets[node + 1] and op(2 * ranks[exponents[start]] + 1, position):
+                yield i
+
+
+class _OrderKeys:
+    """
+    Sequence of the order keys of the nodes in increasing order, built
+    on access, for bisecting.
+
+    """
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self):
+        return len(self._table.order)
+
+    def __getitem__(self, position):
+        return order_key(self._table.node(self._table.order[position]))
+
+
+def write_store(path, ordinals):
+    """
+    Write the ordinals to a file as a table.
+
+    """
+    with open(path, "wb") as f:
+        f.write(encode_table(ordinals))
+
+
+class OrdinalStore(OrdinalTable):
+    """
+    An ordinal table in a file, memory-mapped rather than read.
+
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        super().__init__(self._mmap)
+
+    def close(self):
+        self.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
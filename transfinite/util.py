@@ -1,6 +1,10 @@
 from itertools import groupby
+from math import log10
 from operator import itemgetter
 
+# Limits on what is rendered when an ordinal is displayed in Jupyter
+display_options = {"max_terms": 20, "max_depth": 5, "max_digits": 50, "max_counted": 10_000}
+
 def is_finite_ordinal(n):
     """
     Return True if n is a finite ordinal (non-negative int).
@@ -9,35 +13,202 @@ def is_finite_ordinal(n):
     return isinstance(n, int) and n >= 0
 
 
-def exp_by_squaring(x, n):
+def iter_str(ordinal, cache=False):
     """
-    Compute x**n using exponentiation by squaring.
+    Lazily yield the pieces of the string of the ordinal, so that the
+    string of a huge ordinal can be written out without building it.
+
+    The terms are written in one pass along the chain of addends. An
+    exponent whose string is already cached is written from the cache.
+    If cache is True, the strings of exponents are computed with str(),
+    which caches them for every ordinal sharing that exponent.
 
     """
-    if n == 0:
-        return 1
-    if n == 1:
-        return x
-    if n % 2 == 0:
-        return exp_by_squaring(x * x, n // 2)
-    return exp_by_squaring(x * x, (n - 1) // 2) * x
+    a = ordinal
+
+    while not isinstance(a, int):
+
+        string = a.cached("str")
+        if string is not None:
+            yield string
+            return
+
+        yield "w"
+
+        exponent = a.exponent
+
+        # Only use parentheses for exponent if finite and greater than 1,
+        # or its addend is nonzero or its copies is greater than 1.
+
+        if exponent == 1:
+            pass
+
+        elif isinstance(exponent, int) or exponent.copies == 1 and exponent.addend == 0:
+            yield "**"
+            yield from _iter_exponent(exponent, iter_str, str, cache)
+
+        else:
+            yield "**("
+            yield from _iter_exponent(exponent, iter_str, str, cache)
+            yield ")"
+
+        if a.copies != 1:
+            yield f"*{a.copies}"
+
+        a = a.addend
+
+        if a != 0:
+            yield " + "
+
+    if a != 0 or ordinal == 0:
+        yield str(a)
+
+
+def iter_latex(ordinal, cache=False):
+    """
+    Lazily yield the pieces of the LaTeX string of the ordinal, in the
+    same way as iter_str().
+
+    """
+    a = ordinal
+
+    while not isinstance(a, int):
+
+        latex = a.cached("latex")
+        if latex is not None:
+            yield latex
+            return
+
+        yield r"\omega"
+
+        if a.exponent != 1:
+            yield "^{"
+            yield from _iter_exponent(a.exponent, iter_latex, as_latex, cache)
+            yield "}"
+
+        if a.copies != 1:
+            yield rf"\cdot{a.copies}"
+
+        a = a.addend
+
+        if a != 0:
+            yield "+"
+
+    if a != 0 or ordinal == 0:
+        yield str(a)
+
+
+def _iter_exponent(exponent, iter_pieces, render, cache):
+    if cache or isinstance(exponent, int):
+        yield render(exponent)
+    else:
+        yield from iter_pieces(exponent)
 
 
 def as_latex(ordinal):
     """
     Convert the Ordinal object to a LaTeX string.
 
+    The string is cached on the ordinal (see Ordinal.cached()).
+
     """
     if isinstance(ordinal, int):
         return str(ordinal)
-    term = r"\omega"
-    if ordinal.exponent != 1:
-        term += f"^{{{as_latex(ordinal.exponent)}}}"
-    if ordinal.copies != 1:
-        term += rf"\cdot{as_latex(ordinal.copies)}"
-    if ordinal.addend != 0:
-        term += f"+{as_latex(ordinal.addend)}"
-    return term
+    return ordinal.cached("latex", lambda a: "".join(iter_latex(a, cache=True)))
+
+
+def truncated_latex(ordinal, max_terms=None, max_depth=None, max_digits=None):
+    """
+    Return a LaTeX string of the ordinal with at most max_terms terms
+    in all, counting the terms of its exponents, exponents nested at
+    most max_depth deep and integers of at most max_digits digits.
+    Anything beyond these limits is replaced by an ellipsis (with the
+    number of omitted terms, counted up to display_options["max_counted"]
+    unless the size of the ordinal is already known), so the time taken
+    depends on the limits rather than on the size of the ordinal.
+
+    Limits that are not given are taken from util.display_options.
+
+    """
+    if max_terms is None:
+        max_terms = display_options["max_terms"]
+    if max_depth is None:
+        max_depth = display_options["max_depth"]
+    if max_digits is None:
+        max_digits = display_options["max_digits"]
+    latex, _ = _truncated_latex(ordinal, max_terms, max_depth, max_digits)
+    return latex
+
+
+def _truncated_integer(n, max_digits):
+    # the number of digits is estimated from the bit length, since
+    # converting a huge integer to a string is itself slow
+    digits = int(n.bit_length() * log10(2)) + 1
+    if digits <= max_digits:
+        return str(n)
+    return rf"\underbrace{{\ldots}}_{{\approx {digits:,}\text{{ digits}}}}"
+
+
+def _truncated_latex(ordinal, max_terms, max_depth, max_digits):
+    # Return the LaTeX and the number of terms left of max_terms. The
+    # terms of the exponents are taken from the same count, so the
+    # length of the string is bounded however wide and deep the ordinal
+    if isinstance(ordinal, int):
+        return _truncated_integer(ordinal, max_digits), max_terms
+
+    if max_depth == 0:
+        return r"\ldots", max_terms
+
+    pieces = []
+    a = ordinal
+
+    while a != 0 and max_terms > 0:
+        max_terms -= 1
+        if isinstance(a, int):
+            pieces.append(_truncated_integer(a, max_digits))
+            a = 0
+            continue
+        term = r"\omega"
+        if a.exponent != 1:
+            exponent, max_terms = _truncated_latex(a.exponent, max_terms, max_depth - 1, max_digits)
+            term += f"^{{{exponent}}}"
+        if a.copies != 1:
+            term += rf"\cdot{_truncated_integer(a.copies, max_digits)}"
+        pieces.append(term)
+        a = a.addend
+
+    if a != 0:
+        remaining, capped = _count_terms(a)
+        plural = "term" if remaining == 1 and not capped else "terms"
+        pieces.append(rf"\ldots\text{{ ({remaining:,}{'+' if capped else ''} more {plural})}}")
+
+    return "+".join(pieces), max_terms
+
+
+def _count_terms(a):
+    # Return the number of terms of a and whether counting stopped at
+    # max_counted. The terms are walked unless the size of a is already
+    # cached, so that the count never takes longer than the limit
+    limit = display_options["max_counted"]
+    count = 0
+    while a != 0 and count < limit:
+        if isinstance(a, int):
+            return count + 1, False
+        if a.cached("size") is not None:
+            return count + a.size.terms, False
+        count += 1
+        a = a.addend
+    return count, a != 0
+
+
+def write_ordinal(ordinal, file, latex=False):
+    """
+    Write the string (or LaTeX string) of the ordinal to the file
+    object in pieces, without building the whole string in memory.
+
+    """
+    for piece in (iter_latex if latex else iter_str)(ordinal):
+        file.write(piece)
 
 
 def multiply_factors(factors):